@@ -10,6 +10,7 @@ Uses vision capabilities to detect:
 """
 
 import base64
+import mimetypes
 import os
 import json
 from pathlib import Path
@@ -85,8 +86,11 @@ class VisualQARules(BaseRule):
             # Determine if mobile or desktop
             is_mobile = "mobile" in screenshot_path.lower()
 
+            # Screenshots may be JPEG or PNG depending on screenshot_format
+            media_type = mimetypes.guess_type(screenshot_path)[0] or "image/png"
+
             # Create analysis prompt and call API
-            analysis = self._call_vision_api(image_data, is_mobile)
+            analysis = self._call_vision_api(image_data, is_mobile, media_type)
 
             # Parse findings from analysis
             self._parse_visual_findings(analysis, screenshot_path, page_url)
@@ -99,7 +103,7 @@ class VisualQARules(BaseRule):
         with open(image_path, "rb") as f:
             return base64.b64encode(f.read()).decode("utf-8")
 
-    def _call_vision_api(self, image_data: str, is_mobile: bool) -> str:
+    def _call_vision_api(self, image_data: str, is_mobile: bool, media_type: str = "image/png") -> str:
         """Call vision API for analysis."""
         device_context = "mobile device (390x844 viewport)" if is_mobile else "desktop (1440x900 viewport)"
 
@@ -159,11 +163,11 @@ If the page looks well-designed with no significant issues, return an empty arra
         provider = os.getenv("AI_PROVIDER", "anthropic").lower()
 
         if provider == "openai":
-            return self._call_openai_vision(image_data, prompt)
+            return self._call_openai_vision(image_data, prompt, media_type)
         else:
-            return self._call_anthropic_vision(image_data, prompt)
+            return self._call_anthropic_vision(image_data, prompt, media_type)
 
-    def _call_openai_vision(self, image_data: str, prompt: str) -> str:
+    def _call_openai_vision(self, image_data: str, prompt: str, media_type: str = "image/png") -> str:
         """Call OpenAI GPT-4 Vision."""
         try:
             from openai import OpenAI
@@ -183,7 +187,7 @@ If the page looks well-designed with no significant issues, return an empty arra
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{image_data}"
+                                "url": f"data:{media_type};base64,{image_data}"
                             }
                         }
                     ]
@@ -194,7 +198,7 @@ If the page looks well-designed with no significant issues, return an empty arra
 
         return response.choices[0].message.content or "[]"
 
-    def _call_anthropic_vision(self, image_data: str, prompt: str) -> str:
+    def _call_anthropic_vision(self, image_data: str, prompt: str, media_type: str = "image/png") -> str:
         """Call Anthropic Claude Vision."""
         try:
             import anthropic
@@ -215,7 +219,7 @@ If the page looks well-designed with no significant issues, return an empty arra
                             "type": "image",
                             "source": {
                                 "type": "base64",
-                                "media_type": "image/png",
+                                "media_type": media_type,
                                 "data": image_data,
                             }
                         },
@@ -39,6 +39,9 @@ def run(
     auto_detect: bool = typer.Option(
         False, "--auto-detect", help="Auto-detect business type"
     ),
+    narrative_cache: bool = typer.Option(
+        True, "--narrative-cache/--no-narrative-cache", help="Reuse the narrative for identical findings"
+    ),
 ):
     """
     Run a full website audit.
@@ -76,6 +79,7 @@ def run(
         generate_concept=concept,
         competitor_urls=competitors.split(",") if competitors else [],
         auto_detect_business=auto_detect,
+        narrative_cache=narrative_cache,
     )
 
     runner = AuditRunner(config)
@@ -280,9 +284,20 @@ def discover_features(
         proofkit discover-features https://example.com --output ./qa_tests
     """
     import asyncio
-    from proofkit.intelligent_qa.feature_discovery import FeatureDiscovery, discover_features as discover
+    from proofkit.intelligent_qa.feature_discovery import (
+        FeatureDiscovery,
+        discover_features as discover,
+        shutdown_browser_pool,
+    )
     from proofkit.intelligent_qa.test_generator import TestGenerator
 
+    async def discover_once():
+        # Nothing else in this process reuses the pooled browser
+        try:
+            return await discover(url)
+        finally:
+            await shutdown_browser_pool()
+
     console.print(f"[cyan]Discovering features on {url}...[/cyan]")
 
     with Progress(
@@ -293,7 +308,7 @@ def discover_features(
         task = progress.add_task("[cyan]Scanning page...", total=None)
 
         try:
-            features = asyncio.run(discover(url))
+            features = asyncio.run(discover_once())
         except Exception as e:
             console.print(f"[red]Discovery failed: {e}[/red]")
             raise typer.Exit(1)
@@ -1,8 +1,10 @@
 """Collector module for ProofKit - data collection from websites."""
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 from datetime import datetime
 
 from proofkit.schemas.audit import AuditMode
@@ -34,6 +36,10 @@ class Collector:
         self.stack_detector = StackDetector()
         self.business_detector = BusinessDetector()
 
+        stack_categories = [c.strip() for c in self.config.stack_categories.split(",") if c.strip()]
+        if stack_categories:
+            self.stack_detector.configure(stack_categories)
+
     def collect(
         self,
         url: str,
@@ -68,32 +74,109 @@ class Collector:
             pages = [url]
             errors.append(f"Page discovery failed: {e}")
 
-        # Run Playwright collector
-        try:
-            snapshot = self.playwright.collect(url, pages, output_dir)
-            logger.info(f"Playwright collected {len(snapshot.pages)} pages")
-        except Exception as e:
-            logger.error(f"Playwright collection failed: {e}")
-            snapshot = SnapshotData(url=url)
-            errors.append(f"Playwright failed: {e}")
+        # Playwright, Lighthouse and the HTTP probe are independent and
+        # I/O-bound, so they run side by side; errors keep this order
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            snapshot_future = pool.submit(self._collect_snapshot, url, pages, output_dir)
+            lighthouse_future = pool.submit(self._collect_lighthouse, url, output_dir)
+            http_probe_future = pool.submit(self._collect_http_probe, url)
+
+        return self._finish_collection(
+            url,
+            mode_str,
+            pages,
+            snapshot_future.result(),
+            lighthouse_future.result(),
+            http_probe_future.result(),
+            errors,
+            output_dir,
+        )
 
-        # Run Lighthouse collector
-        try:
-            lighthouse = self.lighthouse.collect(url, output_dir)
-            logger.info("Lighthouse audit complete")
-        except Exception as e:
-            logger.error(f"Lighthouse collection failed: {e}")
-            lighthouse = LighthouseData(url=url)
-            errors.append(f"Lighthouse failed: {e}")
+    async def collect_async(
+        self,
+        url: str,
+        mode: AuditMode,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> RawData:
+        """
+        Collect all raw data for a URL on the running event loop.
+
+        Same as collect(), but Playwright and Lighthouse run as coroutines
+        on the caller's loop instead of each starting their own.
+
+        Args:
+            url: Target URL to audit
+            mode: fast (homepage + key pages) or full (crawl)
+            output_dir: Where to save raw data and screenshots
+            progress_callback: Optional callback with the fraction collected
+                (0-1), called as page discovery and each collector finish
+
+        Returns:
+            RawData containing all collected information
+        """
+        logger.info(f"Starting collection for {url} in {mode.value if hasattr(mode, 'value') else mode} mode")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        done = 0
+
+        def step():
+            # Page discovery plus three collectors, reported as each finishes
+            nonlocal done
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done / 4)
+
+        async def tracked(awaitable):
+            result = await awaitable
+            step()
+            return result
+
+        errors = []
+        mode_str = mode.value if hasattr(mode, 'value') else str(mode)
 
-        # Run HTTP probe
         try:
-            http_probe = self.http_probe.collect(url)
-            logger.info("HTTP probe complete")
+            pages = await self._get_pages_to_audit_async(url, mode)
+            logger.info(f"Pages to audit: {len(pages)}")
         except Exception as e:
-            logger.error(f"HTTP probe failed: {e}")
-            http_probe = HttpProbeData(url=url, final_url=url)
-            errors.append(f"HTTP probe failed: {e}")
+            logger.error(f"Failed to discover pages: {e}")
+            pages = [url]
+            errors.append(f"Page discovery failed: {e}")
+        step()
+
+        snapshot, lighthouse, http_probe = await asyncio.gather(
+            tracked(self._collect_snapshot_async(url, pages, output_dir)),
+            tracked(self._collect_lighthouse_async(url, output_dir)),
+            tracked(asyncio.to_thread(self._collect_http_probe, url)),
+        )
+        return await asyncio.to_thread(
+            self._finish_collection,
+            url,
+            mode_str,
+            pages,
+            snapshot,
+            lighthouse,
+            http_probe,
+            errors,
+            output_dir,
+        )
+
+    def _finish_collection(
+        self,
+        url: str,
+        mode_str: str,
+        pages: List[str],
+        snapshot_result: Tuple[SnapshotData, Optional[str]],
+        lighthouse_result: Tuple[LighthouseData, Optional[str]],
+        http_probe_result: Tuple[HttpProbeData, Optional[str]],
+        errors: List[str],
+        output_dir: Path,
+    ) -> RawData:
+        """Run stack and business detection, then assemble and save RawData."""
+        snapshot, snapshot_error = snapshot_result
+        lighthouse, lighthouse_error = lighthouse_result
+        http_probe, http_probe_error = http_probe_result
+        errors.extend(e for e in (snapshot_error, lighthouse_error, http_probe_error) if e)
 
         # Run stack detection
         try:
@@ -134,6 +217,67 @@ class Collector:
 
         return raw_data
 
+    def _collect_snapshot(
+        self, url: str, pages: List[str], output_dir: Path
+    ) -> Tuple[SnapshotData, Optional[str]]:
+        """Run the Playwright collector, returning an empty snapshot and error on failure."""
+        try:
+            snapshot = self.playwright.collect(url, pages, output_dir)
+            logger.info(f"Playwright collected {len(snapshot.pages)} pages")
+            return snapshot, None
+        except Exception as e:
+            logger.error(f"Playwright collection failed: {e}")
+            return SnapshotData(url=url), f"Playwright failed: {e}"
+
+    def _collect_lighthouse(self, url: str, output_dir: Path) -> Tuple[LighthouseData, Optional[str]]:
+        """Run Lighthouse, returning empty data and error on failure."""
+        try:
+            lighthouse = self.lighthouse.collect(url, output_dir)
+            logger.info("Lighthouse audit complete")
+            return lighthouse, None
+        except Exception as e:
+            logger.error(f"Lighthouse collection failed: {e}")
+            return LighthouseData(url=url), f"Lighthouse failed: {e}"
+        finally:
+            # Don't keep the audit's headless Chromes running after collection
+            self.lighthouse.close()
+
+    def _collect_http_probe(self, url: str) -> Tuple[HttpProbeData, Optional[str]]:
+        """Run the HTTP probe, returning empty data and error on failure."""
+        try:
+            http_probe = self.http_probe.collect(url)
+            logger.info("HTTP probe complete")
+            return http_probe, None
+        except Exception as e:
+            logger.error(f"HTTP probe failed: {e}")
+            return HttpProbeData(url=url, final_url=url), f"HTTP probe failed: {e}"
+
+    async def _collect_snapshot_async(
+        self, url: str, pages: List[str], output_dir: Path
+    ) -> Tuple[SnapshotData, Optional[str]]:
+        """Async _collect_snapshot, on the caller's event loop."""
+        try:
+            snapshot = await self.playwright.collect_async(url, pages, output_dir)
+            logger.info(f"Playwright collected {len(snapshot.pages)} pages")
+            return snapshot, None
+        except Exception as e:
+            logger.error(f"Playwright collection failed: {e}")
+            return SnapshotData(url=url), f"Playwright failed: {e}"
+
+    async def _collect_lighthouse_async(
+        self, url: str, output_dir: Path
+    ) -> Tuple[LighthouseData, Optional[str]]:
+        """Async _collect_lighthouse, on the caller's event loop."""
+        try:
+            lighthouse = await self.lighthouse.collect_async(url, output_dir)
+            logger.info("Lighthouse audit complete")
+            return lighthouse, None
+        except Exception as e:
+            logger.error(f"Lighthouse collection failed: {e}")
+            return LighthouseData(url=url), f"Lighthouse failed: {e}"
+        finally:
+            self.lighthouse.close()
+
     def collect_single(
         self,
         url: str,
@@ -170,6 +314,8 @@ class Collector:
                 lighthouse = self.lighthouse.collect(url, output_dir)
             except Exception as e:
                 errors.append(f"Lighthouse: {e}")
+            finally:
+                self.lighthouse.close()
 
         if "http" in collectors:
             try:
@@ -201,6 +347,14 @@ class Collector:
             max_pages = self.config.max_pages_full
             return self.playwright.crawl_site(url, max_pages=max_pages)
 
+    async def _get_pages_to_audit_async(self, url: str, mode: AuditMode) -> List[str]:
+        """Async _get_pages_to_audit."""
+        mode_str = mode.value if hasattr(mode, 'value') else str(mode)
+
+        if mode_str == "fast":
+            return await self.playwright.discover_key_pages_async(url, max_pages=self.config.max_pages_fast)
+        return await self.playwright.crawl_site_async(url, max_pages=self.config.max_pages_full)
+
     def _save_raw_data(self, data: RawData, output_dir: Path) -> None:
         """Save collected data to JSON files."""
         # Save complete raw data
@@ -213,7 +367,11 @@ class Collector:
             data.snapshot.model_dump_json(indent=2)
         )
 
-        if data.lighthouse.mobile or data.lighthouse.desktop:
+        has_lighthouse = (
+            data.lighthouse.mobile_scores.performance is not None
+            or data.lighthouse.desktop_scores.performance is not None
+        )
+        if has_lighthouse:
             (output_dir / "lighthouse_summary.json").write_text(
                 json.dumps({
                     "mobile_scores": data.lighthouse.mobile_scores.model_dump(),
@@ -9,6 +9,10 @@ from proofkit.schemas.business import BusinessType
 from .models import SnapshotData, BusinessSignals
 
 
+# Debug check that helpers get pre-lowercased bytes; scans without copying
+_ASCII_UPPER = re.compile(rb"[A-Z]")
+
+
 class BusinessDetector:
     """Detect business type from page content using keyword analysis."""
 
@@ -169,6 +173,23 @@ class BusinessDetector:
         "low": 1,
     }
 
+    # Word-boundary patterns for each keyword, pre-encoded to match lowercased bytes.
+    # Compiled case-sensitive: detect() and detect_from_text() lowercase the
+    # text once through _to_lower_bytes and hand the same bytes to every helper.
+    KEYWORD_PATTERNS = {
+        business_type: {
+            weight_level: [
+                (
+                    keyword,
+                    re.compile(rb"\b" + re.escape(keyword.encode("utf-8")) + rb"\b"),
+                )
+                for keyword in keywords
+            ]
+            for weight_level, keywords in keywords_by_weight.items()
+        }
+        for business_type, keywords_by_weight in BUSINESS_KEYWORDS.items()
+    }
+
     def detect(self, snapshot: SnapshotData) -> BusinessSignals:
         """
         Detect business type from snapshot data.
@@ -231,8 +252,7 @@ class BusinessDetector:
         Returns:
             Tuple of (business_type, confidence)
         """
-        text_lower = text.lower()
-        scores = self._calculate_scores(text_lower)
+        scores = self._calculate_scores(self._to_lower_bytes(text))
 
         if not scores:
             return None, 0.0
@@ -246,8 +266,8 @@ class BusinessDetector:
 
         return best_type.value, round(confidence, 2)
 
-    def _extract_text_content(self, snapshot: SnapshotData) -> str:
-        """Extract all text content from snapshot."""
+    def _extract_text_content(self, snapshot: SnapshotData) -> bytes:
+        """Extract all text content from snapshot as lowercased UTF-8 bytes."""
         text_parts = []
 
         for page in snapshot.pages:
@@ -272,21 +292,32 @@ class BusinessDetector:
             if page.meta_tags.get("description"):
                 text_parts.append(page.meta_tags["description"])
 
-        return " ".join(text_parts).lower()
+        return self._to_lower_bytes(" ".join(text_parts))
 
-    def _calculate_scores(self, text: str) -> Dict[BusinessType, float]:
-        """Calculate scores for each business type."""
+    @staticmethod
+    def _to_lower_bytes(text: str) -> bytes:
+        """
+        Normalize text to lowercased bytes for keyword matching.
+
+        Keywords are ASCII, so bytes.lower() (a 256-entry table) is enough
+        and avoids the full Unicode case mapping of str.lower().
+        """
+        return text.encode("utf-8", "ignore").lower()
+
+    def _calculate_scores(self, blob: bytes) -> Dict[BusinessType, float]:
+        """Calculate scores for each business type from lowercased bytes."""
+        assert not _ASCII_UPPER.search(blob), "expected _to_lower_bytes() output"
         scores = {}
 
-        for business_type, keywords_by_weight in self.BUSINESS_KEYWORDS.items():
+        for business_type, patterns_by_weight in self.KEYWORD_PATTERNS.items():
             score = 0
 
-            for weight_level, keywords in keywords_by_weight.items():
+            for weight_level, patterns in patterns_by_weight.items():
                 weight = self.WEIGHTS[weight_level]
 
-                for keyword in keywords:
+                for _, pattern in patterns:
                     # Count occurrences
-                    count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
+                    count = len(pattern.findall(blob))
                     if count > 0:
                         # Diminishing returns for repeated keywords
                         score += weight * min(count, 3)
@@ -296,14 +327,15 @@ class BusinessDetector:
 
         return scores
 
-    def _get_keyword_matches(self, text: str, business_type: BusinessType) -> List[str]:
-        """Get list of matched keywords for a business type."""
+    def _get_keyword_matches(self, blob: bytes, business_type: BusinessType) -> List[str]:
+        """Get list of matched keywords for a business type from lowercased bytes."""
+        assert not _ASCII_UPPER.search(blob), "expected _to_lower_bytes() output"
         matches = []
-        keywords_by_weight = self.BUSINESS_KEYWORDS.get(business_type, {})
+        patterns_by_weight = self.KEYWORD_PATTERNS.get(business_type, {})
 
-        for weight_level, keywords in keywords_by_weight.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE):
+        for weight_level, patterns in patterns_by_weight.items():
+            for keyword, pattern in patterns:
+                if pattern.search(blob):
                     matches.append(keyword)
 
         return matches[:20]  # Limit
@@ -340,8 +372,9 @@ class BusinessDetector:
 
         return list(set(found_features))
 
-    def _get_industry_signals(self, text: str) -> List[str]:
-        """Get general industry signals from text."""
+    def _get_industry_signals(self, blob: bytes) -> List[str]:
+        """Get general industry signals from lowercased bytes."""
+        assert not _ASCII_UPPER.search(blob), "expected _to_lower_bytes() output"
         signals = []
 
         industry_keywords = {
@@ -355,7 +388,7 @@ class BusinessDetector:
 
         for signal, keywords in industry_keywords.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword.encode("utf-8") in blob:
                     signals.append(signal)
                     break
 
@@ -1,13 +1,31 @@
 """Lighthouse performance audit collector."""
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import multiprocessing
+import multiprocessing.util
+import os
+import re
 import subprocess
 import json
 import shutil
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
+from typing import Optional, Dict, Any, ClassVar, Iterator, List, Set, Tuple, Union
 
+import httpx
+
+from proofkit.utils.config import get_config
 from proofkit.utils.logger import logger
 from proofkit.utils.exceptions import LighthouseError
+from proofkit.utils import json_utils
 
 from .models import (
     LighthouseData,
@@ -17,11 +35,73 @@ from .models import (
 )
 
 
+# Sentinel for "not searched yet", distinct from a cached negative result (None)
+_UNSET: Any = object()
+
+
+# CoreWebVitals field -> Lighthouse audit providing its numericValue
+_CWV_KEYS = (
+    ("lcp", "largest-contentful-paint"),
+    ("fid", "max-potential-fid"),
+    ("cls", "cumulative-layout-shift"),
+    ("inp", "experimental-interaction-to-next-paint"),
+    ("ttfb", "server-response-time"),
+    ("tbt", "total-blocking-time"),
+    ("fcp", "first-contentful-paint"),
+    ("si", "speed-index"),
+)
+
+
+# Add-half-and-truncate avoids the overhead of round() on every metric. It is
+# only valid for non-negative values, which all Lighthouse metrics are. Exact
+# halves round up (0.125 -> 0.13), where round() rounds them to even (0.12).
+def _round1(value: float) -> float:
+    """Round a non-negative value to one decimal place, halves up."""
+    return int(value * 10 + 0.5) / 10
+
+
+def _round2(value: float) -> float:
+    """Round a non-negative value to two decimal places, halves up."""
+    return int(value * 100 + 0.5) / 100
+
+
+@functools.lru_cache(maxsize=1)
+def _lighthouse_cli_path() -> Optional[str]:
+    """Locate the Lighthouse CLI once per process."""
+    return shutil.which("lighthouse")
+
+
+@functools.lru_cache(maxsize=1)
+def _lighthouse_version() -> str:
+    """Installed Lighthouse CLI version, queried once per process."""
+    try:
+        result = subprocess.run(
+            ["lighthouse", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return result.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def _playwright_chromium_path() -> Optional[str]:
+    """Locate Playwright's bundled Chromium, importing the driver only once."""
+    try:
+        from playwright._impl._driver import compute_driver_executable
+        pw_dir = Path(compute_driver_executable()).parent.parent
+        return str(pw_dir / "chromium-" / "chrome-linux" / "chrome")
+    except Exception:
+        return None
+
+
 class LighthouseCollector:
     """Lighthouse performance audit collector using CLI."""
 
     # Opportunity audit IDs to extract
-    OPPORTUNITY_AUDITS = [
+    OPPORTUNITY_AUDITS = frozenset({
         "render-blocking-resources",
         "unused-css-rules",
         "unused-javascript",
@@ -41,51 +121,181 @@ class LighthouseCollector:
         "unminified-css",
         "unminified-javascript",
         "legacy-javascript",
+    })
+
+    # Per-audit CLI timeout in seconds
+    AUDIT_TIMEOUT = 180
+
+    # Unscored audits whose output is never read; skipping them also skips
+    # gathering their artifacts (screenshots, treemap data)
+    SKIP_AUDITS = (
+        "full-page-screenshot",
+        "screenshot-thumbnails",
+        "final-screenshot",
+        "script-treemap-data",
+    )
+
+    # Upper bound on page load wait so pathological sites fail fast (ms)
+    MAX_WAIT_FOR_LOAD = 45000
+
+    # Flags for the headless Chrome instances Lighthouse attaches to
+    CHROME_FLAGS = [
+        "--headless=new",
+        "--no-sandbox",
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
     ]
 
-    def __init__(self):
-        self._lighthouse_available = None
-        self._chrome_path = None
+    # Seconds to wait for a launched Chrome to expose its DevTools endpoint
+    CHROME_STARTUP_TIMEOUT = 5.0
+
+    # Rough resident memory of one headless Chrome, used to bound collect_many (MB)
+    CHROME_MEMORY_MB = 500
+
+    # Chrome discovery result shared by all instances (None if nothing was found)
+    _chrome_path_cache: ClassVar[Any] = _UNSET
+
+    def __init__(self, save_reports: bool = True, cache_ttl: Optional[int] = None):
+        config = get_config()
+        # Archive the raw report JSON in the output directory after parsing
+        self.save_reports = save_reports
+        # Reports younger than cache_ttl seconds are reused instead of re-audited
+        self.cache_ttl = config.lighthouse_cache_ttl if cache_ttl is None else cache_ttl
+        self.cache_dir = config.output_dir / ".cache" / "lighthouse"
+        # One persistent Chrome per form factor: mode -> (process, port, user data dir)
+        self._chrome_instances: Dict[str, Tuple[subprocess.Popen, int, str]] = {}
+        self._chrome_lock = threading.Lock()
+        # Form factors whose Chrome has a fresh profile no audit has touched yet
+        self._fresh_profiles: Set[str] = set()
+
+    def __enter__(self) -> "LighthouseCollector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the Chrome instances launched by this collector, if any."""
+        with self._chrome_lock:
+            instances = list(self._chrome_instances.values())
+            self._chrome_instances.clear()
+
+        for proc, _, user_data_dir in instances:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
 
     def is_available(self) -> bool:
         """Check if Lighthouse CLI is available."""
-        if self._lighthouse_available is None:
-            self._lighthouse_available = shutil.which("lighthouse") is not None
-        return self._lighthouse_available
+        return _lighthouse_cli_path() is not None
 
     def _find_chrome(self) -> Optional[str]:
-        """Find Chrome/Chromium executable."""
-        if self._chrome_path:
-            return self._chrome_path
-
-        # Common Chrome/Chromium paths
-        chrome_paths = [
-            shutil.which("google-chrome"),
-            shutil.which("google-chrome-stable"),
-            shutil.which("chromium"),
-            shutil.which("chromium-browser"),
+        """Find Chrome/Chromium executable, searching at most once per process."""
+        cached = LighthouseCollector._chrome_path_cache
+        if cached is not _UNSET:
+            return cached
+
+        path = next((p for p in self._chrome_candidates() if p and Path(p).is_file()), None)
+        LighthouseCollector._chrome_path_cache = path
+        return path
+
+    @staticmethod
+    def _chrome_candidates() -> Iterator[Optional[str]]:
+        """Yield possible Chrome/Chromium paths, most likely first."""
+        for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+            yield shutil.which(name)
+
+        yield from (
             "/usr/bin/google-chrome",
             "/usr/bin/chromium",
             "/usr/bin/chromium-browser",
             "/snap/bin/chromium",
-        ]
+        )
 
-        # Try to find Playwright's bundled Chromium
-        try:
-            from playwright._impl._driver import compute_driver_executable
-            pw_dir = Path(compute_driver_executable()).parent.parent
-            pw_chrome = pw_dir / "chromium-" / "chrome-linux" / "chrome"
-            if pw_chrome.exists():
-                chrome_paths.append(str(pw_chrome))
-        except Exception:
-            pass
+        # Playwright's bundled Chromium
+        yield _playwright_chromium_path()
 
-        for path in chrome_paths:
-            if path and Path(path).exists():
-                self._chrome_path = path
-                return path
+    def _get_chrome_port(self, mode: str) -> Optional[int]:
+        """
+        Get the DevTools port of the persistent Chrome for a form factor.
 
-        return None
+        The browser is launched on first use and reused by every later audit
+        of the same form factor until close(), so only the first collect()
+        pays Chrome startup. Owners must call close() (or use the collector
+        as a context manager) or the browsers outlive the audit.
+
+        Args:
+            mode: "mobile" or "desktop"
+
+        Returns:
+            Remote debugging port, or None to let Lighthouse launch Chrome itself
+        """
+        with self._chrome_lock:
+            instance = self._chrome_instances.get(mode)
+            if instance and instance[0].poll() is None:
+                return instance[1]
+
+            chrome_path = self._find_chrome()
+            if not chrome_path:
+                return None
+
+            port = self._get_free_port()
+            user_data_dir = tempfile.mkdtemp(prefix=f"proofkit-lighthouse-{mode}-")
+            try:
+                proc = subprocess.Popen(
+                    [
+                        chrome_path,
+                        f"--remote-debugging-port={port}",
+                        f"--user-data-dir={user_data_dir}",
+                        *self.CHROME_FLAGS,
+                        "about:blank",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                logger.warning(f"Failed to launch Chrome for Lighthouse: {e}")
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                return None
+
+            if not self._wait_for_devtools(port):
+                logger.warning(f"Chrome for Lighthouse {mode} did not start, falling back to CLI launch")
+                proc.kill()
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                return None
+
+            self._chrome_instances[mode] = (proc, port, user_data_dir)
+            self._fresh_profiles.add(mode)
+            return port
+
+    def _take_fresh_profile(self, mode: str) -> bool:
+        """Return True once for each newly launched Chrome, marking it used."""
+        with self._chrome_lock:
+            if mode in self._fresh_profiles:
+                self._fresh_profiles.discard(mode)
+                return True
+            return False
+
+    @staticmethod
+    def _get_free_port() -> int:
+        """Ask the OS for an unused local TCP port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _wait_for_devtools(self, port: int) -> bool:
+        """Poll the DevTools version endpoint until Chrome is ready."""
+        deadline = time.monotonic() + self.CHROME_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                httpx.get(f"http://127.0.0.1:{port}/json/version", timeout=0.5)
+                return True
+            except httpx.HTTPError:
+                time.sleep(0.1)
+        return False
 
     def check_requirements(self) -> Dict[str, Any]:
         """Check if all requirements for Lighthouse are met."""
@@ -126,6 +336,25 @@ class LighthouseCollector:
         """
         Run Lighthouse audits for mobile and desktop.
 
+        Synchronous wrapper around collect_async() for callers without an
+        event loop.
+
+        Args:
+            url: Target URL to audit
+            output_dir: Directory to save Lighthouse reports
+
+        Returns:
+            LighthouseData with mobile and desktop results
+        """
+        return asyncio.run(self.collect_async(url, output_dir))
+
+    async def collect_async(self, url: str, output_dir: Path) -> LighthouseData:
+        """
+        Run Lighthouse audits for mobile and desktop concurrently.
+
+        Each audit has its own timeout, so a hanging form factor is killed
+        on its own and the other one's results are still returned.
+
         Args:
             url: Target URL to audit
             output_dir: Directory to save Lighthouse reports
@@ -139,18 +368,24 @@ class LighthouseCollector:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Run mobile audit
-        logger.info(f"Running Lighthouse mobile audit for {url}")
-        mobile_result = self._run_lighthouse(url, output_dir, "mobile")
+        # Each audit drives its own headless Chrome, so run both form factors at once
+        logger.info(f"Running Lighthouse mobile and desktop audits for {url}")
+        results = await asyncio.gather(
+            self._run_lighthouse(url, output_dir, "mobile"),
+            self._run_lighthouse(url, output_dir, "desktop"),
+            return_exceptions=True,
+        )
 
-        # Run desktop audit
-        logger.info(f"Running Lighthouse desktop audit for {url}")
-        desktop_result = self._run_lighthouse(url, output_dir, "desktop")
+        mobile_result, desktop_result = [
+            self._audit_result(mode, result)
+            for mode, result in zip(("mobile", "desktop"), results)
+        ]
 
+        # Only the extracted metrics are kept; the full reports stay on disk
         return LighthouseData(
             url=url,
-            mobile=mobile_result,
-            desktop=desktop_result,
+            mobile_report_path=self._archived_report_path(output_dir, "mobile", mobile_result),
+            desktop_report_path=self._archived_report_path(output_dir, "desktop", desktop_result),
             mobile_scores=self._extract_scores(mobile_result),
             desktop_scores=self._extract_scores(desktop_result),
             mobile_cwv=self._extract_cwv(mobile_result),
@@ -158,68 +393,308 @@ class LighthouseCollector:
             opportunities=self._extract_opportunities(mobile_result),
         )
 
-    def _run_lighthouse(
+    @staticmethod
+    def _audit_result(mode: str, result: Any) -> Any:
+        """Turn an exception returned by gather() into an empty result."""
+        if isinstance(result, BaseException):
+            logger.error(f"Lighthouse {mode} failed: {result}")
+            return {}
+        return result
+
+    def collect_many(
         self,
-        url: str,
+        urls: List[str],
         output_dir: Path,
-        mode: str,
-    ) -> Dict[str, Any]:
+        max_parallel: Optional[int] = None,
+    ) -> List[LighthouseData]:
         """
-        Run Lighthouse CLI and return JSON result.
+        Run mobile and desktop audits for many URLs on a pool of worker processes.
+
+        Every (url, form factor) pair is a separate task. Each worker keeps
+        its own collector, and so its own persistent Chrome, for its lifetime.
+        Reports for each URL are archived in their own subdirectory.
 
         Args:
-            url: Target URL
-            output_dir: Directory for output file
-            mode: "mobile" or "desktop"
+            urls: Target URLs to audit
+            output_dir: Directory to save Lighthouse reports
+            max_parallel: Worker processes; defaults to half the CPU cores,
+                capped by the memory available for Chrome instances
 
         Returns:
-            Parsed JSON result or empty dict on failure
+            LighthouseData for each URL, in the order given
         """
-        output_path = output_dir / f"lighthouse_{mode}.json"
+        if not self.is_available():
+            logger.warning("Lighthouse CLI not available, returning empty data")
+            return [LighthouseData(url=url) for url in urls]
+
+        if not urls:
+            return []
+
+        workers = max_parallel or self._default_parallelism()
+        url_dirs = {url: self._url_output_dir(output_dir, url) for url in urls}
+        for url_dir in url_dirs.values():
+            url_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Running Lighthouse for {len(urls)} URLs on {workers} workers")
+        # Spawn rather than fork: the parent may hold threads (asyncio.to_thread,
+        # logging) whose locks a forked child would inherit mid-acquire
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.save_reports, self.cache_ttl),
+        ) as executor:
+            futures = {
+                (url, mode): executor.submit(_audit_in_worker, url, url_dirs[url], mode)
+                for url in urls
+                for mode in ("mobile", "desktop")
+            }
+
+            results = []
+            for url in urls:
+                mobile = self._worker_result(url, "mobile", futures[(url, "mobile")])
+                desktop = self._worker_result(url, "desktop", futures[(url, "desktop")])
+                results.append(LighthouseData(
+                    url=url,
+                    mobile_report_path=mobile[0],
+                    desktop_report_path=desktop[0],
+                    mobile_scores=mobile[1],
+                    desktop_scores=desktop[1],
+                    mobile_cwv=mobile[2],
+                    desktop_cwv=desktop[2],
+                    opportunities=mobile[3],
+                ))
 
-        # Find Chrome path
-        chrome_path = self._find_chrome()
+        return results
+
+    def _worker_result(self, url: str, mode: str, future: Any) -> Tuple[Any, ...]:
+        """Result of a collect_many task, or empty metrics if the worker failed."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Lighthouse {mode} failed for {url}: {e}")
+            return None, self._extract_scores({}), self._extract_cwv({}), []
+
+    def _default_parallelism(self) -> int:
+        """
+        Half the CPU cores, but no more Chrome instances than memory allows.
+
+        Every worker runs both form factors and so keeps two persistent
+        Chromes, one per form factor.
+        """
+        workers = max(2, (os.cpu_count() or 2) // 2)
+        try:
+            memory_mb = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+        except (AttributeError, ValueError, OSError):
+            return workers
+        return max(1, min(workers, memory_mb // (2 * self.CHROME_MEMORY_MB)))
+
+    @staticmethod
+    def _url_output_dir(output_dir: Path, url: str) -> Path:
+        """Per-URL report directory, readable but unique per URL."""
+        parsed = urlparse(url)
+        slug = re.sub(r"[^A-Za-z0-9.-]+", "_", f"{parsed.netloc}{parsed.path}").strip("_")
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+        return output_dir / f"{slug[:60]}-{digest}"
+
+    def _archived_report_path(self, output_dir: Path, mode: str, result: Any) -> Optional[str]:
+        """Path of the report _run_lighthouse archived for mode, if any."""
+        if self.save_reports and result:
+            return str(self._report_path(output_dir, mode))
+        return None
+
+    @staticmethod
+    def load_report(path: Union[str, Path]) -> Any:
+        """
+        Load an archived Lighthouse report, e.g. LighthouseData.mobile_report_path.
+
+        The file is read as bytes and handed straight to the parser, with no
+        text-mode decode of the multi-megabyte report.
 
+        Args:
+            path: Path of the archived JSON report
+
+        Returns:
+            Lazily parsed report (see json_utils.loads_lazy)
+        """
+        return json_utils.loads_lazy(Path(path).read_bytes())
+
+    @staticmethod
+    def _report_path(output_dir: Path, mode: str) -> Path:
+        """Location of the archived JSON report for a form factor."""
+        return output_dir / f"lighthouse_{mode}.json"
+
+    def _archive_report(self, output_path: Path, report: bytes, mode: str) -> None:
+        """Write the raw report when save_reports is set; a failure only loses the archive."""
+        if not self.save_reports:
+            return
+        try:
+            output_path.write_bytes(report)
+        except OSError as e:
+            logger.warning(f"Failed to archive Lighthouse {mode} report: {e}")
+
+    def _cache_path(self, url: str, mode: str) -> Path:
+        """Cache file for a report of url, keyed by form factor and CLI version."""
+        key = f"{url}|{mode}|{_lighthouse_version()}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self, url: str, mode: str) -> Optional[bytes]:
+        """Return a cached report younger than cache_ttl, if there is one."""
+        if self.cache_ttl <= 0:
+            return None
+
+        cache_path = self._cache_path(url, mode)
+        try:
+            if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                return cache_path.read_bytes()
+        except OSError:
+            pass
+        return None
+
+    def _write_cache(self, url: str, mode: str, report: bytes) -> None:
+        """Store a report atomically so concurrent readers never see a partial file."""
+        if self.cache_ttl <= 0:
+            return
+
+        cache_path = self._cache_path(url, mode)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+                f.write(report)
+            os.replace(f.name, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache Lighthouse {mode} report: {e}")
+
+    def _trim_flags(self) -> List[str]:
+        """
+        CLI flags that drop work the collector never reads.
+
+        Passed as flags rather than a --config-path file because a custom
+        config replaces --preset=desktop instead of layering on top of it.
+        """
+        return [
+            f"--skip-audits={','.join(self.SKIP_AUDITS)}",
+            f"--max-wait-for-load={self.MAX_WAIT_FOR_LOAD}",
+        ]
+
+    def _build_command(self, url: str, mode: str) -> List[str]:
+        """
+        Build the Lighthouse CLI command for one form factor.
+
+        May launch the persistent Chrome for mode, so it blocks; call it
+        from a worker thread inside the event loop.
+        """
         cmd = [
             "lighthouse",
             url,
             "--output=json",
-            f"--output-path={output_path}",
-            "--chrome-flags=--headless --no-sandbox --disable-gpu --disable-dev-shm-usage",
+            "--output-path=stdout",
             "--quiet",
             "--only-categories=performance,accessibility,best-practices,seo",
+            *self._trim_flags(),
         ]
 
-        # Add Chrome path if found
-        if chrome_path:
-            cmd.append(f"--chrome-path={chrome_path}")
+        # Attach to this collector's persistent Chrome when one can be launched
+        port = self._get_chrome_port(mode)
+        if port:
+            cmd.append(f"--port={port}")
+            # An untouched profile has no cache or storage to clear. Later
+            # audits keep Lighthouse's reset so they still load cold.
+            if self._take_fresh_profile(mode):
+                cmd.append("--disable-storage-reset")
+        else:
+            cmd.append("--chrome-flags=--headless --no-sandbox --disable-gpu --disable-dev-shm-usage")
+            chrome_path = self._find_chrome()
+            if chrome_path:
+                cmd.append(f"--chrome-path={chrome_path}")
 
         if mode == "desktop":
             cmd.append("--preset=desktop")
 
+        return cmd
+
+    def _discard_chrome(self, mode: str) -> None:
+        """Kill the persistent Chrome for mode so the next audit starts a new one."""
+        with self._chrome_lock:
+            instance = self._chrome_instances.pop(mode, None)
+            self._fresh_profiles.discard(mode)
+
+        if instance:
+            proc, _, user_data_dir = instance
+            proc.kill()
+            proc.wait()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+
+    async def _run_lighthouse(
+        self,
+        url: str,
+        output_dir: Path,
+        mode: str,
+    ) -> Any:
+        """
+        Run Lighthouse CLI and return JSON result.
+
+        The report is streamed over stdout and parsed in memory; it is only
+        written to the output directory afterwards when save_reports is set.
+        On timeout the CLI is killed, along with the Chrome it was driving.
+        A cached report for the same URL and form factor skips the audit.
+
+        Args:
+            url: Target URL
+            output_dir: Directory for the archived report
+            mode: "mobile" or "desktop"
+
+        Returns:
+            Lazily parsed report (see json_utils.loads_lazy) or empty dict on failure
+        """
+        output_path = self._report_path(output_dir, mode)
+
+        # Off the event loop: the first lookup runs `lighthouse --version`
+        cached = await asyncio.to_thread(self._read_cache, url, mode)
+        if cached is not None:
+            try:
+                data = json_utils.loads_lazy(cached)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable cached Lighthouse {mode} report")
+            else:
+                self._archive_report(output_path, cached, mode)
+                logger.info(f"Using cached Lighthouse {mode} report for {url}")
+                return data
+
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=180,  # 3 minute timeout
+            cmd = await asyncio.to_thread(self._build_command, url, mode)
+
+            # Keep stdout as bytes so the parser skips a UTF-8 decode of the report
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=self.AUDIT_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                # A page that hung Lighthouse can leave Chrome wedged as well
+                await asyncio.to_thread(self._discard_chrome, mode)
+                logger.error(f"Lighthouse {mode} audit timed out")
+                return {}
 
-            if result.returncode != 0 and result.stderr:
-                logger.warning(f"Lighthouse {mode} warning: {result.stderr[:500]}")
+            if proc.returncode != 0 and stderr:
+                logger.warning(f"Lighthouse {mode} warning: {stderr.decode('utf-8', 'replace')[:500]}")
 
-            if output_path.exists():
-                with open(output_path, "r") as f:
-                    data = json.load(f)
-                logger.info(f"Lighthouse {mode} audit complete")
-                return data
-            else:
-                logger.error(f"Lighthouse output not found: {output_path}")
+            if not stdout:
+                logger.error(f"Lighthouse {mode} produced no output")
                 return {}
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"Lighthouse {mode} audit timed out")
-            return {}
+            data = json_utils.loads_lazy(stdout)
+            self._archive_report(output_path, stdout, mode)
+            self._write_cache(url, mode, stdout)
+            logger.info(f"Lighthouse {mode} audit complete")
+            return data
+
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Lighthouse output: {e}")
             return {}
@@ -227,7 +702,7 @@ class LighthouseCollector:
             logger.error(f"Lighthouse {mode} failed: {e}")
             return {}
 
-    def _extract_scores(self, result: Dict[str, Any]) -> LighthouseScores:
+    def _extract_scores(self, result: Any) -> LighthouseScores:
         """Extract category scores from Lighthouse result."""
         categories = result.get("categories", {})
 
@@ -235,45 +710,44 @@ class LighthouseCollector:
             cat = categories.get(cat_id, {})
             score = cat.get("score")
             if score is not None:
-                return round(score * 100, 1)
+                return _round1(score * 100)
             return None
 
-        return LighthouseScores(
+        # Values come straight from Lighthouse JSON and already match the
+        # schema, so skip Pydantic validation
+        return LighthouseScores.model_construct(
             performance=get_score("performance"),
             accessibility=get_score("accessibility"),
             best_practices=get_score("best-practices"),
             seo=get_score("seo"),
         )
 
-    def _extract_cwv(self, result: Dict[str, Any]) -> CoreWebVitals:
+    def _extract_cwv(self, result: Any) -> CoreWebVitals:
         """Extract Core Web Vitals from Lighthouse result."""
         audits = result.get("audits", {})
 
-        def get_metric(key: str) -> Optional[float]:
-            audit = audits.get(key, {})
-            value = audit.get("numericValue")
-            if value is not None:
-                return round(value, 2)
-            return None
+        values = {}
+        for attr, audit_id in _CWV_KEYS:
+            value = audits.get(audit_id, {}).get("numericValue")
+            values[attr] = _round2(value) if value is not None else None
 
-        return CoreWebVitals(
-            lcp=get_metric("largest-contentful-paint"),
-            fid=get_metric("max-potential-fid"),
-            cls=get_metric("cumulative-layout-shift"),
-            inp=get_metric("experimental-interaction-to-next-paint"),
-            ttfb=get_metric("server-response-time"),
-            tbt=get_metric("total-blocking-time"),
-            fcp=get_metric("first-contentful-paint"),
-            si=get_metric("speed-index"),
-        )
+        # model_validate rather than model_construct: the "cls" field collides
+        # with the cls parameter of model_construct()
+        return CoreWebVitals.model_validate(values)
 
-    def _extract_opportunities(self, result: Dict[str, Any]) -> List[LighthouseOpportunity]:
+    def _extract_opportunities(self, result: Any) -> List[LighthouseOpportunity]:
         """Extract optimization opportunities from Lighthouse result."""
-        opportunities = []
+        # (savings sort key, tie-breaker, opportunity); the key is built once from
+        # the normalized values so ranking compares plain numbers
+        decorated = []
         audits = result.get("audits", {})
 
-        for audit_id in self.OPPORTUNITY_AUDITS:
-            audit = audits.get(audit_id, {})
+        # Single pass over the report's audit IDs; only matching audits are read
+        for audit_id in audits:
+            if audit_id not in self.OPPORTUNITY_AUDITS:
+                continue
+
+            audit = audits[audit_id]
             score = audit.get("score")
 
             # Only include if there's room for improvement
@@ -283,24 +757,26 @@ class LighthouseCollector:
                 # Get savings
                 savings_ms = details.get("overallSavingsMs")
                 savings_bytes = details.get("overallSavingsBytes")
+                # Whole milliseconds, halves up like _round1/_round2
+                savings_ms = float(int(savings_ms + 0.5)) if savings_ms else None
+                savings_bytes = int(savings_bytes) if savings_bytes else None
 
-                opportunities.append(LighthouseOpportunity(
+                opportunity = LighthouseOpportunity.model_construct(
                     id=audit_id,
                     title=audit.get("title", audit_id),
                     description=audit.get("description", ""),
-                    score=round(score * 100, 1) if score else None,
-                    savings_ms=round(savings_ms, 0) if savings_ms else None,
-                    savings_bytes=int(savings_bytes) if savings_bytes else None,
+                    score=_round1(score * 100) if score else None,
+                    savings_ms=savings_ms,
+                    savings_bytes=savings_bytes,
                     display_value=audit.get("displayValue", ""),
-                ))
-
-        # Sort by potential savings (ms first, then bytes)
-        opportunities.sort(
-            key=lambda x: (x.savings_ms or 0, x.savings_bytes or 0),
-            reverse=True
-        )
+                )
+                # Negative position keeps report order among equal savings
+                decorated.append(
+                    ((savings_ms or 0.0, savings_bytes or 0), -len(decorated), opportunity)
+                )
 
-        return opportunities[:15]  # Top 15 opportunities
+        # Top 15 by potential savings (ms first, then bytes)
+        return [opportunity for _, _, opportunity in heapq.nlargest(15, decorated)]
 
     def collect_simple(self, url: str) -> Dict[str, Any]:
         """
@@ -325,24 +801,60 @@ class LighthouseCollector:
             "--chrome-flags=--headless --no-sandbox --disable-gpu",
             "--quiet",
             "--only-categories=performance",
+            *self._trim_flags(),
         ]
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=120,
             )
 
             if result.stdout:
-                data = json.loads(result.stdout)
+                # Only nine values are read, so look them up by pointer
+                # instead of materializing the report
+                data = json_utils.loads_lazy(result.stdout)
+                score = json_utils.get_pointer(data, "/categories/performance/score")
+                cwv = {}
+                for attr, audit_id in _CWV_KEYS:
+                    value = json_utils.get_pointer(data, f"/audits/{audit_id}/numericValue")
+                    cwv[attr] = _round2(value) if value is not None else None
                 return {
-                    "performance_score": self._extract_scores(data).performance,
-                    "cwv": self._extract_cwv(data).model_dump(),
+                    "performance_score": _round1(score * 100) if score is not None else None,
+                    "cwv": cwv,
                 }
 
         except Exception as e:
             logger.error(f"Simple Lighthouse audit failed: {e}")
 
         return {"error": "Audit failed"}
+
+
+# Collector owned by a collect_many worker process
+_worker_collector: Optional[LighthouseCollector] = None
+
+
+def _init_worker(save_reports: bool, cache_ttl: int) -> None:
+    """Create the collector a collect_many worker reuses for all its tasks."""
+    global _worker_collector
+    _worker_collector = LighthouseCollector(save_reports=save_reports, cache_ttl=cache_ttl)
+    # Pool workers skip atexit handlers, so close Chrome via multiprocessing's exit hook
+    multiprocessing.util.Finalize(_worker_collector, _worker_collector.close, exitpriority=10)
+
+
+def _audit_in_worker(url: str, output_dir: Path, mode: str) -> Tuple[Any, ...]:
+    """
+    Run one audit in a collect_many worker.
+
+    Lazily parsed reports cannot cross the process boundary, so the metrics
+    are extracted here and only the small models are sent back.
+    """
+    collector = _worker_collector
+    result = asyncio.run(collector._run_lighthouse(url, output_dir, mode))
+    return (
+        collector._archived_report_path(output_dir, mode, result),
+        collector._extract_scores(result),
+        collector._extract_cwv(result),
+        collector._extract_opportunities(result) if mode == "mobile" else [],
+    )
@@ -28,7 +28,7 @@ class FormInfo(BaseModel):
 
 class NavigationInfo(BaseModel):
     """Information about page navigation structure."""
-    links: List[Dict[str, str]] = []
+    links: List[Dict[str, str]] = Field(default_factory=list)
     has_hamburger: bool = False
     depth: int = 1
 
@@ -37,25 +37,25 @@ class PageSnapshot(BaseModel):
     """Snapshot data for a single page."""
     url: str
     title: str = ""
-    headings: Dict[str, List[str]] = {"h1": [], "h2": [], "h3": []}
-    ctas: List[CTAInfo] = []
-    mobile_ctas: List[CTAInfo] = []
-    forms: List[FormInfo] = []
+    headings: Dict[str, List[str]] = Field(default_factory=lambda: {"h1": [], "h2": [], "h3": []})
+    ctas: List[CTAInfo] = Field(default_factory=list)
+    mobile_ctas: List[CTAInfo] = Field(default_factory=list)
+    forms: List[FormInfo] = Field(default_factory=list)
     navigation: Optional[NavigationInfo] = None
-    whatsapp_links: List[Dict[str, Any]] = []
-    contact_info: Dict[str, Any] = {}
-    screenshots: List[str] = []
+    whatsapp_links: List[Dict[str, Any]] = Field(default_factory=list)
+    contact_info: Dict[str, Any] = Field(default_factory=dict)
+    screenshots: List[str] = Field(default_factory=list)
     hamburger_menu_works: Optional[bool] = None
-    console_errors: List[str] = []
+    console_errors: List[str] = Field(default_factory=list)
     html_content: Optional[str] = None
-    meta_tags: Dict[str, str] = {}
+    meta_tags: Dict[str, str] = Field(default_factory=dict)
 
 
 class SnapshotData(BaseModel):
     """Complete snapshot data from Playwright collector."""
     url: str
-    pages: List[PageSnapshot] = []
-    screenshots: List[str] = []
+    pages: List[PageSnapshot] = Field(default_factory=list)
+    screenshots: List[str] = Field(default_factory=list)
     total_ctas: int = 0
     total_forms: int = 0
 
@@ -71,6 +71,8 @@ class CoreWebVitals(BaseModel):
     fcp: Optional[float] = None  # First Contentful Paint (ms)
     si: Optional[float] = None   # Speed Index
 
+    model_config = {"frozen": True}
+
 
 class LighthouseScores(BaseModel):
     """Lighthouse category scores."""
@@ -79,6 +81,8 @@ class LighthouseScores(BaseModel):
     best_practices: Optional[float] = None
     seo: Optional[float] = None
 
+    model_config = {"frozen": True}
+
 
 class LighthouseOpportunity(BaseModel):
     """A Lighthouse optimization opportunity."""
@@ -90,28 +94,33 @@ class LighthouseOpportunity(BaseModel):
     savings_bytes: Optional[int] = None
     display_value: str = ""
 
+    model_config = {"frozen": True}
+
 
 class LighthouseData(BaseModel):
     """Complete Lighthouse audit data."""
     url: str
-    mobile: Dict[str, Any] = {}
-    desktop: Dict[str, Any] = {}
-    mobile_scores: LighthouseScores = LighthouseScores()
-    desktop_scores: LighthouseScores = LighthouseScores()
-    mobile_cwv: CoreWebVitals = CoreWebVitals()
-    desktop_cwv: CoreWebVitals = CoreWebVitals()
-    opportunities: List[LighthouseOpportunity] = []
+    # Archived full reports; load with LighthouseCollector.load_report()
+    mobile_report_path: Optional[str] = None
+    desktop_report_path: Optional[str] = None
+    mobile_scores: LighthouseScores = Field(default_factory=LighthouseScores)
+    desktop_scores: LighthouseScores = Field(default_factory=LighthouseScores)
+    mobile_cwv: CoreWebVitals = Field(default_factory=CoreWebVitals)
+    desktop_cwv: CoreWebVitals = Field(default_factory=CoreWebVitals)
+    opportunities: List[LighthouseOpportunity] = Field(default_factory=list)
 
 
 class SecurityHeaders(BaseModel):
     """Security header analysis results."""
-    present: Dict[str, str] = {}
-    missing: List[str] = []
+    present: Dict[str, str] = Field(default_factory=dict)
+    missing: List[str] = Field(default_factory=list)
     has_hsts: bool = False
     has_csp: bool = False
     has_xframe: bool = False
     score: float = 0
 
+    model_config = {"frozen": True}
+
 
 class SSLInfo(BaseModel):
     """SSL certificate information."""
@@ -122,17 +131,19 @@ class SSLInfo(BaseModel):
     error: Optional[str] = None
     days_until_expiry: Optional[int] = None
 
+    model_config = {"frozen": True}
+
 
 class HttpProbeData(BaseModel):
     """HTTP probe results."""
     url: str
     final_url: str = ""
     status_code: int = 0
-    redirect_chain: List[str] = []
+    redirect_chain: List[str] = Field(default_factory=list)
     redirect_count: int = 0
     response_time_ms: float = 0
-    headers: Dict[str, str] = {}
-    security_headers: SecurityHeaders = SecurityHeaders()
+    headers: Dict[str, str] = Field(default_factory=dict)
+    security_headers: SecurityHeaders = Field(default_factory=SecurityHeaders)
     ssl_info: Optional[SSLInfo] = None
     server: Optional[str] = None
     robots_txt: Optional[str] = None
@@ -145,31 +156,31 @@ class StackInfo(BaseModel):
     cms: Optional[str] = None  # WordPress, Shopify, etc.
     framework: Optional[str] = None  # React, Vue, Angular, etc.
     server: Optional[str] = None  # nginx, Apache, etc.
-    analytics: List[str] = []  # Google Analytics, etc.
-    tag_managers: List[str] = []  # GTM, etc.
+    analytics: List[str] = Field(default_factory=list)  # Google Analytics, etc.
+    tag_managers: List[str] = Field(default_factory=list)  # GTM, etc.
     cdn: Optional[str] = None  # Cloudflare, etc.
     ecommerce_platform: Optional[str] = None  # WooCommerce, Magento, etc.
-    other: List[str] = []  # Other detected technologies
+    other: List[str] = Field(default_factory=list)  # Other detected technologies
 
 
 class BusinessSignals(BaseModel):
     """Signals for business type detection."""
     detected_type: Optional[str] = None
     confidence: float = 0.0
-    keyword_matches: Dict[str, List[str]] = {}
-    feature_indicators: List[str] = []
-    industry_signals: List[str] = []
+    keyword_matches: Dict[str, List[str]] = Field(default_factory=dict)
+    feature_indicators: List[str] = Field(default_factory=list)
+    industry_signals: List[str] = Field(default_factory=list)
 
 
 class RawData(BaseModel):
     """Complete raw data from all collectors."""
     url: str
     mode: str  # "fast" or "full"
-    pages_audited: List[str] = []
-    snapshot: SnapshotData = SnapshotData(url="")
-    lighthouse: LighthouseData = LighthouseData(url="")
-    http_probe: HttpProbeData = HttpProbeData(url="", final_url="")
-    detected_stack: StackInfo = StackInfo()
-    business_signals: BusinessSignals = BusinessSignals()
+    pages_audited: List[str] = Field(default_factory=list)
+    snapshot: SnapshotData = Field(default_factory=lambda: SnapshotData(url=""))
+    lighthouse: LighthouseData = Field(default_factory=lambda: LighthouseData(url=""))
+    http_probe: HttpProbeData = Field(default_factory=lambda: HttpProbeData(url="", final_url=""))
+    detected_stack: StackInfo = Field(default_factory=StackInfo)
+    business_signals: BusinessSignals = Field(default_factory=BusinessSignals)
     collected_at: Optional[str] = None
-    collection_errors: List[str] = []
+    collection_errors: List[str] = Field(default_factory=list)
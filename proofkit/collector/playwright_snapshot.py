@@ -1,10 +1,19 @@
 """Playwright-based browser data collection."""
 
+import asyncio
+import hashlib
+import os
 import re
+import tempfile
+import time
+from collections import deque
+from itertools import chain, islice
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from urllib.parse import urlparse, urljoin
+from typing import List, Dict, Optional, Any, AsyncIterator, Tuple
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
 
+from proofkit.utils import json_utils
 from proofkit.utils.config import get_config
 from proofkit.utils.logger import logger
 from proofkit.utils.exceptions import PlaywrightError, PlaywrightTimeoutError
@@ -33,18 +42,403 @@ CTA_KEYWORDS = [
     "subscribe", "download", "learn more", "get started", "apply now",
 ]
 
+# Compiled once at import; CTA_RE keeps the substring semantics of CTA_KEYWORDS
+WHATSAPP_RE = re.compile("|".join(WHATSAPP_PATTERNS), re.IGNORECASE)
+CTA_RE = re.compile("|".join(map(re.escape, CTA_KEYWORDS)))
+# Starts and ends on a digit with a bounded middle, so runs of spaces or
+# punctuation are never reported and long digit ids are not split into hits
+PHONE_RE = re.compile(r"(?<!\d)\+?\d[\d\s().\-]{8,18}\d(?!\d)")
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# PHONE_RE and EMAIL_RE are also run in the browser by CONTACT_JS, so they
+# must stay valid JavaScript regex syntax too
+
+# Upper bound on the best-effort wait for "load" after DOMContentLoaded
+LOAD_GRACE_MS = 5000
+
+# Requests aborted while discovering/crawling, where nothing is rendered
+CRAWL_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+
+# Requests aborted while snapshotting: video/audio and pure telemetry. Tag
+# managers are left alone since they often inject chat and WhatsApp widgets.
+SNAPSHOT_BLOCKED_RESOURCES = {"media"}
+SNAPSHOT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "analytics.google.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "clarity.ms",
+    "mixpanel.com",
+    "segment.io",
+)
+
+# Maps every ASCII character except letters, digits, "-" and "_" to "_"
+_FILENAME_TABLE = str.maketrans({
+    chr(c): "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "-_")
+})
+
+# JPEG quality for screenshots; visually lossless for audits at a fraction
+# of the PNG size
+JPEG_QUALITY = 75
+
+DESKTOP_VIEWPORT = {"width": 1440, "height": 900}
+MOBILE_VIEWPORT = {"width": 390, "height": 844}
+
+NAV_SELECTORS = ["nav a", "header a", "[role='navigation'] a", ".nav a", ".navbar a"]
+
+HAMBURGER_SELECTORS = [
+    "[class*='hamburger']",
+    "[class*='mobile-menu']",
+    "[class*='menu-toggle']",
+    "button[aria-label*='menu']",
+    ".navbar-toggler",
+]
+
+MOBILE_NAV_SELECTOR = "nav, [role='navigation'], .nav-menu, .mobile-nav"
+
 PRIORITY_PAGES = [
     "contact", "about", "services", "products", "pricing", "property",
     "portfolio", "gallery", "menu", "rooms", "booking", "shop", "store",
 ]
 
+# Reads everything the snapshot needs from the DOM in one round-trip to the
+# browser. Anchors are walked once and sorted into CTA, WhatsApp and nav
+# candidates using CTA_RE/WHATSAPP_RE (passed in, so both must stay valid
+# JavaScript regexes); only the matching records come back.
+EXTRACT_JS = """
+({navSelectors, hamburgerSelectors, ctaPattern, whatsappPattern}) => {
+    const ctaRe = new RegExp(ctaPattern);
+    const whatsappRe = new RegExp(whatsappPattern, "i");
+    const text = (el) => (el.innerText || "").trim();
+    const record = (el, label) => {
+        const rect = el.getBoundingClientRect();
+        const hasBox = el.getClientRects().length > 0;
+        return {
+            text: label,
+            href: el.getAttribute("href") || "",
+            visible: hasBox && rect.width > 0 && rect.height > 0
+                && getComputedStyle(el).visibility !== "hidden",
+            above_fold: hasBox && rect.top < 900,
+            selector: el.tagName.toLowerCase()
+                + (el.id ? "#" + el.id : "")
+                + (el.className && typeof el.className === "string"
+                    ? "." + el.className.split(" ")[0] : ""),
+        };
+    };
+
+    const headings = {};
+    for (const level of ["h1", "h2", "h3"]) {
+        headings[level] = [...document.querySelectorAll(level)]
+            .map(text).filter(Boolean).slice(0, 10);
+    }
+
+    const meta = {};
+    for (const [key, selector, attr] of [
+        ["description", 'meta[name="description"]', "content"],
+        ["keywords", 'meta[name="keywords"]', "content"],
+        ["og:title", 'meta[property="og:title"]', "content"],
+        ["og:description", 'meta[property="og:description"]', "content"],
+        ["viewport", 'meta[name="viewport"]', "content"],
+        ["canonical", 'link[rel="canonical"]', "href"],
+    ]) {
+        const el = document.querySelector(selector);
+        const value = el && el.getAttribute(attr);
+        if (value) meta[key] = value;
+    }
+
+    const forms = [...document.querySelectorAll("form")].slice(0, 10).map((form) => {
+        const inputs = [...form.querySelectorAll("input, textarea, select")];
+        const attr = (el, name) => (el.getAttribute(name) || "");
+        const submit = form.querySelector("button[type='submit'], input[type='submit']");
+        return {
+            action: form.getAttribute("action"),
+            method: form.getAttribute("method"),
+            field_count: inputs.length,
+            required_count: inputs.filter((el) => el.hasAttribute("required")).length,
+            has_email: inputs.some((el) => attr(el, "type") === "email"
+                || attr(el, "name").toLowerCase().includes("email")),
+            has_phone: inputs.some((el) => {
+                const name = attr(el, "name").toLowerCase();
+                return attr(el, "type") === "tel" || name.includes("phone") || name.includes("mobile");
+            }),
+            submit_text: submit ? (text(submit) || submit.getAttribute("value")) : null,
+        };
+    });
+
+    const ctaLinks = [];
+    const whatsapp = [];
+    const navMatches = navSelectors.map(() => []);
+    document.querySelectorAll("a").forEach((a, index) => {
+        const label = text(a);
+        const href = a.getAttribute("href") || "";
+        const lower = label.toLowerCase();
+        if (index < 100 && ctaRe.test(lower)) ctaLinks.push(record(a, label));
+        if (whatsappRe.test(href) || lower.includes("whatsapp") || href.toLowerCase().includes("whatsapp")) {
+            whatsapp.push(record(a, label));
+        }
+        navSelectors.forEach((selector, n) => {
+            if (navMatches[n].length < 20 && a.matches(selector)) navMatches[n].push({text: label, href});
+        });
+    });
+
+    // Links from the first nav selector that yields any usable ones
+    let nav = [];
+    for (const matches of navMatches) {
+        nav = matches.filter((link) => link.text && link.href && link.text.length < 50);
+        if (nav.length) break;
+    }
+
+    const ctaButtons = [...document.querySelectorAll("button")].slice(0, 50)
+        .map((button) => record(button, text(button)))
+        .filter((button) => !button.text || ctaRe.test(button.text.toLowerCase()));
+
+    return {
+        title: document.title.trim(),
+        headings,
+        meta,
+        cta_links: ctaLinks,
+        cta_buttons: ctaButtons,
+        whatsapp,
+        forms,
+        nav,
+        has_hamburger: hamburgerSelectors.some((s) => document.querySelector(s) !== null),
+    };
+}
+"""
+
+CONTACT_JS = """
+([phonePattern, emailPattern]) => {
+    const html = document.documentElement.outerHTML;
+    const unique = (pattern) => [...new Set(html.match(new RegExp(pattern, "g")) || [])].slice(0, 5);
+    return {
+        phones: unique(phonePattern),
+        emails: unique(emailPattern),
+        has_tel_link: html.includes('href="tel:') || html.includes("href='tel:"),
+        has_mailto_link: html.includes('href="mailto:') || html.includes("href='mailto:"),
+    };
+}
+"""
+
+# Resolves every href with the browser's URL parser and keeps http(s) links
+# on the given host, dropping query strings and fragments
+SAME_HOST_LINKS_JS = """
+(els, host) => [...new Set(els.map((el) => {
+    try {
+        const u = new URL(el.getAttribute("href"), location.href);
+        const web = u.protocol === "http:" || u.protocol === "https:";
+        return web && u.host === host ? u.origin + u.pathname : null;
+    } catch (err) {
+        return null;
+    }
+}).filter(Boolean))]
+"""
+
+# Steps down one viewport per frame pair so IntersectionObserver-based lazy
+# loaders fire along the way, then returns to the top for the screenshot
+SCROLL_JS = """
+async (maxSteps) => {
+    const frame = () => new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    for (let i = 0; i < maxSteps; i++) {
+        const before = window.scrollY;
+        window.scrollBy(0, window.innerHeight);
+        await frame();
+        if (window.scrollY === before) break;
+    }
+    window.scrollTo(0, 0);
+    await frame();
+}
+"""
+
+# Returns the selectors whose first match is rendered and not hidden, the
+# same check as locator(selector).first.is_visible()
+VISIBLE_SELECTORS_JS = """
+(selectors) => selectors.filter((selector) => {
+    let el;
+    try {
+        el = document.querySelector(selector);
+    } catch (err) {
+        return false;
+    }
+    if (!el) return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+})
+"""
+
+_PERCENT_ESCAPE_RE = re.compile(r"%[0-9a-fA-F]{2}")
+
+
+def _canon(url: str) -> str:
+    """
+    Canonical crawl key for a URL.
+
+    Lowercases scheme and host, uppercases percent-escapes, drops the query
+    and fragment and strips trailing slashes.
+    """
+    parts = urlsplit(url)
+    path = _PERCENT_ESCAPE_RE.sub(lambda m: m.group(0).upper(), parts.path).rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+
+
+def _origin(url: str) -> str:
+    """Scheme and host of url, lowercased; the scope of saved browser state."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
 
 class PlaywrightCollector:
-    """Browser-based data collection using Playwright."""
+    """
+    Browser-based data collection using Playwright.
+
+    Use as an async context manager to share one browser, with long-lived
+    desktop and mobile contexts for snapshots and a lightweight context for
+    discovery and crawling, across several collect/discover/crawl calls.
+    Outside a context each call opens and closes its own browser.
+
+    Cookies and local storage picked up while discovering or crawling a
+    site are saved per origin under output_dir/.cache/playwright, and
+    preloaded for playwright_state_ttl seconds into the snapshot contexts of
+    later sessions on the same origin.
+    """
 
     def __init__(self):
         self.config = get_config()
         self.timeout = self.config.playwright_timeout
+        self.state_dir = self.config.output_dir / ".cache" / "playwright"
+        self._pw = None
+        self._browser = None
+        self._desktop_ctx = None
+        self._mobile_ctx = None
+        self._crawl_ctx = None
+        self._snapshot_origin: Optional[str] = None
+
+    async def __aenter__(self) -> "PlaywrightCollector":
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise PlaywrightError("Playwright not installed. Run: pip install playwright && playwright install")
+
+        self._pw = await async_playwright().start()
+        try:
+            self._browser = await self._pw.chromium.launch(headless=True)
+            self._crawl_ctx = await self._browser.new_context(viewport=DESKTOP_VIEWPORT)
+            await self._crawl_ctx.route("**/*", self._route_crawl)
+        except Exception:
+            await self.__aexit__(None, None, None)
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._browser:
+            await self._browser.close()
+        if self._pw:
+            await self._pw.stop()
+        self._pw = self._browser = None
+        self._desktop_ctx = self._mobile_ctx = self._crawl_ctx = None
+        self._snapshot_origin = None
+
+    def _state_path(self, origin: str) -> Path:
+        """Saved browser state file for an origin."""
+        key = hashlib.blake2b(origin.encode(), digest_size=16).hexdigest()
+        return self.state_dir / f"{key}.json"
+
+    def _load_state(self, origin: str) -> Optional[Dict[str, Any]]:
+        """Saved state for an origin if younger than playwright_state_ttl."""
+        ttl = self.config.playwright_state_ttl
+        if ttl <= 0:
+            return None
+        path = self._state_path(origin)
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            return json_utils.loads(path.read_bytes())
+        except OSError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable browser state {path}: {e}")
+            return None
+
+    async def _save_state(self, url: str) -> None:
+        """Persist the crawl context's cookies and storage for later snapshots of url's origin."""
+        if self.config.playwright_state_ttl <= 0:
+            return
+        path = self._state_path(_origin(url))
+        try:
+            state = await self._crawl_ctx.storage_state()
+            # Written atomically so concurrent audits never load a partial file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+                f.write(json_utils.dumps(state))
+            os.replace(f.name, path)
+        except Exception as e:
+            logger.warning(f"Failed to save browser state: {e}")
+
+    async def _snapshot_contexts(self, url: str) -> Tuple[Any, Any]:
+        """
+        Desktop and mobile contexts preloaded with the saved state of url's origin.
+
+        Created on first use and kept for further snapshots of that origin.
+        A saved state the browser rejects is dropped for a cold context.
+        """
+        origin = _origin(url)
+        if self._desktop_ctx is None or origin != self._snapshot_origin:
+            for ctx in (self._desktop_ctx, self._mobile_ctx):
+                if ctx is not None:
+                    await ctx.close()
+            self._desktop_ctx = self._mobile_ctx = None
+
+            state = self._load_state(origin)
+            try:
+                contexts = await self._new_snapshot_contexts(state)
+            except Exception as e:
+                if state is None:
+                    raise
+                logger.warning(f"Ignoring saved browser state for {origin}: {e}")
+                contexts = await self._new_snapshot_contexts(None)
+            self._desktop_ctx, self._mobile_ctx = contexts
+            self._snapshot_origin = origin
+        return self._desktop_ctx, self._mobile_ctx
+
+    async def _new_snapshot_contexts(self, state: Optional[Dict[str, Any]]) -> Tuple[Any, Any]:
+        """Open the routed desktop and mobile contexts, closing both if either fails."""
+        kwargs = {"storage_state": state} if state is not None else {}
+        contexts = []
+        try:
+            for viewport in (DESKTOP_VIEWPORT, MOBILE_VIEWPORT):
+                ctx = await self._browser.new_context(viewport=viewport, **kwargs)
+                contexts.append(ctx)
+                await ctx.route("**/*", self._route_snapshot)
+        except Exception:
+            for ctx in contexts:
+                await ctx.close()
+            raise
+        return contexts[0], contexts[1]
+
+    @staticmethod
+    async def _route_snapshot(route) -> None:
+        """Abort media and analytics requests that never affect a screenshot."""
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if request.resource_type in SNAPSHOT_BLOCKED_RESOURCES or host.endswith(SNAPSHOT_BLOCKED_DOMAINS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    async def _route_crawl(route) -> None:
+        """Only fetch documents and scripts while discovering links."""
+        if route.request.resource_type in CRAWL_BLOCKED_RESOURCES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator["PlaywrightCollector"]:
+        """Reuse the open browser, or open one for the duration of a single call."""
+        if self._browser:
+            yield self
+            return
+        async with self:
+            yield self
 
     def collect(
         self,
@@ -55,6 +449,9 @@ class PlaywrightCollector:
         """
         Collect DOM data and screenshots for specified pages.
 
+        Synchronous wrapper around collect_async() for callers without an
+        event loop.
+
         Args:
             url: Base URL being audited
             pages: List of page URLs to snapshot
@@ -63,35 +460,54 @@ class PlaywrightCollector:
         Returns:
             SnapshotData containing all collected information
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            raise PlaywrightError("Playwright not installed. Run: pip install playwright && playwright install")
+        return asyncio.run(self.collect_async(url, pages, output_dir))
+
+    async def collect_async(
+        self,
+        url: str,
+        pages: List[str],
+        output_dir: Path,
+    ) -> SnapshotData:
+        """
+        Collect DOM data and screenshots for specified pages concurrently.
+
+        Up to playwright_concurrency pages are snapshotted at once, each on
+        a desktop/mobile page pair reused from a pool, so navigation and
+        screenshots of one page overlap with the others.
 
-        page_snapshots = []
-        screenshots = []
+        Args:
+            url: Base URL being audited
+            pages: List of page URLs to snapshot
+            output_dir: Directory for screenshots
 
+        Returns:
+            SnapshotData containing all collected information
+        """
         screenshots_dir = output_dir / "screenshots"
         screenshots_dir.mkdir(parents=True, exist_ok=True)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
+        async with self._session():
+            desktop_ctx, mobile_ctx = await self._snapshot_contexts(url)
+            # Desktop/mobile page pairs reused across URLs; the pool size
+            # bounds how many pages are snapshotted at once
+            pool: asyncio.Queue = asyncio.Queue()
+            pairs = []
+            for _ in range(min(max(1, self.config.playwright_concurrency), len(pages))):
+                pair = (await desktop_ctx.new_page(), await mobile_ctx.new_page())
+                pairs.append(pair)
+                pool.put_nowait(pair)
 
-            for page_url in pages:
-                try:
-                    logger.info(f"Snapshotting {page_url}")
-                    snapshot = self._snapshot_page(browser, page_url, screenshots_dir)
-                    page_snapshots.append(snapshot)
-                    screenshots.extend(snapshot.screenshots)
-                except Exception as e:
-                    logger.warning(f"Failed to snapshot {page_url}: {e}")
-                    # Add minimal snapshot with error
-                    page_snapshots.append(PageSnapshot(
-                        url=page_url,
-                        console_errors=[str(e)],
-                    ))
+            try:
+                page_snapshots = await asyncio.gather(*(
+                    self._snapshot_page_pooled(pool, page_url, screenshots_dir)
+                    for page_url in pages
+                ))
+            finally:
+                for desktop_page, mobile_page in pairs:
+                    await desktop_page.close()
+                    await mobile_page.close()
 
-            browser.close()
+        screenshots = [path for snapshot in page_snapshots for path in snapshot.screenshots]
 
         return SnapshotData(
             url=url,
@@ -101,68 +517,57 @@ class PlaywrightCollector:
             total_forms=sum(len(p.forms) for p in page_snapshots),
         )
 
-    def _snapshot_page(
+    async def _snapshot_page_pooled(
         self,
-        browser,
-        url: str,
+        pool: asyncio.Queue,
+        page_url: str,
         output_dir: Path,
     ) -> PageSnapshot:
-        """Snapshot a single page with desktop and mobile viewports."""
-        console_errors = []
-
-        # Desktop viewport
-        desktop_page = browser.new_page(viewport={"width": 1440, "height": 900})
-
-        # Capture console errors
-        desktop_page.on("console", lambda msg: console_errors.append(msg.text) if msg.type == "error" else None)
-
+        """Snapshot one page on a pooled page pair, never raising."""
+        desktop_page, mobile_page = await pool.get()
         try:
-            desktop_page.goto(url, wait_until="networkidle", timeout=self.timeout)
+            logger.info("Snapshotting %s", page_url)
+            return await self._snapshot_page(desktop_page, mobile_page, page_url, output_dir)
         except Exception as e:
-            if "timeout" in str(e).lower():
-                raise PlaywrightTimeoutError(f"Page load timeout: {url}")
-            raise PlaywrightError(f"Failed to load page: {e}")
-
-        # Scroll to trigger lazy content
-        self._scroll_page(desktop_page)
-
-        # Extract data from desktop
-        title = self._get_title(desktop_page)
-        headings = self._get_headings(desktop_page)
-        meta_tags = self._get_meta_tags(desktop_page)
-        ctas = self._get_ctas(desktop_page)
-        forms = self._get_forms(desktop_page)
-        navigation = self._get_navigation(desktop_page)
-        whatsapp_links = self._get_whatsapp_links(desktop_page)
-        contact_info = self._get_contact_info(desktop_page)
-
-        # Take desktop screenshot
-        page_name = self._url_to_filename(url)
-        desktop_screenshot = output_dir / f"{page_name}_desktop.png"
-        desktop_page.screenshot(path=str(desktop_screenshot), full_page=True)
-
-        # Mobile viewport
-        mobile_page = browser.new_page(viewport={"width": 390, "height": 844})
-
-        try:
-            mobile_page.goto(url, wait_until="networkidle", timeout=self.timeout)
-            self._scroll_page(mobile_page)
+            logger.warning("Failed to snapshot %s: %s", page_url, e)
+            # Add minimal snapshot with error
+            return PageSnapshot(
+                url=page_url,
+                console_errors=[str(e)],
+            )
+        finally:
+            pool.put_nowait((desktop_page, mobile_page))
 
-            # Take mobile screenshot
-            mobile_screenshot = output_dir / f"{page_name}_mobile.png"
-            mobile_page.screenshot(path=str(mobile_screenshot), full_page=True)
+    async def _snapshot_page(
+        self,
+        desktop_page,
+        mobile_page,
+        url: str,
+        output_dir: Path,
+    ) -> PageSnapshot:
+        """Snapshot a single page, loading desktop and mobile viewports concurrently."""
+        page_name = self._url_to_filename(url)
+        extension = "png" if self.config.screenshot_format == "png" else "jpg"
+        desktop_screenshot = output_dir / f"{page_name}_desktop.{extension}"
+        mobile_screenshot = output_dir / f"{page_name}_mobile.{extension}"
+
+        # Wait for both viewports so neither is still using its page when the
+        # pair goes back to the pool; only a desktop failure fails the snapshot
+        desktop, mobile = await asyncio.gather(
+            self._snapshot_desktop(desktop_page, url, desktop_screenshot),
+            self._snapshot_mobile(mobile_page, url, mobile_screenshot),
+            return_exceptions=True,
+        )
+        if isinstance(desktop, BaseException):
+            raise desktop
 
-            # Mobile-specific data
-            mobile_ctas = self._get_ctas(mobile_page)
-            hamburger_works = self._test_hamburger_menu(mobile_page)
-        except Exception as e:
-            logger.warning(f"Mobile snapshot failed: {e}")
+        if isinstance(mobile, BaseException):
+            logger.warning("Mobile snapshot failed: %s", mobile)
             mobile_screenshot = None
             mobile_ctas = []
             hamburger_works = None
-
-        desktop_page.close()
-        mobile_page.close()
+        else:
+            mobile_ctas, hamburger_works = mobile
 
         screenshots = [str(desktop_screenshot)]
         if mobile_screenshot:
@@ -170,258 +575,174 @@ class PlaywrightCollector:
 
         return PageSnapshot(
             url=url,
-            title=title,
-            headings=headings,
-            meta_tags=meta_tags,
-            ctas=ctas,
             mobile_ctas=mobile_ctas,
-            forms=forms,
-            navigation=navigation,
-            whatsapp_links=whatsapp_links,
-            contact_info=contact_info,
             screenshots=screenshots,
             hamburger_menu_works=hamburger_works,
-            console_errors=console_errors[:10],  # Limit errors
+            **desktop,
         )
 
-    def _scroll_page(self, page, scrolls: int = 3):
-        """Scroll page to trigger lazy loading."""
-        for _ in range(scrolls):
-            page.mouse.wheel(0, 800)
-            page.wait_for_timeout(300)
-
-    def _get_title(self, page) -> str:
-        """Get page title."""
-        try:
-            return page.title().strip()
-        except Exception:
-            return ""
-
-    def _get_headings(self, page) -> Dict[str, List[str]]:
-        """Extract H1-H3 headings."""
-        headings = {"h1": [], "h2": [], "h3": []}
-
-        for level in ["h1", "h2", "h3"]:
-            try:
-                texts = page.locator(level).all_inner_texts()
-                headings[level] = [h.strip() for h in texts if h.strip()][:10]
-            except Exception:
-                continue
-
-        return headings
-
-    def _get_meta_tags(self, page) -> Dict[str, str]:
-        """Extract important meta tags."""
-        meta_tags = {}
-
-        try:
-            # Description
-            desc = page.locator('meta[name="description"]').get_attribute("content")
-            if desc:
-                meta_tags["description"] = desc
-
-            # Keywords
-            keywords = page.locator('meta[name="keywords"]').get_attribute("content")
-            if keywords:
-                meta_tags["keywords"] = keywords
-
-            # OG tags
-            og_title = page.locator('meta[property="og:title"]').get_attribute("content")
-            if og_title:
-                meta_tags["og:title"] = og_title
-
-            og_desc = page.locator('meta[property="og:description"]').get_attribute("content")
-            if og_desc:
-                meta_tags["og:description"] = og_desc
-
-            # Viewport
-            viewport = page.locator('meta[name="viewport"]').get_attribute("content")
-            if viewport:
-                meta_tags["viewport"] = viewport
-
-            # Canonical
-            canonical = page.locator('link[rel="canonical"]').get_attribute("href")
-            if canonical:
-                meta_tags["canonical"] = canonical
-
-        except Exception:
-            pass
+    async def _snapshot_desktop(self, page, url: str, screenshot_path: Path) -> Dict[str, Any]:
+        """Load the desktop viewport, extract page data and take its screenshot."""
+        console_errors = []
 
-        return meta_tags
+        # Capture console errors for this URL only; the page is reused afterwards
+        def on_console(msg) -> None:
+            if msg.type == "error":
+                console_errors.append(msg.text)
 
-    def _get_ctas(self, page) -> List[CTAInfo]:
-        """Extract CTA buttons and links."""
-        ctas = []
+        page.on("console", on_console)
 
-        # Check links
         try:
-            links = page.locator("a").all()
-            for link in links[:100]:  # Limit to avoid performance issues
-                try:
-                    text = (link.inner_text() or "").strip().lower()
-                    href = link.get_attribute("href") or ""
-
-                    if any(kw in text for kw in CTA_KEYWORDS):
-                        bbox = link.bounding_box()
-                        ctas.append(CTAInfo(
-                            text=text[:100],
-                            type="link",
-                            href=href[:500] if href else None,
-                            is_visible=link.is_visible(),
-                            is_above_fold=bbox["y"] < 900 if bbox else False,
-                            selector=self._get_selector(link),
-                        ))
-                except Exception:
-                    continue
-        except Exception:
-            pass
+            try:
+                await self._goto(page, url)
+            except Exception as e:
+                if "timeout" in str(e).lower():
+                    raise PlaywrightTimeoutError(f"Page load timeout: {url}")
+                raise PlaywrightError(f"Failed to load page: {e}")
+
+            # Scroll to trigger lazy content
+            await self._scroll_page(page)
+
+            data = await self._extract_page(page)
+            contact_info = await self._get_contact_info(page)
+
+            await self._screenshot(page, screenshot_path)
+        finally:
+            page.remove_listener("console", on_console)
+
+        return {
+            "title": data.get("title", ""),
+            "headings": self._parse_headings(data),
+            "meta_tags": data.get("meta", {}),
+            "ctas": self._parse_ctas(data),
+            "forms": self._parse_forms(data),
+            "navigation": self._parse_navigation(data),
+            "whatsapp_links": self._parse_whatsapp_links(data),
+            "contact_info": contact_info,
+            "console_errors": console_errors[:10],  # Limit errors
+        }
 
-        # Check buttons
+    async def _snapshot_mobile(
+        self,
+        page,
+        url: str,
+        screenshot_path: Path,
+    ) -> Tuple[List[CTAInfo], Optional[bool]]:
+        """Load the mobile viewport, take its screenshot and read mobile-specific data."""
+        await self._goto(page, url)
+        await self._scroll_page(page)
+
+        await self._screenshot(page, screenshot_path)
+
+        mobile_ctas = self._parse_ctas(await self._extract_page(page))
+        hamburger_works = await self._test_hamburger_menu(page)
+        return mobile_ctas, hamburger_works
+
+    async def _goto(self, page, url: str) -> None:
+        """Navigate without waiting for network idle unless configured to."""
+        wait_until = self.config.playwright_wait_until
+        await page.goto(url, wait_until=wait_until, timeout=self.timeout)
+
+        if wait_until == "domcontentloaded":
+            # Give the load event a short chance so images and fonts mostly
+            # render, without paying for sites that never settle
+            try:
+                await page.wait_for_load_state("load", timeout=min(self.timeout, LOAD_GRACE_MS))
+            except Exception:
+                pass
+
+    async def _screenshot(self, page, path: Path) -> None:
+        """Write a full-page screenshot in the configured format."""
+        if self.config.screenshot_format == "png":
+            options = {"type": "png"}
+        else:
+            options = {"type": "jpeg", "quality": JPEG_QUALITY}
+        # caret="initial" keeps the text caret as-is so repeated shots of an
+        # unchanged page stay byte-identical
+        await page.screenshot(path=str(path), full_page=True, caret="initial", **options)
+
+    async def _scroll_page(self, page, max_steps: int = 10):
+        """Scroll page to trigger lazy loading, in a single round-trip."""
+        await page.evaluate(SCROLL_JS, max_steps)
+
+    async def _extract_page(self, page) -> Dict[str, Any]:
+        """Read all DOM data for a page in a single evaluate round-trip."""
         try:
-            buttons = page.locator("button").all()
-            for button in buttons[:50]:
-                try:
-                    text = (button.inner_text() or "").strip().lower()
-
-                    if any(kw in text for kw in CTA_KEYWORDS) or not text:
-                        bbox = button.bounding_box()
-                        ctas.append(CTAInfo(
-                            text=text[:100] if text else "[button]",
-                            type="button",
-                            href=None,
-                            is_visible=button.is_visible(),
-                            is_above_fold=bbox["y"] < 900 if bbox else False,
-                            selector=self._get_selector(button),
-                        ))
-                except Exception:
-                    continue
-        except Exception:
-            pass
-
-        return ctas[:30]  # Limit to avoid huge lists
+            return await page.evaluate(EXTRACT_JS, {
+                "navSelectors": NAV_SELECTORS,
+                "hamburgerSelectors": HAMBURGER_SELECTORS,
+                "ctaPattern": CTA_RE.pattern,
+                "whatsappPattern": WHATSAPP_RE.pattern,
+            })
+        except Exception as e:
+            logger.warning("DOM extraction failed: %s", e)
+            return {}
 
-    def _get_whatsapp_links(self, page) -> List[Dict[str, Any]]:
-        """Find WhatsApp contact options."""
-        whatsapp_links = []
+    def _parse_headings(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Extract H1-H3 headings."""
+        headings = data.get("headings", {})
+        return {level: headings.get(level, []) for level in ["h1", "h2", "h3"]}
+
+    def _parse_ctas(self, data: Dict[str, Any]) -> List[CTAInfo]:
+        """Build CTA buttons and links from the keyword-matched records."""
+        records = chain(
+            (("link", link) for link in data.get("cta_links", [])),
+            (("button", button) for button in data.get("cta_buttons", [])),
+        )
 
-        try:
-            links = page.locator("a").all()
-            for link in links:
-                try:
-                    href = link.get_attribute("href") or ""
-                    text = (link.inner_text() or "").strip()
-
-                    is_whatsapp = (
-                        any(re.search(p, href, re.IGNORECASE) for p in WHATSAPP_PATTERNS)
-                        or "whatsapp" in text.lower()
-                        or "whatsapp" in href.lower()
-                    )
-
-                    if is_whatsapp:
-                        bbox = link.bounding_box()
-                        whatsapp_links.append({
-                            "text": text[:100],
-                            "href": href[:500],
-                            "is_visible": link.is_visible(),
-                            "is_above_fold": bbox["y"] < 900 if bbox else False,
-                        })
-                except Exception:
-                    continue
-        except Exception:
-            pass
+        # Records come from EXTRACT_JS with fixed field types, so skip Pydantic
+        # validation; only the 30 kept are built (limit to avoid huge lists)
+        return [
+            CTAInfo.model_construct(
+                text=record["text"].lower()[:100] or "[button]",
+                type=cta_type,
+                href=(record["href"][:500] or None) if cta_type == "link" else None,
+                is_visible=record["visible"],
+                is_above_fold=record["above_fold"],
+                selector=record["selector"],
+            )
+            for cta_type, record in islice(records, 30)
+        ]
 
-        return whatsapp_links[:10]
+    def _parse_whatsapp_links(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build WhatsApp contact options from the matched link records."""
+        return [
+            {
+                "text": link["text"][:100],
+                "href": link["href"][:500],
+                "is_visible": link["visible"],
+                "is_above_fold": link["above_fold"],
+            }
+            for link in data.get("whatsapp", [])[:10]
+        ]
 
-    def _get_forms(self, page) -> List[FormInfo]:
+    def _parse_forms(self, data: Dict[str, Any]) -> List[FormInfo]:
         """Analyze forms on the page."""
-        forms = []
-
-        try:
-            form_elements = page.locator("form").all()
-            for form in form_elements[:10]:
-                try:
-                    inputs = form.locator("input, textarea, select").all()
-                    required_count = 0
-                    has_email = False
-                    has_phone = False
-
-                    for inp in inputs:
-                        try:
-                            if inp.get_attribute("required") is not None:
-                                required_count += 1
-
-                            inp_type = inp.get_attribute("type") or ""
-                            inp_name = (inp.get_attribute("name") or "").lower()
-
-                            if inp_type == "email" or "email" in inp_name:
-                                has_email = True
-                            if inp_type == "tel" or "phone" in inp_name or "mobile" in inp_name:
-                                has_phone = True
-                        except Exception:
-                            continue
-
-                    forms.append(FormInfo(
-                        action=form.get_attribute("action"),
-                        method=(form.get_attribute("method") or "GET").upper(),
-                        field_count=len(inputs),
-                        required_count=required_count,
-                        has_email_field=has_email,
-                        has_phone_field=has_phone,
-                        submit_button_text=self._get_submit_button_text(form),
-                    ))
-                except Exception:
-                    continue
-        except Exception:
-            pass
-
-        return forms
+        # Same trusted EXTRACT_JS output as the CTAs; skip validation
+        return [
+            FormInfo.model_construct(
+                action=form["action"],
+                method=(form["method"] or "GET").upper(),
+                field_count=form["field_count"],
+                required_count=form["required_count"],
+                has_email_field=form["has_email"],
+                has_phone_field=form["has_phone"],
+                submit_button_text=(form["submit_text"] or "Submit").strip()[:50],
+            )
+            for form in data.get("forms", [])
+        ]
 
-    def _get_navigation(self, page) -> NavigationInfo:
+    def _parse_navigation(self, data: Dict[str, Any]) -> NavigationInfo:
         """Extract navigation structure."""
-        nav_links = []
-
-        # Try common nav selectors
-        for selector in ["nav a", "header a", "[role='navigation'] a", ".nav a", ".navbar a"]:
-            try:
-                links = page.locator(selector).all()
-                if links:
-                    for link in links[:20]:
-                        try:
-                            text = (link.inner_text() or "").strip()
-                            href = link.get_attribute("href") or ""
-                            if text and href and len(text) < 50:
-                                nav_links.append({"text": text, "href": href})
-                        except Exception:
-                            continue
-                    if nav_links:
-                        break
-            except Exception:
-                continue
-
-        # Check for hamburger menu
-        has_hamburger = False
-        try:
-            hamburger_selectors = [
-                "[class*='hamburger']",
-                "[class*='mobile-menu']",
-                "[class*='menu-toggle']",
-                "button[aria-label*='menu']",
-                ".navbar-toggler",
-            ]
-            for sel in hamburger_selectors:
-                if page.locator(sel).count() > 0:
-                    has_hamburger = True
-                    break
-        except Exception:
-            pass
+        nav_links = data.get("nav", [])
 
         return NavigationInfo(
             links=nav_links,
-            has_hamburger=has_hamburger,
+            has_hamburger=data.get("has_hamburger", False),
             depth=min(3, len(nav_links) // 5 + 1) if nav_links else 1,
         )
 
-    def _get_contact_info(self, page) -> Dict[str, Any]:
+    async def _get_contact_info(self, page) -> Dict[str, Any]:
         """Extract contact information."""
         contact = {
             "phones": [],
@@ -431,96 +752,60 @@ class PlaywrightCollector:
         }
 
         try:
-            html = page.content()
-
-            # Phone patterns (basic)
-            phone_pattern = r'(?:\+?[\d\s\-().]{10,20})'
-            phones = re.findall(phone_pattern, html)
-            contact["phones"] = list(set(p.strip() for p in phones if len(p.strip()) >= 10))[:5]
-
-            # Email patterns
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            emails = re.findall(email_pattern, html)
-            contact["emails"] = list(set(emails))[:5]
-
-            # Check for tel: and mailto: links
-            contact["has_tel_link"] = 'href="tel:' in html or "href='tel:" in html
-            contact["has_mailto_link"] = 'href="mailto:' in html or "href='mailto:" in html
-
+            # Scan the HTML in the page so only the matches cross the driver
+            contact.update(await page.evaluate(CONTACT_JS, [PHONE_RE.pattern, EMAIL_RE.pattern]))
         except Exception:
             pass
 
         return contact
 
-    def _test_hamburger_menu(self, page) -> Optional[bool]:
+    async def _test_hamburger_menu(self, page) -> Optional[bool]:
         """Test if hamburger menu works on mobile."""
-        hamburger_selectors = [
-            "[class*='hamburger']",
-            "[class*='mobile-menu']",
-            "[class*='menu-toggle']",
-            "button[aria-label*='menu']",
-            ".navbar-toggler",
-        ]
+        try:
+            # Check every candidate's visibility in one round-trip
+            visible = await page.evaluate(VISIBLE_SELECTORS_JS, HAMBURGER_SELECTORS)
+        except Exception:
+            return None
 
-        for sel in hamburger_selectors:
+        for sel in visible:
             try:
-                hamburger = page.locator(sel).first
-                if hamburger.is_visible():
-                    hamburger.click()
-                    page.wait_for_timeout(500)
-
-                    # Check if nav appeared
-                    nav_visible = page.locator("nav, [role='navigation'], .nav-menu, .mobile-nav").first.is_visible()
-                    return nav_visible
+                await page.locator(sel).first.click()
+                await page.wait_for_timeout(500)
+
+                # Check if nav appeared
+                return bool(await page.evaluate(VISIBLE_SELECTORS_JS, [MOBILE_NAV_SELECTOR]))
             except Exception:
                 continue
 
         return None
 
-    def _get_selector(self, element) -> str:
-        """Generate a selector for an element."""
-        try:
-            return element.evaluate(
-                "el => el.tagName.toLowerCase() + "
-                "(el.id ? '#' + el.id : '') + "
-                "(el.className && typeof el.className === 'string' ? '.' + el.className.split(' ')[0] : '')"
-            )
-        except Exception:
-            return ""
-
-    def _get_submit_button_text(self, form) -> str:
-        """Get text of form's submit button."""
-        try:
-            submit = form.locator("button[type='submit'], input[type='submit']").first
-            text = submit.inner_text() or submit.get_attribute("value") or "Submit"
-            return text.strip()[:50]
-        except Exception:
-            return "Submit"
-
     def _url_to_filename(self, url: str) -> str:
         """Convert URL to safe filename."""
-        # Remove protocol and clean
-        clean = url.split("//")[-1]
-        clean = re.sub(r'[^\w\-]', '_', clean)
-        return clean[:50]
+        # Remove protocol and clean; both steps map one character to one, so
+        # truncating first is safe
+        clean = url.split("//")[-1][:50]
+        return clean.encode("ascii", "replace").decode("ascii").translate(_FILENAME_TABLE)
 
     def discover_key_pages(self, url: str, max_pages: int = 5) -> List[str]:
         """Discover key pages from navigation."""
+        return asyncio.run(self.discover_key_pages_async(url, max_pages))
+
+    async def discover_key_pages_async(self, url: str, max_pages: int = 5) -> List[str]:
+        """Discover key pages from navigation (async version of discover_key_pages)."""
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.async_api  # noqa: F401
         except ImportError:
             return [url]
 
         pages = [url]
         base_domain = urlparse(url).netloc
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        async with self._session():
+            page = await self._crawl_ctx.new_page()
 
             try:
-                page.goto(url, wait_until="networkidle", timeout=self.timeout)
-                nav = self._get_navigation(page)
+                await self._goto(page, url)
+                nav = self._parse_navigation(await self._extract_page(page))
 
                 for link in nav.links:
                     if len(pages) >= max_pages:
@@ -542,62 +827,86 @@ class PlaywrightCollector:
                                 pages.append(href)
 
             except Exception as e:
-                logger.warning(f"Failed to discover pages: {e}")
+                logger.warning("Failed to discover pages: %s", e)
             finally:
-                browser.close()
+                await page.close()
+
+            await self._save_state(url)
 
         return pages
 
     def crawl_site(self, url: str, max_pages: int = 50) -> List[str]:
         """Full site crawl - discover all internal pages."""
+        return asyncio.run(self.crawl_site_async(url, max_pages))
+
+    async def crawl_site_async(self, url: str, max_pages: int = 50) -> List[str]:
+        """
+        Full site crawl (async version of crawl_site).
+
+        Breadth-first from url with up to playwright_concurrency pages
+        navigating at once, each worker draining a shared frontier.
+        """
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.async_api  # noqa: F401
         except ImportError:
             return [url]
 
-        visited = set()
-        to_visit = [url]
+        # Dedup on canonical keys so /about, /about/ and /%7euser vs /%7Euser
+        # are navigated once; URLs are queued as found, when first seen
+        seen = {_canon(url)}
+        frontier = deque([url])
         pages = []
-        base_domain = urlparse(url).netloc
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            while to_visit and len(pages) < max_pages:
-                current_url = to_visit.pop(0)
-
-                if current_url in visited:
-                    continue
-
-                visited.add(current_url)
+        base_domain = urlparse(url).netloc.lower()
+        in_flight = 0
+        changed = asyncio.Condition()
+
+        def can_claim() -> bool:
+            return bool(frontier) and len(pages) + in_flight < max_pages
+
+        async def crawl_worker(page) -> None:
+            nonlocal in_flight
+            while True:
+                async with changed:
+                    # Idle until there is a URL to take, or no running
+                    # navigation is left that could add one
+                    await changed.wait_for(lambda: can_claim() or not in_flight)
+                    if not can_claim():
+                        return
+
+                    current_url = frontier.popleft()
+                    in_flight += 1
 
                 try:
-                    page.goto(current_url, wait_until="networkidle", timeout=self.timeout)
+                    await self._goto(page, current_url)
                     pages.append(current_url)
 
-                    # Find all links
-                    links = page.locator("a").all()
-                    for link in links:
-                        try:
-                            href = link.get_attribute("href") or ""
-
-                            if href.startswith("/"):
-                                href = urljoin(current_url, href)
-
-                            if href.startswith("http"):
-                                link_domain = urlparse(href).netloc
-                                if link_domain == base_domain and href not in visited:
-                                    # Skip anchors, query params variations
-                                    clean_href = href.split("#")[0].split("?")[0]
-                                    if clean_href not in visited:
-                                        to_visit.append(clean_href)
-                        except Exception:
-                            continue
+                    # Links come back resolved, same-host and without
+                    # query or fragment, in one round-trip
+                    hrefs = await page.eval_on_selector_all("a[href]", SAME_HOST_LINKS_JS, base_domain)
+                    for href in hrefs:
+                        key = _canon(href)
+                        if key not in seen:
+                            seen.add(key)
+                            frontier.append(href)
 
                 except Exception as e:
-                    logger.warning(f"Failed to crawl {current_url}: {e}")
+                    logger.warning("Failed to crawl %s: %s", current_url, e)
+                finally:
+                    async with changed:
+                        in_flight -= 1
+                        changed.notify_all()
+
+        async with self._session():
+            workers = [
+                await self._crawl_ctx.new_page()
+                for _ in range(max(1, min(self.config.playwright_concurrency, max_pages)))
+            ]
+            try:
+                await asyncio.gather(*(crawl_worker(page) for page in workers))
+            finally:
+                for page in workers:
+                    await page.close()
 
-            browser.close()
+            await self._save_state(url)
 
         return pages
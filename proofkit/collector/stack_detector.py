@@ -1,13 +1,204 @@
 """Technology stack detection from page content."""
 
+import hashlib
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import ClassVar, Dict, Iterable, List, Optional, Any, Set, Tuple
 
 from proofkit.utils.logger import logger
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
 from .models import SnapshotData, StackInfo
 
 
+# Opening parenthesis of a capturing group in a pattern source
+_CAPTURING_GROUP_RE = re.compile(r"(?<!\\)\((?!\?)")
+
+# Pattern sources with no regex semantics: plain text plus escaped punctuation
+_LITERAL_RE = re.compile(r"(?:[^.^$*+?{}\[\]\\|()]|\\[^A-Za-z0-9])*")
+_ESCAPE_RE = re.compile(r"\\(.)")
+_ESCAPE_OR_TEXT_RE = re.compile(r"\\.|[^\\]+")
+
+
+def _lower_pattern(pattern: str) -> str:
+    """Lowercase a pattern source, leaving escapes such as \\D and \\W alone."""
+    return _ESCAPE_OR_TEXT_RE.sub(
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(), pattern
+    )
+
+
+def _literal(pattern: str) -> Optional[str]:
+    """Lowercased needle for a pattern without regex semantics, else None."""
+    if not _LITERAL_RE.fullmatch(pattern):
+        return None
+    return _ESCAPE_RE.sub(r"\1", pattern).lower()
+
+
+class _FusedGroup:
+    """
+    One {technology: [pattern, ...]} table, compiled for _StackScanner.
+
+    Matching is case-insensitive by lowercasing: patterns are lowercased at
+    compile time and text must be lowercased, so the regex engine never
+    case-folds per character.
+
+    With pyahocorasick installed, literal patterns become needles for the
+    scanner's shared automaton, and only the remaining regex patterns go
+    through the fused regex below.
+
+    The fused regex has one capturing group per technology (group i + 1 for
+    technologies[i]); pattern groups are made non-capturing. The
+    alternation sits inside a lookahead, so finditer visits every position
+    where some technology matches and no match consumes text another
+    technology would match from a later position.
+
+    Single-value groups report the found technology earliest in the table;
+    list groups report every found technology in table order.
+    """
+
+    def __init__(
+        self,
+        patterns: Dict[str, List[str]],
+        order: Optional[List[str]] = None,
+        single: bool = False,
+    ):
+        self.technologies = tuple(order or patterns)
+        self.single = single
+        self.needles: Dict[str, List[int]] = {}
+        regex_patterns: Dict[str, List[str]] = {}
+
+        for index, tech in enumerate(self.technologies, 1):
+            regex_patterns[tech] = []
+            for pattern in patterns[tech]:
+                needle = _literal(pattern) if AHOCORASICK_AVAILABLE else None
+                if needle is None:
+                    regex_patterns[tech].append(pattern)
+                elif index not in self.needles.setdefault(needle, []):
+                    self.needles[needle].append(index)
+
+        # Technologies with no regex patterns left keep a never-matching
+        # group so group numbers still line up with technologies
+        alternatives = (
+            "(" + "|".join(_CAPTURING_GROUP_RE.sub("(?:", _lower_pattern(p)) for p in regex_patterns[tech]) + ")"
+            if regex_patterns[tech] else "((?!))"
+            for tech in self.technologies
+        )
+        # (group index, lowercased source) of each regex pattern, for RE2
+        self.regex_sources = [
+            (index, _lower_pattern(p))
+            for index, tech in enumerate(self.technologies, 1)
+            for p in regex_patterns[tech]
+        ]
+        self.pattern = None
+        if any(regex_patterns.values()):
+            self.pattern = re.compile("(?=" + "|".join(alternatives) + ")")
+
+    def resolved(self, found: Set[int]) -> bool:
+        """Whether further matches can no longer change the result."""
+        if self.single:
+            return 1 in found
+        return len(found) == len(self.technologies)
+
+    def search(self, text: str, found: Set[int]) -> None:
+        """Add group indexes of regex matches in lowercased text to found."""
+        if self.pattern is None or self.resolved(found):
+            return
+        for match in self.pattern.finditer(text):
+            found.add(match.lastindex)
+            if self.resolved(found):
+                return
+
+    def result(self, found: Set[int]) -> Any:
+        """Detected technology (single) or technologies (list) for found indexes."""
+        if self.single:
+            return self.technologies[min(found) - 1] if found else None
+        return [tech for i, tech in enumerate(self.technologies, 1) if i in found]
+
+
+class _StackScanner:
+    """
+    Detect several categories in one pass over the text.
+
+    Literal needles from every group share one Aho-Corasick automaton, so
+    the text is walked once for all of them. With google-re2 installed the
+    remaining regex patterns of every group form one RE2 set, matched in a
+    single linear-time pass that reports every pattern found. Otherwise
+    each group's fused regex runs only until that group's result can no
+    longer change.
+    """
+
+    def __init__(self, groups: Dict[str, _FusedGroup]):
+        self.groups = groups
+        self.automaton = None
+        self.regex_set = None
+        self.regex_payloads: List[Tuple[str, int]] = []
+
+        payloads: Dict[str, List[Tuple[str, int]]] = {}
+        for category, group in groups.items():
+            for needle, indexes in group.needles.items():
+                payloads.setdefault(needle, []).extend((category, index) for index in indexes)
+        if payloads:
+            self.automaton = ahocorasick.Automaton()
+            for needle, payload in payloads.items():
+                self.automaton.add_word(needle, tuple(payload))
+            self.automaton.make_automaton()
+
+        sources = [
+            (category, index, source)
+            for category, group in groups.items()
+            for index, source in group.regex_sources
+        ]
+        if RE2_AVAILABLE and sources:
+            try:
+                regex_set = re2.Set.SearchSet()
+                for _, _, source in sources:
+                    regex_set.Add(source)
+                regex_set.Compile()
+            except re2.error as e:
+                logger.debug(f"RE2 rejected a stack pattern, using re: {e}")
+            else:
+                self.regex_set = regex_set
+                self.regex_payloads = [(category, index) for category, index, _ in sources]
+
+    def scan(self, text: str) -> Dict[str, Any]:
+        """Detected technologies per category in lowercased text."""
+        found: Dict[str, Set[int]] = {category: set() for category in self.groups}
+        if self.automaton is not None:
+            for _, payload in self.automaton.iter(text):
+                for category, index in payload:
+                    found[category].add(index)
+        if self.regex_set is not None:
+            for i in self.regex_set.Match(text) or ():
+                category, index = self.regex_payloads[i]
+                found[category].add(index)
+        else:
+            for category, group in self.groups.items():
+                group.search(text, found[category])
+        return {category: group.result(found[category]) for category, group in self.groups.items()}
+
+
+def _cdn_from_server(value: str) -> Optional[str]:
+    """CDN named in a Server or Via header value."""
+    for cdn in ("cloudflare", "akamai", "cloudfront", "fastly"):
+        if cdn in value:
+            return cdn
+    return None
+
+
 class StackDetector:
     """Detect CMS, frameworks, analytics, and other technologies."""
 
@@ -224,6 +415,115 @@ class StackDetector:
         ],
     }
 
+    # Standalone technologies reported in StackInfo.other, in report order
+    OTHER_PATTERNS = {
+        # Font libraries
+        "google_fonts": [r"fonts\.googleapis\.com"],
+        "font_awesome": [r"use\.fontawesome\.com", r"fontawesome"],
+        # Chat widgets
+        "intercom": [r"intercom"],
+        "drift": [r"drift\.com"],
+        "crisp": [r"crisp\.chat", r"crisp\.im"],
+        "tawk": [r"tawk\.to"],
+        "zendesk": [r"zendesk"],
+        # A/B testing
+        "optimizely": [r"optimizely"],
+        "vwo": [r"vwo\.com", r"visualwebsiteoptimizer"],
+        # Recaptcha
+        "recaptcha": [r"recaptcha", r"grecaptcha"],
+    }
+
+    # Response headers that identify a CDN, by lowercased name; callables
+    # map the lowercased value to a CDN or None
+    CDN_HEADER_HINTS = {
+        "cf-ray": "cloudflare",
+        "cf-cache-status": "cloudflare",
+        "x-served-by": lambda value: "fastly" if "cache-" in value else None,
+        "x-fastly-request-id": "fastly",
+        "x-akamai-transformed": "akamai",
+        "x-amz-cf-id": "cloudfront",
+        "x-amz-cf-pop": "cloudfront",
+        "server": _cdn_from_server,
+        "via": _cdn_from_server,
+    }
+
+    # Characters of each page scanned: the head (<head>, early scripts) and
+    # the tail (late-loaded scripts); signatures rarely sit in between
+    DETECTION_WINDOW_HEAD = 131072
+    DETECTION_WINDOW_TAIL = 32768
+
+    # Frameworks checked first, in this order, before the rest of the table
+    FRAMEWORK_PRIORITY = ["nextjs", "nuxt", "gatsby", "react", "vue", "angular", "svelte"]
+
+    # Every category compiled once at class creation and keyed by its
+    # StackInfo field, so one scan of the HTML serves all the detectors
+    _GROUPS = {
+        "cms": _FusedGroup(CMS_PATTERNS, single=True),
+        "framework": _FusedGroup(
+            FRAMEWORK_PATTERNS,
+            list(dict.fromkeys(FRAMEWORK_PRIORITY + list(FRAMEWORK_PATTERNS))),
+            single=True,
+        ),
+        "analytics": _FusedGroup(ANALYTICS_PATTERNS),
+        "tag_managers": _FusedGroup(TAG_MANAGER_PATTERNS),
+        "cdn": _FusedGroup(CDN_PATTERNS, single=True),
+        "ecommerce_platform": _FusedGroup(ECOMMERCE_PATTERNS, single=True),
+        "other": _FusedGroup(OTHER_PATTERNS),
+    }
+    _SCANNER = _StackScanner(_GROUPS)
+    _scanner = _SCANNER
+
+    # Scanners specialised to a subset of categories, built on first use
+    _scanners: ClassVar[Dict[frozenset, _StackScanner]] = {}
+
+    # Detection results shared across instances, keyed by a digest of the
+    # scanned text plus the headers, least recently used evicted first
+    CACHE_SIZE = 128
+    _cache: ClassVar["OrderedDict[Tuple[bytes, Tuple[Tuple[str, str], ...], Optional[frozenset]], StackInfo]"] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Last (html, scan results) pair, so one detect() lowercases and scans
+    # the HTML once for every detector
+    _scanned: Optional[Tuple[str, Dict[str, Any]]] = None
+
+    # Categories this detector scans, None for all
+    categories: Optional[frozenset] = None
+
+    def configure(self, categories: Optional[Iterable[str]] = None) -> "StackDetector":
+        """
+        Limit detection to some categories, named by StackInfo field.
+
+        The scanner for each category subset is built once and shared, so
+        its automaton and regexes hold only the requested patterns. Fields
+        of skipped categories stay None or empty.
+
+        Args:
+            categories: e.g. {"cms", "framework"}; None restores all
+
+        Returns:
+            This detector
+        """
+        if categories is None:
+            self.categories = None
+            self._scanner = self._SCANNER
+            self._scanned = None
+            return self
+
+        categories = frozenset(categories)
+        unknown = categories - self._GROUPS.keys()
+        if unknown:
+            raise ValueError(f"Unknown stack categories: {', '.join(sorted(unknown))}")
+
+        with self._cache_lock:
+            scanner = self._scanners.get(categories)
+            if scanner is None:
+                scanner = _StackScanner({c: g for c, g in self._GROUPS.items() if c in categories})
+                self._scanners[categories] = scanner
+        self.categories = categories
+        self._scanner = scanner
+        self._scanned = None
+        return self
+
     def detect(self, snapshot: SnapshotData) -> StackInfo:
         """
         Detect technology stack from snapshot data.
@@ -237,30 +537,19 @@ class StackDetector:
         logger.info("Detecting technology stack")
 
         # Combine HTML content from all pages
-        html_content = ""
-        for page in snapshot.pages:
-            if page.html_content:
-                html_content += page.html_content
+        html_content = "".join(self._window(page.html_content) for page in snapshot.pages if page.html_content)
 
         # If no HTML content, try to get from meta tags and headings
         if not html_content:
-            for page in snapshot.pages:
-                html_content += str(page.meta_tags)
-                for level, headings in page.headings.items():
-                    html_content += " ".join(headings)
+            html_content = "".join(
+                str(page.meta_tags) + "".join(" ".join(headings) for headings in page.headings.values())
+                for page in snapshot.pages
+            )
 
         # Get headers if available (from HTTP probe, but not here)
         headers = {}
 
-        return StackInfo(
-            cms=self._detect_cms(html_content),
-            framework=self._detect_framework(html_content),
-            analytics=self._detect_analytics(html_content),
-            tag_managers=self._detect_tag_managers(html_content),
-            cdn=self._detect_cdn(html_content, headers),
-            ecommerce_platform=self._detect_ecommerce(html_content),
-            other=self._detect_other(html_content),
-        )
+        return self._detect_cached(html_content, headers)
 
     def detect_from_html(self, html: str, headers: Optional[Dict[str, str]] = None) -> StackInfo:
         """
@@ -275,7 +564,32 @@ class StackDetector:
         """
         headers = headers or {}
 
-        return StackInfo(
+        return self._detect_cached(self._window(html), headers)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached detection result."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def _detect_cached(self, html: str, headers: Dict[str, str]) -> StackInfo:
+        """Detect from the scanned text, reusing results for identical text and headers."""
+        if not html:
+            # Nothing to scan (e.g. a failed collection); only headers can hint
+            return StackInfo(cdn=self._detect_cdn_from_headers(headers))
+
+        key = (
+            hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            tuple(sorted((str(name).lower(), str(value)) for name, value in headers.items())),
+            self.categories,
+        )
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached.model_copy(deep=True)
+
+        info = StackInfo(
             cms=self._detect_cms(html),
             framework=self._detect_framework(html),
             analytics=self._detect_analytics(html),
@@ -285,115 +599,68 @@ class StackDetector:
             other=self._detect_other(html),
         )
 
+        with self._cache_lock:
+            self._cache[key] = info.model_copy(deep=True)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return info
+
+    def _window(self, html: str) -> str:
+        """Head and tail of a page's HTML, within the detection window."""
+        head, tail = self.DETECTION_WINDOW_HEAD, self.DETECTION_WINDOW_TAIL
+        if len(html) <= head + tail:
+            return html
+        return html[:head] + html[-tail:] if tail else html[:head]
+
+    def _scan(self, html: str) -> Dict[str, Any]:
+        """Detections per category, reused while the detectors see the same string."""
+        scanned = self._scanned
+        if scanned is None or scanned[0] is not html:
+            scanned = (html, self._scanner.scan(html.lower()))
+            self._scanned = scanned
+        return scanned[1]
+
     def _detect_cms(self, html: str) -> Optional[str]:
         """Detect CMS from HTML content."""
-        for cms, patterns in self.CMS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    return cms
-        return None
+        return self._scan(html).get("cms")
 
     def _detect_framework(self, html: str) -> Optional[str]:
-        """Detect primary frontend framework."""
-        # Check in priority order
-        priority_order = ["nextjs", "nuxt", "gatsby", "react", "vue", "angular", "svelte"]
-
-        for framework in priority_order:
-            patterns = self.FRAMEWORK_PATTERNS.get(framework, [])
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    return framework
-
-        # Check other frameworks
-        for framework, patterns in self.FRAMEWORK_PATTERNS.items():
-            if framework not in priority_order:
-                for pattern in patterns:
-                    if re.search(pattern, html, re.IGNORECASE):
-                        return framework
-
-        return None
+        """Detect primary frontend framework, in FRAMEWORK_PRIORITY order first."""
+        return self._scan(html).get("framework")
 
     def _detect_analytics(self, html: str) -> List[str]:
         """Detect analytics tools."""
-        found = []
-
-        for tool, patterns in self.ANALYTICS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    if tool not in found:
-                        found.append(tool)
-                    break
-
-        return found
+        return list(self._scan(html).get("analytics", ()))
 
     def _detect_tag_managers(self, html: str) -> List[str]:
         """Detect tag managers."""
-        found = []
-
-        for tool, patterns in self.TAG_MANAGER_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    if tool not in found:
-                        found.append(tool)
-                    break
-
-        return found
+        return list(self._scan(html).get("tag_managers", ()))
 
     def _detect_cdn(self, html: str, headers: Dict[str, str]) -> Optional[str]:
         """Detect CDN from HTML and headers."""
-        # Check headers first
-        header_str = str(headers).lower()
-        for cdn, patterns in self.CDN_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, header_str, re.IGNORECASE):
-                    return cdn
-
-        # Check HTML
-        for cdn, patterns in self.CDN_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    return cdn
-
+        # Check headers first, then HTML
+        return self._detect_cdn_from_headers(headers) or self._scan(html).get("cdn")
+
+    def _detect_cdn_from_headers(self, headers: Dict[str, str]) -> Optional[str]:
+        """Detect CDN from response header hints."""
+        if self.categories is not None and "cdn" not in self.categories:
+            return None
+        hinted = set()
+        for name, value in headers.items():
+            hint = self.CDN_HEADER_HINTS.get(name.lower())
+            if callable(hint):
+                hint = hint(str(value).lower())
+            if hint:
+                hinted.add(hint)
+        for cdn in self.CDN_PATTERNS:
+            if cdn in hinted:
+                return cdn
         return None
 
     def _detect_ecommerce(self, html: str) -> Optional[str]:
         """Detect e-commerce platform."""
-        for platform, patterns in self.ECOMMERCE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html, re.IGNORECASE):
-                    return platform
-        return None
+        return self._scan(html).get("ecommerce_platform")
 
     def _detect_other(self, html: str) -> List[str]:
         """Detect other notable technologies."""
-        other = []
-
-        # Font libraries
-        if re.search(r"fonts\.googleapis\.com", html, re.IGNORECASE):
-            other.append("google_fonts")
-        if re.search(r"use\.fontawesome\.com|fontawesome", html, re.IGNORECASE):
-            other.append("font_awesome")
-
-        # Chat widgets
-        if re.search(r"intercom", html, re.IGNORECASE):
-            other.append("intercom")
-        if re.search(r"drift\.com", html, re.IGNORECASE):
-            other.append("drift")
-        if re.search(r"crisp\.chat|crisp\.im", html, re.IGNORECASE):
-            other.append("crisp")
-        if re.search(r"tawk\.to", html, re.IGNORECASE):
-            other.append("tawk")
-        if re.search(r"zendesk", html, re.IGNORECASE):
-            other.append("zendesk")
-
-        # A/B testing
-        if re.search(r"optimizely", html, re.IGNORECASE):
-            other.append("optimizely")
-        if re.search(r"vwo\.com|visualwebsiteoptimizer", html, re.IGNORECASE):
-            other.append("vwo")
-
-        # Recaptcha
-        if re.search(r"recaptcha|grecaptcha", html, re.IGNORECASE):
-            other.append("recaptcha")
-
-        return other
+        return list(self._scan(html).get("other", ()))
@@ -1,6 +1,14 @@
 """Core orchestration for ProofKit."""
 
 from .runner import AuditRunner
-from .pipeline import Pipeline, PipelineStage, StageResult
+from .pipeline import LazyPayload, ParallelStageGroup, Pipeline, PipelineStage, StageResult, memoize_stage
 
-__all__ = ["AuditRunner", "Pipeline", "PipelineStage", "StageResult"]
+__all__ = [
+    "AuditRunner",
+    "LazyPayload",
+    "ParallelStageGroup",
+    "Pipeline",
+    "PipelineStage",
+    "StageResult",
+    "memoize_stage",
+]
@@ -1,9 +1,18 @@
 """Pipeline execution utilities for ProofKit."""
 
-from typing import List, Callable, Any, Optional
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Callable, Any, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from proofkit.utils import json_utils
 from proofkit.utils.logger import logger
 
 
@@ -24,20 +33,167 @@ class StageResult:
     error: Optional[str] = None
 
 
+def memoize_stage(handler: Callable) -> Callable:
+    """
+    Mark a stage handler as safe to memoize.
+
+    A Pipeline with a cache_dir reuses a marked handler's output for an
+    identical input instead of calling it again. Only mark handlers whose
+    output depends on nothing but their input.
+    """
+    handler.memoize = True
+    return handler
+
+
+class LazyPayload:
+    """
+    Stage output handed to the next stage as a pickle on disk.
+
+    The value is unpickled on first use and then kept. Attribute access,
+    indexing, iteration, len() and `in` go to the value, so most handlers
+    can take a LazyPayload where they expect the object; call load() for
+    the object itself.
+    """
+
+    _UNLOADED = object()
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._value = self._UNLOADED
+
+    @classmethod
+    def dump(cls, value: Any, directory: Path, name: str) -> "LazyPayload":
+        """Pickle value into directory and return a payload pointing at it."""
+        path = directory / f"{name}.pkl"
+        path.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        return cls(path)
+
+    def load(self) -> Any:
+        """The stored value, unpickled on first call."""
+        if self._value is self._UNLOADED:
+            self._value = pickle.loads(self.path.read_bytes())
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.load()
+
+    def __getstate__(self):
+        # Cross process boundaries as a path, never as the loaded value
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._value = self._UNLOADED
+
+
+def _fingerprint_data(data: Any) -> bytes:
+    """Stable bytes for a stage input."""
+    if isinstance(data, LazyPayload):
+        data = data.load()
+    if hasattr(data, "model_dump_json"):
+        return data.model_dump_json().encode("utf-8")
+    return json_utils.dumps(data)
+
+
+def _fingerprint_handler(handler: Callable) -> bytes:
+    """Source of a handler, so editing it invalidates cached outputs."""
+    if isinstance(handler, ParallelStageGroup):
+        return b"".join(name.encode() + _fingerprint_handler(h) for name, h in handler.handlers.items())
+    try:
+        return inspect.getsource(handler).encode("utf-8")
+    except (OSError, TypeError):
+        return getattr(handler, "__qualname__", repr(handler)).encode("utf-8")
+
+
+class ParallelStageGroup:
+    """
+    Independent handlers run concurrently as one pipeline stage.
+
+    Every handler receives the same input and the stage output is a dict of
+    results by handler name. Handlers run in a thread pool, so I/O-bound
+    work such as collectors overlaps; the first failing handler, in
+    insertion order, fails the stage once all of them have finished.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable], max_workers: Optional[int] = None):
+        self.handlers = dict(handlers)
+        self.max_workers = max_workers or max(len(self.handlers), 1)
+        self.memoize = all(getattr(h, "memoize", False) for h in self.handlers.values())
+
+    def __call__(self, data: Any) -> Dict[str, Any]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {name: pool.submit(handler, data) for name, handler in self.handlers.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 class Pipeline:
     """
     Configurable pipeline for executing audit stages.
+
+    With a cache_dir, outputs of handlers marked with memoize_stage are
+    pickled there, keyed by stage, input and handler source, so a rerun
+    with the same input (e.g. re-rendering only the narrative) skips them.
+
+    With use_disk_handoff, each stage output is pickled to a scratch
+    directory and passed on (and kept in results) as a LazyPayload, so
+    large collector dumps are not held in memory for the whole run or
+    serialized again when a handler ships its input to another process.
+    Without a scratch_dir each run pickles into its own temporary
+    directory, removed by cleanup() or on leaving a `with` block once the
+    payloads are no longer needed.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        use_disk_handoff: bool = False,
+        scratch_dir: Optional[Path] = None,
+    ):
         self.stages: List[tuple[PipelineStage, Callable]] = []
         self.results: List[StageResult] = []
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.use_disk_handoff = use_disk_handoff
+        self.scratch_dir = Path(scratch_dir) if scratch_dir else None
+        self._temp_dirs: List[Path] = []
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        """Remove the temporary scratch directories of earlier runs, with their payloads."""
+        while self._temp_dirs:
+            shutil.rmtree(self._temp_dirs.pop(), ignore_errors=True)
 
     def add_stage(self, stage: PipelineStage, handler: Callable) -> "Pipeline":
         """Add a stage to the pipeline."""
         self.stages.append((stage, handler))
         return self
 
+    def add_parallel_group(
+        self,
+        stage: PipelineStage,
+        handlers: Dict[str, Callable],
+        max_workers: Optional[int] = None,
+    ) -> "Pipeline":
+        """Add a stage whose independent handlers run concurrently."""
+        self.stages.append((stage, ParallelStageGroup(handlers, max_workers)))
+        return self
+
     def run(
         self,
         initial_data: Any = None,
@@ -56,6 +212,11 @@ class Pipeline:
         self.results = []
         current_data = initial_data
 
+        scratch_dir = self.scratch_dir
+        if self.use_disk_handoff and scratch_dir is None:
+            scratch_dir = Path(tempfile.mkdtemp(prefix="proofkit-pipeline-"))
+            self._temp_dirs.append(scratch_dir)
+
         for i, (stage, handler) in enumerate(self.stages):
             logger.info(f"Running pipeline stage: {stage.value}")
 
@@ -64,7 +225,10 @@ class Pipeline:
                 progress_callback(stage, progress)
 
             try:
-                result_data = handler(current_data)
+                result_data = self._run_stage(stage, handler, current_data)
+                if self.use_disk_handoff:
+                    scratch_dir.mkdir(parents=True, exist_ok=True)
+                    result_data = LazyPayload.dump(result_data, scratch_dir, f"{i:02d}-{stage.value}")
                 result = StageResult(
                     stage=stage,
                     success=True,
@@ -88,6 +252,38 @@ class Pipeline:
 
         return self.results
 
+    def _run_stage(self, stage: PipelineStage, handler: Callable, data: Any) -> Any:
+        """Run a stage handler, reusing a memoized output when one exists."""
+        if self.cache_dir is None or not getattr(handler, "memoize", False):
+            return handler(data)
+
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(stage.value.encode("utf-8"))
+        digest.update(_fingerprint_data(data))
+        digest.update(_fingerprint_handler(handler))
+        path = self.cache_dir / f"{stage.value}-{digest.hexdigest()}.pkl"
+
+        try:
+            cached = pickle.loads(path.read_bytes())
+            logger.info(f"Reusing memoized output for stage: {stage.value}")
+            return cached
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable memoized output {path}: {e}")
+
+        result_data = handler(data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file, so pipelines memoizing the same key at once
+            # never publish each other's partial writes
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                f.write(pickle.dumps(result_data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(f.name, path)
+        except Exception as e:
+            logger.warning(f"Could not memoize stage {stage.value}: {e}")
+        return result_data
+
     def get_result(self, stage: PipelineStage) -> Optional[StageResult]:
         """Get result for a specific stage."""
         for result in self.results:
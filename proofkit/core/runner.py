@@ -1,24 +1,50 @@
 """Main audit orchestration for ProofKit."""
 
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Callable, Optional, List, Any
-import json
+from datetime import datetime, timedelta, timezone
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, List, Any
 
 from proofkit.schemas.audit import AuditConfig, AuditResult, AuditStatus
 from proofkit.schemas.finding import Finding
 from proofkit.schemas.report import Report, ReportMeta, ReportNarrative
+from proofkit.utils import json_utils
 from proofkit.utils.config import get_config
 from proofkit.utils.logger import logger
 from proofkit.utils.paths import setup_run_directories
 from proofkit import __version__
 
-# Import actual collector, analyzer, and narrator modules
-from proofkit.collector import Collector, RawData
-from proofkit.analyzer.engine import RuleEngine
-from proofkit.narrator import Narrator
-from proofkit.report_builder.pencil_export import generate_pencil_report
-from proofkit.report_builder.figma_export import generate_figma_export
+# Collector, analyzer, narrator and exporters are imported where they run, so
+# importing the runner (CLI startup, API workers) doesn't load them all
+if TYPE_CHECKING:
+    from proofkit.collector import RawData
+
+
+# Write buffer for report.json and findings.json
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+def _no_progress(percent: int) -> None:
+    """Progress callback used when the caller didn't pass one."""
+
+
+# Categories scored when the analyzer provides no scores
+SCORECARD_CATEGORIES = (
+    "PERFORMANCE",
+    "SEO",
+    "CONVERSION",
+    "UX",
+    "SECURITY",
+    "MAINTENANCE",
+    "BUSINESS_LOGIC",
+    "ACCESSIBILITY",
+)
+
+# Points deducted per finding, by severity
+SEVERITY_DEDUCTIONS = {"P0": 25, "P1": 15, "P2": 8, "P3": 3}
+DEFAULT_DEDUCTION = 5
 
 
 class AuditRunner:
@@ -29,8 +55,16 @@ class AuditRunner:
     def __init__(self, config: AuditConfig):
         self.config = config
         self.settings = get_config()
-        self.run_id = f"run_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        # Weights are fixed for the run; read them once
+        self._score_weights = dict(self.settings.score_weights)
+        # One wall-clock read per run; run_id and every later timestamp derive
+        # from it plus the monotonic clock
+        self.started_at = datetime.now(timezone.utc)
+        self._t0 = time.monotonic_ns()
+        self.phase_durations: Dict[str, float] = {}
+        self.run_id = f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}"
         self.output_dir = self._setup_output_dir()
+        self._analyzer_scores: Optional[dict] = None
 
     def _setup_output_dir(self) -> Path:
         """Set up the output directory structure."""
@@ -45,6 +79,27 @@ class AuditRunner:
         """
         Execute full audit pipeline.
 
+        Synchronous wrapper around run_async() for callers without an event
+        loop.
+
+        Args:
+            progress_callback: Optional callback for progress updates (0-100)
+
+        Returns:
+            AuditResult with status and output paths
+        """
+        return asyncio.run(self.run_async(progress_callback))
+
+    async def run_async(
+        self, progress_callback: Optional[Callable[[int], None]] = None
+    ) -> AuditResult:
+        """
+        Execute full audit pipeline on the running event loop.
+
+        Collection runs as coroutines on this loop; the blocking analyzer,
+        narrator and output phases run in worker threads so the loop stays
+        responsive.
+
         Args:
             progress_callback: Optional callback for progress updates (0-100)
 
@@ -55,48 +110,55 @@ class AuditRunner:
             audit_id=self.run_id,
             config=self.config,
             status=AuditStatus.PENDING,
-            started_at=datetime.utcnow(),
+            started_at=self.started_at,
             output_dir=self.output_dir,
         )
 
+        # Bound once so the phases below call it unconditionally
+        progress = progress_callback or _no_progress
+
         try:
             # Phase 1: Collect (0-40%)
             result.status = AuditStatus.COLLECTING
             logger.info(f"Starting collection for {self.config.url}")
-            if progress_callback:
-                progress_callback(5)
+            progress(5)
 
-            raw_data = self._run_collectors()
-            if progress_callback:
-                progress_callback(40)
+            phase_start = time.monotonic_ns()
+            # Collector sub-progress fills the 5-40% band
+            raw_data = await self._run_collectors(lambda fraction: progress(5 + int(fraction * 35)))
+            phase_start = self._end_phase("collect", phase_start)
+            progress(40)
 
             # Phase 2: Analyze (40-70%)
             result.status = AuditStatus.ANALYZING
             logger.info("Running analysis")
-            findings = self._run_analyzer(raw_data)
-            if progress_callback:
-                progress_callback(70)
+            findings = await asyncio.to_thread(self._run_analyzer, raw_data)
+            phase_start = self._end_phase("analyze", phase_start)
+            progress(70)
 
             # Phase 3: Narrate (70-90%)
             result.status = AuditStatus.NARRATING
             logger.info("Generating narrative")
-            narrative = self._run_narrator(findings)
-            if progress_callback:
-                progress_callback(90)
+            narrative = await asyncio.to_thread(self._run_narrator, findings)
+            phase_start = self._end_phase("narrate", phase_start)
+            progress(90)
 
             # Phase 4: Build Report (90-100%)
             logger.info("Building report")
             report = self._build_report(raw_data, findings, narrative)
-            self._save_outputs(report)
+            await asyncio.to_thread(self._save_outputs, report)
+            self._end_phase("report", phase_start)
 
             result.status = AuditStatus.COMPLETE
-            result.completed_at = datetime.utcnow()
+            result.completed_at = self._now()
             result.scorecard = report.scorecard
             result.finding_count = len(findings)
-            if progress_callback:
-                progress_callback(100)
+            progress(100)
 
-            logger.info(f"Audit complete: {result.finding_count} findings")
+            logger.info(
+                f"Audit complete: {result.finding_count} findings in "
+                f"{(time.monotonic_ns() - self._t0) / 1e9:.1f}s"
+            )
 
         except Exception as e:
             result.status = AuditStatus.FAILED
@@ -106,22 +168,41 @@ class AuditRunner:
 
         return result
 
-    def _run_collectors(self) -> RawData:
+    def _now(self) -> datetime:
+        """Current UTC time, derived from started_at and the monotonic clock."""
+        return self.started_at + timedelta(microseconds=(time.monotonic_ns() - self._t0) // 1000)
+
+    def _end_phase(self, phase: str, phase_start: int) -> int:
+        """Record and log a phase's duration; returns the start of the next phase."""
+        now = time.monotonic_ns()
+        self.phase_durations[phase] = (now - phase_start) / 1e9
+        logger.debug(f"Phase {phase} took {self.phase_durations[phase]:.2f}s")
+        return now
+
+    async def _run_collectors(
+        self, progress_callback: Optional[Callable[[float], None]] = None
+    ) -> "RawData":
         """
         Run all collectors and return raw data.
 
+        Args:
+            progress_callback: Optional callback with the fraction collected (0-1)
+
         Returns:
             RawData object containing all collected information
         """
+        from proofkit.collector import Collector
+
         collector = Collector()
-        raw_data = collector.collect(
+        raw_data = await collector.collect_async(
             url=str(self.config.url),
             mode=self.config.mode,
             output_dir=self.output_dir / "raw",
+            progress_callback=progress_callback,
         )
         return raw_data
 
-    def _run_analyzer(self, raw_data: RawData) -> List[Finding]:
+    def _run_analyzer(self, raw_data: "RawData") -> List[Finding]:
         """
         Run analyzer on raw data.
 
@@ -131,6 +212,8 @@ class AuditRunner:
         Returns:
             List of findings
         """
+        from proofkit.analyzer.engine import RuleEngine
+
         engine = RuleEngine()
         findings, scores = engine.analyze(
             raw_data=raw_data,
@@ -145,6 +228,10 @@ class AuditRunner:
         """
         Generate AI narrative from findings.
 
+        Sections generated for the same findings within
+        PROOFKIT_NARRATIVE_CACHE_TTL are reused unless the audit turns the
+        narrative cache off.
+
         Args:
             findings: List of findings from analyzer
 
@@ -152,7 +239,13 @@ class AuditRunner:
             ReportNarrative with AI-generated content
         """
         try:
-            narrator = Narrator()
+            from proofkit.narrator import Narrator
+
+            base = self.config.output_dir or self.settings.output_dir
+            narrator = Narrator(
+                cache_ttl=None if self.config.narrative_cache else 0,
+                cache_dir=base / ".cache" / "narrator",
+            )
             narrative = narrator.generate(
                 findings=findings,
                 business_type=self.config.business_type,
@@ -166,7 +259,7 @@ class AuditRunner:
 
     def _build_report(
         self,
-        raw_data: RawData,
+        raw_data: "RawData",
         findings: List[Finding],
         narrative: ReportNarrative,
     ) -> Report:
@@ -189,16 +282,19 @@ class AuditRunner:
             url=str(self.config.url),
             business_type=self.config.business_type,
             conversion_goal=self.config.conversion_goal,
-            generated_at=datetime.utcnow(),
+            generated_at=self._now(),
             proofkit_version=__version__,
-            mode=self.config.mode.value if hasattr(self.config.mode, 'value') else str(self.config.mode),
+            mode=self.config.mode,
             pages_analyzed=pages_analyzed,
         )
 
         # Use scores from analyzer if available, otherwise calculate
-        if hasattr(self, '_analyzer_scores') and self._analyzer_scores:
-            scorecard = {k: v for k, v in self._analyzer_scores.items() if k != 'OVERALL'}
-            overall_score = self._analyzer_scores.get('OVERALL', self._calculate_overall_score(scorecard))
+        if self._analyzer_scores:
+            scorecard = dict(self._analyzer_scores)
+            overall_score = scorecard.pop('OVERALL', None)
+            # Only derive the overall score when the analyzer didn't supply one
+            if overall_score is None:
+                overall_score = self._calculate_overall_score(scorecard)
         else:
             scorecard = self._calculate_scorecard(findings)
             overall_score = self._calculate_overall_score(scorecard)
@@ -220,111 +316,107 @@ class AuditRunner:
     def _calculate_scorecard(self, findings: List[Finding]) -> dict:
         """Calculate scores by category."""
         # Start with perfect scores
-        scorecard = {
-            "PERFORMANCE": 100,
-            "SEO": 100,
-            "CONVERSION": 100,
-            "UX": 100,
-            "SECURITY": 100,
-            "MAINTENANCE": 100,
-            "BUSINESS_LOGIC": 100,
-            "ACCESSIBILITY": 100,
-        }
-
-        # Deduct points based on findings
-        severity_deductions = {"P0": 25, "P1": 15, "P2": 8, "P3": 3}
-
-        for finding in findings:
-            category = finding.category
-            if isinstance(category, str):
-                cat_key = category
-            else:
-                cat_key = category.value if hasattr(category, 'value') else str(category)
-
-            severity = finding.severity
-            if isinstance(severity, str):
-                sev_key = severity
-            else:
-                sev_key = severity.value if hasattr(severity, 'value') else str(severity)
+        scorecard = dict.fromkeys(SCORECARD_CATEGORIES, 100)
 
+        # One deduction per (category, severity) pair instead of per finding;
+        # Finding stores both as plain strings
+        counts = Counter((finding.category, finding.severity) for finding in findings)
+        for (cat_key, sev_key), count in counts.items():
             if cat_key in scorecard:
-                deduction = severity_deductions.get(sev_key, 5)
-                scorecard[cat_key] = max(0, scorecard[cat_key] - deduction)
+                deduction = SEVERITY_DEDUCTIONS.get(sev_key, DEFAULT_DEDUCTION)
+                scorecard[cat_key] = max(0, scorecard[cat_key] - count * deduction)
 
         return scorecard
 
     def _calculate_overall_score(self, scorecard: dict) -> int:
         """Calculate weighted overall score."""
-        weights = self.settings.score_weights
-        total_weight = sum(weights.get(cat, 0) for cat in scorecard)
+        weights = self._score_weights
+        weighted_sum = total_weight = 0
+
+        # One pass in scorecard order, so float sums match summing separately
+        for cat, score in scorecard.items():
+            weight = weights.get(cat)
+            if weight:
+                weighted_sum += score * weight
+                total_weight += weight
 
         if total_weight == 0:
             return 100
 
-        weighted_sum = sum(
-            scorecard[cat] * weights.get(cat, 0)
-            for cat in scorecard
-            if cat in weights
-        )
-
         return int(weighted_sum / total_weight)
 
     def _save_outputs(self, report: Report) -> None:
         """Save report and related files to output directory."""
+        from proofkit.report_builder.figma_export import generate_figma_export
+        from proofkit.report_builder.pencil_export import generate_pencil_report
+
         out_dir = self.output_dir / "out"
 
-        # Save JSON report
+        # The report files and the Pencil/Figma exports only read the finished
+        # report and write to separate directories, so they run side by side
+        pencil_dir = self.output_dir / "pencil"
+        figma_dir = self.output_dir / "figma"
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            report_files = pool.submit(self._save_report_files, report, out_dir)
+            exports = {
+                "Pencil prompts": (pencil_dir, pool.submit(generate_pencil_report, report, pencil_dir)),
+                "Figma export": (figma_dir, pool.submit(generate_figma_export, report, figma_dir)),
+            }
+
+        for name, (export_dir, future) in exports.items():
+            try:
+                future.result()
+                logger.info(f"{name} saved to {export_dir}")
+            except Exception as e:
+                logger.warning(f"Failed to generate {name}: {e}")
+
+        # Failing to write the report itself still fails the audit
+        report_files.result()
+
+    def _save_report_files(self, report: Report, out_dir: Path) -> None:
+        """Write report.json, findings.json and narrative.md."""
+        # Save JSON report as compact bytes straight from the serializer
         report_path = out_dir / "report.json"
-        with open(report_path, "w") as f:
-            f.write(report.model_dump_json(indent=2))
+        with open(report_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as fh:
+            fh.write(report.__pydantic_serializer__.to_json(report))
 
         logger.info(f"Report saved to {report_path}")
 
-        # Save findings summary
+        # Save findings summary one finding at a time, without building the full list
         findings_path = out_dir / "findings.json"
-        with open(findings_path, "w") as f:
-            json.dump(
-                [f.model_dump() for f in report.findings],
-                f,
-                indent=2,
-                default=str,
-            )
-
-        # Save narrative (if present)
+        with open(findings_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as fh:
+            fh.write(b"[")
+            for i, finding in enumerate(report.findings):
+                if i:
+                    fh.write(b",")
+                fh.write(json_utils.dumps(finding.model_dump(mode="json")))
+            fh.write(b"]")
+
+        # Save narrative (if present), built in memory and written once
         if report.narrative.executive_summary:
             narrative_path = out_dir / "narrative.md"
-            with open(narrative_path, "w") as f:
-                f.write(f"# Audit Report: {report.meta.url}\n\n")
-                f.write(f"## Executive Summary\n\n{report.narrative.executive_summary}\n\n")
-
-                if report.narrative.quick_wins:
-                    f.write("## Quick Wins\n\n")
-                    for win in report.narrative.quick_wins:
-                        f.write(f"- {win}\n")
-                    f.write("\n")
-
-                if report.narrative.strategic_priorities:
-                    f.write("## Strategic Priorities\n\n")
-                    for priority in report.narrative.strategic_priorities:
-                        f.write(f"- {priority}\n")
-                    f.write("\n")
-
-                if report.narrative.lovable_concept:
-                    f.write("## Lovable Redesign Concept\n\n")
-                    f.write(f"```\n{report.narrative.lovable_concept}\n```\n")
-
-        # Auto-generate Pencil report prompts
-        try:
-            pencil_dir = self.output_dir / "pencil"
-            pencil_result = generate_pencil_report(report, pencil_dir)
-            logger.info(f"Pencil prompts saved to {pencil_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to generate Pencil prompts: {e}")
-
-        # Auto-generate Figma export
-        try:
-            figma_dir = self.output_dir / "figma"
-            figma_result = generate_figma_export(report, figma_dir)
-            logger.info(f"Figma export saved to {figma_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to generate Figma export: {e}")
+            narrative_path.write_text(self._render_narrative(report), encoding="utf-8")
+
+    def _render_narrative(self, report: Report) -> str:
+        """Render the narrative as Markdown."""
+        narrative = report.narrative
+        parts = [
+            f"# Audit Report: {report.meta.url}\n\n",
+            f"## Executive Summary\n\n{narrative.executive_summary}\n\n",
+        ]
+
+        if narrative.quick_wins:
+            parts.append("## Quick Wins\n\n")
+            parts.extend(f"- {win}\n" for win in narrative.quick_wins)
+            parts.append("\n")
+
+        if narrative.strategic_priorities:
+            parts.append("## Strategic Priorities\n\n")
+            parts.extend(f"- {priority}\n" for priority in narrative.strategic_priorities)
+            parts.append("\n")
+
+        if narrative.lovable_concept:
+            parts.append("## Lovable Redesign Concept\n\n")
+            parts.append(f"```\n{narrative.lovable_concept}\n```\n")
+
+        return "".join(parts)
@@ -5,16 +5,109 @@ Automatically discovers all interactive elements on a web page
 and categorizes them by type and expected behavior.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
+import weakref
 
-from playwright.async_api import Page, async_playwright
+import httpx
+from playwright.async_api import Browser, Page, Playwright, async_playwright
 
+from proofkit.utils.config import get_config
 from proofkit.utils.logger import logger
 
 
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SelectolaxError = None
+    SELECTOLAX_AVAILABLE = False
+
+
+# Upper bound on the best-effort wait for "load" after DOMContentLoaded
+LOAD_GRACE_MS = 5000
+
+# Timeout for the plain HTTP fetch tried before launching a browser
+STATIC_FETCH_TIMEOUT = 15.0
+
+# One Chromium per event loop, reused across discover_features calls; each
+# call gets its own context. Close it with shutdown_browser_pool()
+_browser_pool: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Future]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Ancestor selectors for element locations, as used in DISCOVER_JS
+_LOCATION_SELECTORS = {
+    "in_header": 'header, .header, [role="banner"]',
+    "in_footer": 'footer, .footer, [role="contentinfo"]',
+    "in_nav": 'nav, .nav, [role="navigation"]',
+    "in_sidebar": 'aside, .sidebar, [role="complementary"]',
+}
+
+# Empty mount points left by client-rendered apps; their features only
+# exist after JavaScript runs, so these pages need the browser
+_SPA_MOUNT_SELECTOR = "#root:empty, #app:empty, #__next:empty, #__nuxt:empty, [data-reactroot]:empty"
+
+
+# Runs every discovery selector in one browser call. Each group lists the
+# elements its selector union matches, once each and in document order;
+# invalid selectors are skipped. Elements in several groups are described once.
+DISCOVER_JS = """
+({patterns, buttons}) => {
+    const described = new Map();
+    const describe = (el) => {
+        let info = described.get(el);
+        if (!info) {
+            const rects = el.getClientRects();
+            info = {
+                tag: el.tagName.toLowerCase(),
+                class: el.getAttribute('class') || '',
+                id: el.getAttribute('id') || '',
+                href: el.getAttribute('href') || '',
+                text: (el.innerText || '').trim().slice(0, 100),
+                in_header: !!el.closest('header, .header, [role="banner"]'),
+                in_footer: !!el.closest('footer, .footer, [role="contentinfo"]'),
+                in_nav: !!el.closest('nav, .nav, [role="navigation"]'),
+                in_sidebar: !!el.closest('aside, .sidebar, [role="complementary"]'),
+                y: rects.length ? el.getBoundingClientRect().y : null,
+            };
+            described.set(el, info);
+        }
+        return info;
+    };
+    // Each query is [union, selectors]: the comma-joined union walks the DOM
+    // once; if one selector is invalid the union throws, so fall back to
+    // querying the selectors one at a time and skipping the bad one
+    const match = ([union, selectors]) => {
+        let elements;
+        try {
+            elements = document.querySelectorAll(union);
+        } catch (e) {
+            elements = new Set();
+            for (const selector of selectors) {
+                try {
+                    for (const el of document.querySelectorAll(selector)) elements.add(el);
+                } catch (e) {
+                    continue;
+                }
+            }
+        }
+        return Array.from(elements, describe);
+    };
+    return {
+        viewport_height: window.innerHeight,
+        patterns: patterns.map(([type, query]) => [type, match(query)]),
+        buttons: match(buttons),
+        links: match(['a[href]', ['a[href]']]),
+    };
+}
+"""
+
+
 class FeatureType(str, Enum):
     """Types of interactive features."""
     NAVIGATION = "navigation"
@@ -51,6 +144,64 @@ class DiscoveredFeature:
     test_cases: List[Dict[str, Any]] = field(default_factory=list)
 
 
+# Expected behavior per feature type; BUTTON is described from its text
+_BEHAVIORS: Dict[FeatureType, str] = {
+    FeatureType.WHATSAPP: "Should open WhatsApp chat with pre-filled message",
+    FeatureType.FORM: "Should validate inputs and submit data to server",
+    FeatureType.NAVIGATION: "Should navigate to linked pages",
+    FeatureType.SEARCH: "Should filter/search content based on query",
+    FeatureType.ACCORDION: "Should expand/collapse content sections",
+    FeatureType.DROPDOWN: "Should show options and allow selection",
+    FeatureType.MODAL: "Should open dialog overlay",
+    FeatureType.CAROUSEL: "Should cycle through slides",
+    FeatureType.GALLERY: "Should display images with lightbox",
+    FeatureType.SOCIAL: "Should open social media profile in new tab",
+    FeatureType.VIDEO: "Should play video content",
+    FeatureType.MAP: "Should display interactive map",
+    FeatureType.CHAT: "Should open live chat widget",
+    FeatureType.COOKIE_BANNER: "Should allow accept/reject cookies",
+    FeatureType.LINK: "Should navigate to destination URL",
+}
+
+# Test cases per feature type, with a generic fallback for the rest
+_TEST_CASES: Dict[FeatureType, List[Dict[str, str]]] = {
+    FeatureType.WHATSAPP: [
+        {"name": "Click opens WhatsApp", "action": "click", "expected": "Opens wa.me link"},
+        {"name": "Phone number format", "action": "verify", "expected": "Valid phone number"},
+        {"name": "Opens in new tab", "action": "verify", "expected": "target=_blank"},
+    ],
+    FeatureType.FORM: [
+        {"name": "Required field validation", "action": "submit_empty", "expected": "Shows validation error"},
+        {"name": "Valid submission", "action": "submit_valid", "expected": "Success message or redirect"},
+        {"name": "Error display", "action": "submit_invalid", "expected": "Shows appropriate error"},
+    ],
+    FeatureType.NAVIGATION: [
+        {"name": "All links clickable", "action": "click_all", "expected": "No broken links"},
+        {"name": "Current page indicator", "action": "verify", "expected": "Active state shown"},
+        {"name": "Mobile menu toggle", "action": "toggle_mobile", "expected": "Menu opens/closes"},
+    ],
+    FeatureType.BUTTON: [
+        {"name": "Click triggers action", "action": "click", "expected": "Expected action occurs"},
+        {"name": "Keyboard accessible", "action": "press_enter", "expected": "Same as click"},
+        {"name": "Visual feedback", "action": "hover", "expected": "Hover state visible"},
+    ],
+    FeatureType.ACCORDION: [
+        {"name": "Toggle open/close", "action": "click", "expected": "Content expands/collapses"},
+        {"name": "Multiple open allowed", "action": "click_multiple", "expected": "Depends on design"},
+        {"name": "Keyboard navigation", "action": "keyboard", "expected": "Arrow keys work"},
+    ],
+    FeatureType.SOCIAL: [
+        {"name": "Link is valid", "action": "verify_href", "expected": "Valid social URL"},
+        {"name": "Opens in new tab", "action": "verify", "expected": "target=_blank"},
+    ],
+}
+
+_DEFAULT_TEST_CASES: List[Dict[str, str]] = [
+    {"name": "Element visible", "action": "verify", "expected": "Element is visible"},
+    {"name": "Interaction works", "action": "interact", "expected": "Expected behavior occurs"},
+]
+
+
 class FeatureDiscovery:
     """
     Discovers all interactive features on a page.
@@ -144,10 +295,37 @@ class FeatureDiscovery:
         ],
     }
 
-    def __init__(self, page: Optional[Page] = None):
+    # Generic clickable elements, discovered after the typed patterns
+    BUTTON_SELECTORS = [
+        "button",
+        "[role='button']",
+        "input[type='submit']",
+        "input[type='button']",
+        ".btn",
+        ".button",
+        "a.cta",
+    ]
+
+    # Prebuilt [union, selectors] queries for DISCOVER_JS
+    _PATTERN_QUERIES = [
+        [t.value, [", ".join(selectors), selectors]] for t, selectors in FEATURE_PATTERNS.items()
+    ]
+    _BUTTON_QUERY = [", ".join(BUTTON_SELECTORS), BUTTON_SELECTORS]
+
+    def __init__(self, page: Optional[Page] = None, wait_until: Optional[str] = None):
         self.page = page
+        # "domcontentloaded" by default; pass "networkidle" for pages whose
+        # features only appear after late XHRs
+        self.wait_until = wait_until or get_config().playwright_wait_until
         self.features: List[DiscoveredFeature] = []
         self.feature_count = 0
+        self._viewport_height: Optional[float] = None
+        # Element ids already recorded, so dedup is a set lookup
+        self._seen_ids: Set[str] = set()
+        # Summary columns, filled as features are added
+        self._types: List[str] = []
+        self._locations: List[str] = []
+        self._test_case_count = 0
 
     async def discover_all(self, url: Optional[str] = None) -> List[DiscoveredFeature]:
         """
@@ -160,102 +338,151 @@ class FeatureDiscovery:
             List of discovered features
         """
         if url and self.page:
-            await self.page.goto(url)
-            await self.page.wait_for_load_state("networkidle")
+            await self._goto(url)
 
         if not self.page:
             raise ValueError("No page available for discovery")
 
         logger.info(f"Starting feature discovery on {self.page.url}")
 
-        # Discover by pattern
-        for feature_type, selectors in self.FEATURE_PATTERNS.items():
-            await self._discover_by_selectors(feature_type, selectors)
+        # One browser call runs every selector and describes every match
+        try:
+            found = await self.page.evaluate(DISCOVER_JS, {
+                "patterns": self._PATTERN_QUERIES,
+                "buttons": self._BUTTON_QUERY,
+            })
+        except Exception as e:
+            logger.warning(f"Feature discovery failed on {self.page.url}: {e}")
+            return self.features
+        self._record(found)
+
+        logger.info(f"Discovered {len(self.features)} interactive features")
+        return self.features
+
+    def discover_static(self, html: str) -> List[DiscoveredFeature]:
+        """
+        Discover features in server-rendered HTML without a browser.
 
-        # Discover generic buttons and links
-        await self._discover_buttons()
-        await self._discover_links()
+        Runs the same selectors as discover_all. Elements have no layout, so
+        anything outside the header, footer, nav or sidebar is "Main content".
 
-        # Infer behaviors for each feature
-        for feature in self.features:
+        Args:
+            html: Page HTML
+
+        Returns:
+            List of discovered features
+        """
+        if not SELECTOLAX_AVAILABLE:
+            raise RuntimeError("Static discovery requires selectolax (pip install proofkit[fast])")
+
+        tree = LexborHTMLParser(html)
+        described: Dict[int, Dict[str, Any]] = {}
+        # Nodes that start each page region, for the closest() walk
+        regions = {
+            key: {node.mem_id for node in tree.css(selector)}
+            for key, selector in _LOCATION_SELECTORS.items()
+        }
+
+        def match(query) -> List[Dict[str, Any]]:
+            union, selectors = query
+            try:
+                nodes = tree.css(union)
+            except SelectolaxError:
+                nodes = []
+                for selector in selectors:
+                    try:
+                        nodes.extend(tree.css(selector))
+                    except SelectolaxError:
+                        continue
+            # The union can return a node once per selector it matches
+            unique = {}
+            for node in nodes:
+                unique.setdefault(node.mem_id, node)
+            infos = []
+            for key, node in unique.items():
+                if key not in described:
+                    described[key] = self._describe_node(node, regions)
+                infos.append(described[key])
+            return infos
+
+        self._record({
+            "viewport_height": None,
+            "patterns": [[t, match(query)] for t, query in self._PATTERN_QUERIES],
+            "buttons": match(self._BUTTON_QUERY),
+            "links": match(["a[href]", ["a[href]"]]),
+        })
+
+        logger.info(f"Discovered {len(self.features)} interactive features from static HTML")
+        return self.features
+
+    @staticmethod
+    def needs_browser(html: str) -> bool:
+        """Whether the page's features only appear once JavaScript has run."""
+        tree = LexborHTMLParser(html)
+        if tree.body is None or not tree.body.text(strip=True):
+            return True
+        return tree.css_first(_SPA_MOUNT_SELECTOR) is not None
+
+    @staticmethod
+    def _describe_node(node, regions: Dict[str, Set[int]]) -> Dict[str, Any]:
+        """Describe a parsed node the way DISCOVER_JS describes an element."""
+        attrs = node.attributes
+        info = {
+            "tag": node.tag,
+            "class": attrs.get("class") or "",
+            "id": attrs.get("id") or "",
+            "href": attrs.get("href") or "",
+            "text": node.text(separator=" ", strip=True)[:100],
+        }
+        ancestors = set()
+        while node is not None and node.is_element_node:
+            ancestors.add(node.mem_id)
+            node = node.parent
+        for key, region in regions.items():
+            info[key] = not ancestors.isdisjoint(region)
+        info["y"] = None
+        return info
+
+    def _record(self, found: Dict[str, Any]) -> None:
+        """Turn DISCOVER_JS-shaped results into features."""
+        self._viewport_height = found.get("viewport_height")
+        first_new = len(self.features)
+
+        for type_value, infos in found["patterns"]:
+            for info in infos:
+                self._add_feature(info, FeatureType(type_value))
+
+        # Generic buttons and links skip elements already discovered by id
+        for info in found["buttons"]:
+            if not self._is_already_discovered(info):
+                self._add_feature(info, FeatureType.BUTTON)
+        for info in found["links"]:
+            # Skip anchor links
+            if info["href"] and not info["href"].startswith("#") and not self._is_already_discovered(info):
+                self._add_feature(info, FeatureType.LINK)
+
+        # Infer behaviors for each new feature
+        for feature in self.features[first_new:]:
             feature.expected_behavior = self._infer_behavior(feature)
             feature.test_cases = self._generate_test_cases(feature)
+            self._test_case_count += len(feature.test_cases)
 
-        logger.info(f"Discovered {len(self.features)} interactive features")
-        return self.features
+    async def _goto(self, url: str) -> None:
+        """Navigate without waiting for network idle unless configured to."""
+        await self.page.goto(url, wait_until=self.wait_until)
 
-    async def _discover_by_selectors(
-        self,
-        feature_type: FeatureType,
-        selectors: List[str]
-    ):
-        """Discover features by CSS selectors."""
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    await self._add_feature(element, feature_type)
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
-
-    async def _discover_buttons(self):
-        """Discover all button elements."""
-        selectors = [
-            "button",
-            "[role='button']",
-            "input[type='submit']",
-            "input[type='button']",
-            ".btn",
-            ".button",
-            "a.cta",
-        ]
-
-        for selector in selectors:
+        if self.wait_until == "domcontentloaded":
+            # Analytics heartbeats can keep the network busy for good; give
+            # the load event a short chance instead
             try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    if not await self._is_already_discovered(element):
-                        await self._add_feature(element, FeatureType.BUTTON)
+                await self.page.wait_for_load_state("load", timeout=LOAD_GRACE_MS)
             except Exception:
-                continue
+                pass
 
-    async def _discover_links(self):
-        """Discover all link elements."""
-        try:
-            links = await self.page.query_selector_all("a[href]")
-            for link in links:
-                if not await self._is_already_discovered(link):
-                    href = await link.get_attribute("href") or ""
-                    # Skip anchor links and already-discovered
-                    if href and not href.startswith("#"):
-                        await self._add_feature(link, FeatureType.LINK)
-        except Exception:
-            pass
-
-    async def _add_feature(self, element, feature_type: FeatureType):
+    def _add_feature(self, info: Dict[str, Any], feature_type: FeatureType):
         """Add a discovered feature."""
         self.feature_count += 1
-
-        try:
-            text = await element.inner_text()
-            text = text.strip()[:100] if text else ""
-        except Exception:
-            text = ""
-
-        try:
-            location = await self._get_element_location(element)
-        except Exception:
-            location = "unknown"
-
-        try:
-            tag = await element.evaluate("el => el.tagName.toLowerCase()")
-            class_name = await element.get_attribute("class") or ""
-            element_id = await element.get_attribute("id") or ""
-        except Exception:
-            tag = "unknown"
-            class_name = ""
-            element_id = ""
+        tag, class_name, element_id = info["tag"], info["class"], info["id"]
 
         # Build selector
         selector_parts = [tag]
@@ -270,8 +497,8 @@ class FeatureDiscovery:
             id=f"feat_{self.feature_count:04d}",
             type=feature_type,
             element="".join(selector_parts),
-            location=location,
-            text=text,
+            location=self._get_element_location(info),
+            text=info["text"],
             expected_behavior="",  # Will be inferred
             attributes={
                 "tag": tag,
@@ -281,181 +508,140 @@ class FeatureDiscovery:
         )
 
         self.features.append(feature)
+        self._types.append(feature_type.value)
+        self._locations.append(feature.location)
+        if element_id:
+            self._seen_ids.add(element_id)
 
-    async def _get_element_location(self, element) -> str:
+    def _get_element_location(self, info: Dict[str, Any]) -> str:
         """Determine where the element is on the page."""
-        try:
-            # Check if in header
-            in_header = await element.evaluate(
-                "el => !!el.closest('header, .header, [role=\"banner\"]')"
-            )
-            if in_header:
-                return "Header"
-
-            # Check if in footer
-            in_footer = await element.evaluate(
-                "el => !!el.closest('footer, .footer, [role=\"contentinfo\"]')"
-            )
-            if in_footer:
-                return "Footer"
-
-            # Check if in nav
-            in_nav = await element.evaluate(
-                "el => !!el.closest('nav, .nav, [role=\"navigation\"]')"
-            )
-            if in_nav:
-                return "Navigation"
-
-            # Check if in sidebar
-            in_sidebar = await element.evaluate(
-                "el => !!el.closest('aside, .sidebar, [role=\"complementary\"]')"
-            )
-            if in_sidebar:
-                return "Sidebar"
-
-            # Check position on page
-            box = await element.bounding_box()
-            if box:
-                viewport_height = await self.page.evaluate("window.innerHeight")
-                if box["y"] < viewport_height:
-                    return "Above the fold"
-                return "Below the fold"
-
-            return "Main content"
-
-        except Exception:
-            return "Unknown"
-
-    async def _is_already_discovered(self, element) -> bool:
-        """Check if element is already in discovered features."""
-        try:
-            element_id = await element.get_attribute("id")
-            if element_id:
-                for f in self.features:
-                    if f.attributes.get("id") == element_id:
-                        return True
-        except Exception:
-            pass
-        return False
+        if info.get("in_header"):
+            return "Header"
+        if info.get("in_footer"):
+            return "Footer"
+        if info.get("in_nav"):
+            return "Navigation"
+        if info.get("in_sidebar"):
+            return "Sidebar"
+
+        # Check position on page
+        if info.get("y") is not None and self._viewport_height is not None:
+            if info["y"] < self._viewport_height:
+                return "Above the fold"
+            return "Below the fold"
+
+        return "Main content"
+
+    def _is_already_discovered(self, info: Dict[str, Any]) -> bool:
+        """Check if an element with the same id is already in discovered features."""
+        return bool(info["id"]) and info["id"] in self._seen_ids
 
     def _infer_behavior(self, feature: DiscoveredFeature) -> str:
         """Infer expected behavior based on feature type and attributes."""
-        behaviors = {
-            FeatureType.WHATSAPP: "Should open WhatsApp chat with pre-filled message",
-            FeatureType.FORM: "Should validate inputs and submit data to server",
-            FeatureType.NAVIGATION: "Should navigate to linked pages",
-            FeatureType.SEARCH: "Should filter/search content based on query",
-            FeatureType.ACCORDION: "Should expand/collapse content sections",
-            FeatureType.DROPDOWN: "Should show options and allow selection",
-            FeatureType.MODAL: "Should open dialog overlay",
-            FeatureType.CAROUSEL: "Should cycle through slides",
-            FeatureType.GALLERY: "Should display images with lightbox",
-            FeatureType.SOCIAL: "Should open social media profile in new tab",
-            FeatureType.VIDEO: "Should play video content",
-            FeatureType.MAP: "Should display interactive map",
-            FeatureType.CHAT: "Should open live chat widget",
-            FeatureType.COOKIE_BANNER: "Should allow accept/reject cookies",
-            FeatureType.BUTTON: f"Should perform action: {feature.text or 'click action'}",
-            FeatureType.LINK: "Should navigate to destination URL",
-        }
-
-        return behaviors.get(feature.type, "Unknown behavior")
+        if feature.type == FeatureType.BUTTON:
+            return f"Should perform action: {feature.text or 'click action'}"
+        return _BEHAVIORS.get(feature.type, "Unknown behavior")
 
     def _generate_test_cases(self, feature: DiscoveredFeature) -> List[Dict[str, Any]]:
         """Generate test cases for a feature."""
-        test_cases = []
-
-        if feature.type == FeatureType.WHATSAPP:
-            test_cases = [
-                {"name": "Click opens WhatsApp", "action": "click", "expected": "Opens wa.me link"},
-                {"name": "Phone number format", "action": "verify", "expected": "Valid phone number"},
-                {"name": "Opens in new tab", "action": "verify", "expected": "target=_blank"},
-            ]
-
-        elif feature.type == FeatureType.FORM:
-            test_cases = [
-                {"name": "Required field validation", "action": "submit_empty", "expected": "Shows validation error"},
-                {"name": "Valid submission", "action": "submit_valid", "expected": "Success message or redirect"},
-                {"name": "Error display", "action": "submit_invalid", "expected": "Shows appropriate error"},
-            ]
-
-        elif feature.type == FeatureType.NAVIGATION:
-            test_cases = [
-                {"name": "All links clickable", "action": "click_all", "expected": "No broken links"},
-                {"name": "Current page indicator", "action": "verify", "expected": "Active state shown"},
-                {"name": "Mobile menu toggle", "action": "toggle_mobile", "expected": "Menu opens/closes"},
-            ]
-
-        elif feature.type == FeatureType.BUTTON:
-            test_cases = [
-                {"name": "Click triggers action", "action": "click", "expected": "Expected action occurs"},
-                {"name": "Keyboard accessible", "action": "press_enter", "expected": "Same as click"},
-                {"name": "Visual feedback", "action": "hover", "expected": "Hover state visible"},
-            ]
-
-        elif feature.type == FeatureType.ACCORDION:
-            test_cases = [
-                {"name": "Toggle open/close", "action": "click", "expected": "Content expands/collapses"},
-                {"name": "Multiple open allowed", "action": "click_multiple", "expected": "Depends on design"},
-                {"name": "Keyboard navigation", "action": "keyboard", "expected": "Arrow keys work"},
-            ]
-
-        elif feature.type == FeatureType.SOCIAL:
-            test_cases = [
-                {"name": "Link is valid", "action": "verify_href", "expected": "Valid social URL"},
-                {"name": "Opens in new tab", "action": "verify", "expected": "target=_blank"},
-            ]
-
-        else:
-            test_cases = [
-                {"name": "Element visible", "action": "verify", "expected": "Element is visible"},
-                {"name": "Interaction works", "action": "interact", "expected": "Expected behavior occurs"},
-            ]
-
-        return test_cases
+        # Copies, so editing one feature's cases leaves the others alone
+        cases = _TEST_CASES.get(feature.type, _DEFAULT_TEST_CASES)
+        return [dict(case) for case in cases]
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of discovered features."""
-        by_type = {}
-        by_location = {}
-
-        for f in self.features:
-            # Count by type
-            type_key = f.type.value
-            by_type[type_key] = by_type.get(type_key, 0) + 1
-
-            # Count by location
-            by_location[f.location] = by_location.get(f.location, 0) + 1
-
         return {
-            "total_features": len(self.features),
-            "by_type": by_type,
-            "by_location": by_location,
-            "test_cases_generated": sum(len(f.test_cases) for f in self.features),
+            "total_features": len(self._types),
+            "by_type": dict(Counter(self._types)),
+            "by_location": dict(Counter(self._locations)),
+            "test_cases_generated": self._test_case_count,
         }
 
 
-async def discover_features(url: str) -> List[DiscoveredFeature]:
+async def discover_features(url: str, wait_until: Optional[str] = None) -> List[DiscoveredFeature]:
     """
     Convenience function to discover features on a URL.
 
     Args:
         url: URL to analyze
+        wait_until: Playwright load state to wait for (defaults to config)
 
     Returns:
         List of discovered features
-    """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-
-        try:
-            await page.goto(url)
-            await page.wait_for_load_state("networkidle")
 
-            discovery = FeatureDiscovery(page)
-            features = await discovery.discover_all()
-
-            return features
-        finally:
-            await browser.close()
+    The browser stays open for later calls on the same event loop; call
+    shutdown_browser_pool() before the loop ends.
+    """
+    # Server-rendered pages are parsed directly; the browser is only
+    # launched for client-rendered pages or when the fetch fails
+    if SELECTOLAX_AVAILABLE:
+        html = await _fetch_html(url)
+        if html is not None and not FeatureDiscovery.needs_browser(html):
+            return FeatureDiscovery().discover_static(html)
+
+    browser = await _get_browser()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        discovery = FeatureDiscovery(page, wait_until=wait_until)
+        return await discovery.discover_all(url)
+    finally:
+        await context.close()
+
+
+async def _get_browser() -> Browser:
+    """Return the pooled browser for the running event loop, launching it once."""
+    loop = asyncio.get_running_loop()
+    launch = _browser_pool.get(loop)
+    if launch is not None and launch.done() and (
+        launch.exception() is not None or not launch.result()[1].is_connected()
+    ):
+        # Failed or crashed; launch a fresh one
+        await _close_pooled(_browser_pool.pop(loop))
+        launch = None
+    if launch is None:
+        # Stored as a task so concurrent callers share a single launch
+        launch = _browser_pool[loop] = asyncio.ensure_future(_launch_browser())
+    return (await launch)[1]
+
+
+async def _launch_browser() -> Tuple[Playwright, Browser]:
+    """Start Playwright and launch Chromium."""
+    playwright = await async_playwright().start()
+    try:
+        return playwright, await playwright.chromium.launch()
+    except Exception:
+        await playwright.stop()
+        raise
+
+
+async def _close_pooled(launch: "asyncio.Future") -> None:
+    """Close a pooled browser and its Playwright driver."""
+    try:
+        playwright, browser = await launch
+    except Exception:
+        return
+    try:
+        await browser.close()
+    finally:
+        await playwright.stop()
+
+
+async def shutdown_browser_pool() -> None:
+    """Close the pooled browser for the running event loop, if any."""
+    launch = _browser_pool.pop(asyncio.get_running_loop(), None)
+    if launch is not None:
+        await _close_pooled(launch)
+
+async def _fetch_html(url: str) -> Optional[str]:
+    """Fetch a page's HTML over plain HTTP, or None if that doesn't work."""
+    try:
+        async with httpx.AsyncClient(follow_redirects=True, timeout=STATIC_FETCH_TIMEOUT) as client:
+            response = await client.get(url)
+    except httpx.HTTPError as e:
+        logger.debug(f"Static fetch failed for {url}: {e}")
+        return None
+
+    if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+        return None
+    return response.text
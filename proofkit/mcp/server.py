@@ -8,8 +8,8 @@ Provides tools for Claude Code to interact with ProofKit:
 - Analyze websites
 """
 
-import json
 import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List
 from pathlib import Path
 
@@ -22,9 +22,89 @@ except ImportError:
     MCP_AVAILABLE = False
     Server = None
 
+from proofkit.utils import json_utils
 from proofkit.utils.logger import logger
 
 
+@lru_cache(maxsize=None)
+def _tools() -> List["Tool"]:
+    """Build the tool list once; it is the same for every list_tools call."""
+    return [
+        Tool(
+            name="proofkit_audit",
+            description="Run a website audit and get findings",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "URL to audit"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["fast", "full"],
+                        "description": "Audit mode (fast=homepage, full=crawl)",
+                        "default": "fast"
+                    },
+                    "business_type": {
+                        "type": "string",
+                        "description": "Business type for context (optional)"
+                    }
+                },
+                "required": ["url"]
+            }
+        ),
+        Tool(
+            name="proofkit_discover_features",
+            description="Discover interactive features on a webpage",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "URL to analyze"
+                    }
+                },
+                "required": ["url"]
+            }
+        ),
+        Tool(
+            name="proofkit_analyze",
+            description="Analyze collected data and return findings",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "run_dir": {
+                        "type": "string",
+                        "description": "Path to run directory with raw data"
+                    }
+                },
+                "required": ["run_dir"]
+            }
+        ),
+        Tool(
+            name="proofkit_generate_report",
+            description="Generate a formatted report from audit results",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "run_dir": {
+                        "type": "string",
+                        "description": "Path to run directory"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "markdown", "pencil"],
+                        "description": "Report format",
+                        "default": "markdown"
+                    }
+                },
+                "required": ["run_dir"]
+            }
+        ),
+    ]
+
+
 def create_mcp_server():
     """Create and configure the MCP server."""
     if not MCP_AVAILABLE:
@@ -37,80 +117,7 @@ def create_mcp_server():
     @server.list_tools()
     async def list_tools() -> List[Tool]:
         """List available ProofKit tools."""
-        return [
-            Tool(
-                name="proofkit_audit",
-                description="Run a website audit and get findings",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to audit"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["fast", "full"],
-                            "description": "Audit mode (fast=homepage, full=crawl)",
-                            "default": "fast"
-                        },
-                        "business_type": {
-                            "type": "string",
-                            "description": "Business type for context (optional)"
-                        }
-                    },
-                    "required": ["url"]
-                }
-            ),
-            Tool(
-                name="proofkit_discover_features",
-                description="Discover interactive features on a webpage",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to analyze"
-                        }
-                    },
-                    "required": ["url"]
-                }
-            ),
-            Tool(
-                name="proofkit_analyze",
-                description="Analyze collected data and return findings",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "run_dir": {
-                            "type": "string",
-                            "description": "Path to run directory with raw data"
-                        }
-                    },
-                    "required": ["run_dir"]
-                }
-            ),
-            Tool(
-                name="proofkit_generate_report",
-                description="Generate a formatted report from audit results",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "run_dir": {
-                            "type": "string",
-                            "description": "Path to run directory"
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["json", "markdown", "pencil"],
-                            "description": "Report format",
-                            "default": "markdown"
-                        }
-                    },
-                    "required": ["run_dir"]
-                }
-            ),
-        ]
+        return _tools()
 
     @server.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -129,13 +136,13 @@ def create_mcp_server():
 
             return [TextContent(
                 type="text",
-                text=json.dumps(result, indent=2, default=str)
+                text=json_utils.dumps(result, indent=True).decode("utf-8")
             )]
         except Exception as e:
             logger.error(f"Tool {name} failed: {e}")
             return [TextContent(
                 type="text",
-                text=json.dumps({"error": str(e)})
+                text=json_utils.dumps({"error": str(e)}).decode("utf-8")
             )]
 
     return server
@@ -211,7 +218,6 @@ async def discover_features(args: Dict[str, Any]) -> Dict[str, Any]:
 
 async def analyze_data(args: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze collected raw data."""
-    import json as json_module
     from proofkit.collector.models import RawData
     from proofkit.analyzer.engine import RuleEngine
 
@@ -221,8 +227,8 @@ async def analyze_data(args: Dict[str, Any]) -> Dict[str, Any]:
     if not raw_data_path.exists():
         return {"error": f"Raw data not found at {raw_data_path}"}
 
-    data_dict = json_module.loads(raw_data_path.read_text())
-    raw_data = RawData(**data_dict)
+    # Validate straight from the bytes; no intermediate dict of the whole crawl
+    raw_data = RawData.model_validate_json(raw_data_path.read_bytes())
 
     engine = RuleEngine()
     findings, scores = engine.analyze(raw_data)
@@ -233,8 +239,8 @@ async def analyze_data(args: Dict[str, Any]) -> Dict[str, Any]:
         "findings": [
             {
                 "id": f.id,
-                "severity": f.severity.value if hasattr(f.severity, "value") else str(f.severity),
-                "category": f.category.value if hasattr(f.category, "value") else str(f.category),
+                "severity": f.severity,
+                "category": f.category,
                 "title": f.title,
                 "summary": f.summary,
             }
@@ -245,7 +251,6 @@ async def analyze_data(args: Dict[str, Any]) -> Dict[str, Any]:
 
 async def generate_report(args: Dict[str, Any]) -> Dict[str, Any]:
     """Generate a formatted report."""
-    import json as json_module
     from proofkit.schemas.report import Report
 
     run_dir = Path(args["run_dir"])
@@ -255,7 +260,7 @@ async def generate_report(args: Dict[str, Any]) -> Dict[str, Any]:
     if not report_path.exists():
         return {"error": f"Report not found at {report_path}"}
 
-    report_data = json_module.loads(report_path.read_text())
+    report_data = json_utils.loads(report_path.read_bytes())
     report = Report(**report_data)
 
     if report_format == "json":
@@ -269,8 +274,7 @@ async def generate_report(args: Dict[str, Any]) -> Dict[str, Any]:
             md += f"- {cat}: {score}/100\n"
         md += f"\n## Findings ({len(report.findings)} total)\n\n"
         for f in report.findings[:10]:
-            sev = f.severity.value if hasattr(f.severity, "value") else str(f.severity)
-            md += f"### [{sev}] {f.title}\n\n{f.summary}\n\n"
+            md += f"### [{f.severity}] {f.title}\n\n{f.summary}\n\n"
         return {"format": "markdown", "content": md}
 
     elif report_format == "pencil":
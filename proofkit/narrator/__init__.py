@@ -5,11 +5,22 @@ The Narrator transforms technical findings into persuasive, business-focused
 narratives and generates Lovable concept prompts.
 """
 
-from typing import List, Optional, Dict
+import hashlib
+import heapq
+import os
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Dict
 
 from proofkit.schemas.finding import Finding
 from proofkit.schemas.report import ReportNarrative
 from proofkit.schemas.business import BusinessType
+from proofkit.utils import json_utils
+from proofkit.utils.config import get_config
 from proofkit.utils.logger import logger
 
 from .claude_client import ClaudeClient
@@ -27,12 +38,23 @@ class Narrator:
     and Lovable redesign prompts.
     """
 
-    def __init__(self):
-        """Initialize the Narrator with AI client and builders."""
+    def __init__(self, cache_ttl: Optional[int] = None, cache_dir: Optional[Path] = None):
+        """
+        Initialize the Narrator with AI client and builders.
+
+        Args:
+            cache_ttl: Seconds to reuse a generated section for the same
+                prompt inputs; 0 disables (default: PROOFKIT_NARRATIVE_CACHE_TTL)
+            cache_dir: Where cached sections live (default: <output_dir>/.cache/narrator)
+        """
+        config = get_config()
         self.client = ClaudeClient()
         self.builder = NarrativeBuilder(self.client)
         self.concept_gen = ConceptGenerator(self.client)
         self.token_manager = TokenManager()
+        self.cache_ttl = config.narrative_cache_ttl if cache_ttl is None else cache_ttl
+        self.cache_dir = cache_dir or config.output_dir / ".cache" / "narrator"
+        self._model_key = self.client.get_model_key()
 
     def generate(
         self,
@@ -59,37 +81,51 @@ class Narrator:
         estimated_tokens = self.token_manager.estimate_usage(findings, generate_concept)
         self.token_manager.check_budget(estimated_tokens)
 
+        # The AI client is shared process-wide; completions it remembered for
+        # earlier audits must not bypass this narrator's cache settings
+        self.client.clear_response_cache()
+
         # Prepare findings summary for AI
         findings_summary = self._prepare_findings_summary(findings)
 
-        # Generate narrative sections
-        logger.debug("Generating executive summary")
-        executive_summary = self.builder.generate_executive_summary(
-            findings_summary,
-            business_type,
-            conversion_goal,
-        )
-
-        logger.debug("Generating quick wins")
-        quick_wins = self.builder.generate_quick_wins(findings_summary)
-
-        logger.debug("Generating strategic priorities")
-        strategic_priorities = self.builder.generate_strategic_priorities(
-            findings_summary,
-            business_type,
-        )
-
-        # Generate category insights
-        category_insights = self._generate_category_insights(findings, business_type)
-
-        # Generate concept prompts if requested
-        lovable_concept = None
-        if generate_concept:
-            logger.debug("Generating Lovable concept")
-            lovable_concept = self.concept_gen.generate_lovable_prompt(
-                findings_summary,
-                business_type,
-            )
+        # The AI sections don't depend on each other, so their requests run
+        # side by side; the wall clock is the slowest call, not the sum
+        logger.debug("Generating narrative sections")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                "executive_summary": pool.submit(
+                    self._cached,
+                    "executive_summary",
+                    self.builder.generate_executive_summary,
+                    findings_summary,
+                    business_type,
+                    conversion_goal,
+                ),
+                "quick_wins": pool.submit(
+                    self._cached, "quick_wins", self.builder.generate_quick_wins, findings_summary
+                ),
+                "strategic_priorities": pool.submit(
+                    self._cached,
+                    "strategic_priorities",
+                    self.builder.generate_strategic_priorities,
+                    findings_summary,
+                    business_type,
+                ),
+            }
+            # Generate concept prompts if requested
+            if generate_concept:
+                futures["lovable_concept"] = pool.submit(
+                    self._cached,
+                    "lovable_concept",
+                    self.concept_gen.generate_lovable_prompt,
+                    findings_summary,
+                    business_type,
+                )
+
+            # Generate category insights
+            category_insights = self._generate_category_insights(findings, business_type)
+
+        sections = {name: future.result() for name, future in futures.items()}
 
         # Track actual token usage
         self.token_manager.record_usage(self.client.get_total_usage())
@@ -97,34 +133,61 @@ class Narrator:
         logger.info("Narrative generation complete")
 
         return ReportNarrative(
-            executive_summary=executive_summary,
-            quick_wins=quick_wins,
-            strategic_priorities=strategic_priorities,
+            executive_summary=sections["executive_summary"],
+            quick_wins=sections["quick_wins"],
+            strategic_priorities=sections["strategic_priorities"],
             category_insights=category_insights,
-            lovable_concept=lovable_concept,
+            lovable_concept=sections.get("lovable_concept"),
         )
 
+    def _cached(self, section: str, generate: Callable[..., Any], *args: Any) -> Any:
+        """
+        Return a cached section for the same prompt inputs, or generate it.
+
+        The key covers the section's arguments and the provider and model
+        that answer the prompts. Failed
+        generations raise before anything is written, so errors are never
+        cached.
+        """
+        if self.cache_ttl <= 0:
+            return generate(*args)
+
+        key = hashlib.blake2b(json_utils.dumps([self._model_key, *args]), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / section / f"{key}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                logger.debug(f"Using cached {section}")
+                return json_utils.loads(cache_path.read_bytes())
+        except OSError:
+            pass
+        except ValueError:
+            logger.warning(f"Ignoring unreadable cached {section}")
+
+        value = generate(*args)
+
+        # Written atomically so concurrent runs never read a partial file
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+                f.write(json_utils.dumps(value))
+            os.replace(f.name, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache {section}: {e}")
+        return value
+
     def _prepare_findings_summary(self, findings: List[Finding]) -> str:
         """
         Prepare findings for AI consumption.
         Limit to top findings to save tokens.
         """
-        # Take top 15 findings by severity
-        severity_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-        top_findings = sorted(
-            findings,
-            key=lambda f: severity_order.get(
-                f.severity.value if hasattr(f.severity, "value") else str(f.severity),
-                4
-            )
-        )[:15]
+        # Take top 15 findings by severity. Severity values "P0".."P3" sort in
+        # rank order as plain strings, and nsmallest keeps sorted()'s stable order
+        top_findings = heapq.nsmallest(15, findings, key=attrgetter("severity"))
 
         summary_lines = []
         for f in top_findings:
-            severity = f.severity.value if hasattr(f.severity, "value") else str(f.severity)
-            category = f.category.value if hasattr(f.category, "value") else str(f.category)
             summary_lines.append(
-                f"[{severity}] {category}: {f.title}\n"
+                f"[{f.severity}] {f.category}: {f.title}\n"
                 f"  Impact: {f.impact}\n"
                 f"  Fix: {f.recommendation}"
             )
@@ -137,13 +200,10 @@ class Narrator:
         business_type: Optional[BusinessType] = None,
     ) -> Dict[str, str]:
         """Generate brief insights for each category with findings."""
-        # Group findings by category
-        by_category: Dict[str, List[Finding]] = {}
+        # Group findings by category; Finding stores enum fields as plain strings
+        by_category: Dict[str, List[Finding]] = defaultdict(list)
         for f in findings:
-            cat = f.category.value if hasattr(f.category, "value") else str(f.category)
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(f)
+            by_category[f.category].append(f)
 
         insights = {}
         for category, cat_findings in by_category.items():
@@ -151,8 +211,8 @@ class Narrator:
                 continue
 
             # Count severities
-            p0_count = sum(1 for f in cat_findings if self._get_severity(f) == "P0")
-            p1_count = sum(1 for f in cat_findings if self._get_severity(f) == "P1")
+            p0_count = sum(1 for f in cat_findings if f.severity == "P0")
+            p1_count = sum(1 for f in cat_findings if f.severity == "P1")
 
             # Generate simple insight
             if p0_count > 0:
@@ -164,12 +224,6 @@ class Narrator:
 
         return insights
 
-    def _get_severity(self, finding: Finding) -> str:
-        """Get severity value from finding."""
-        if hasattr(finding.severity, "value"):
-            return finding.severity.value
-        return str(finding.severity)
-
     def get_usage_report(self) -> Dict:
         """Get token usage statistics."""
         return self.token_manager.get_usage_report()
@@ -8,8 +8,11 @@ Allows flexible model selection based on task requirements:
 """
 
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Literal
+from typing import Optional, Dict, Literal, Tuple
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -89,6 +92,55 @@ TASK_MODEL_MAPPING = {
     "default": ModelTier.BALANCED,
 }
 
+# Completions kept per client to answer repeated identical requests, for
+# at most PROOFKIT_NARRATIVE_CACHE_TTL seconds
+RESPONSE_CACHE_SIZE = 128
+
+
+class _ResponseCache:
+    """Bounded LRU of completions keyed by everything sent to the model."""
+
+    def __init__(self, ttl: int, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple, text: str) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, text)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
 
 class BaseAIClient(ABC):
     """Abstract base class for AI clients."""
@@ -144,6 +196,9 @@ class OpenAIClient(BaseAIClient):
         self._last_usage: Dict[str, int] = {}
         self._total_usage: Dict[str, int] = {"input_tokens": 0, "output_tokens": 0}
         self._last_model_used: str = ""
+        # The narrator issues requests from several threads at once
+        self._usage_lock = threading.Lock()
+        self._cache = _ResponseCache(ttl=get_config().narrative_cache_ttl)
 
         logger.info(f"OpenAI client initialized with default model: {self.default_model}")
 
@@ -188,6 +243,14 @@ class OpenAIClient(BaseAIClient):
 
         self._last_model_used = model
 
+        cache_key = (model, system_prompt, user_prompt, max_tokens, temperature)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"OpenAI [{model}]: served from response cache")
+            with self._usage_lock:
+                self._last_usage = {"input_tokens": 0, "output_tokens": 0, "model": model}
+            return cached
+
         try:
             # Handle reasoning models differently (o1 series)
             if model.startswith("o1"):
@@ -212,20 +275,23 @@ class OpenAIClient(BaseAIClient):
 
             # Track usage
             if response.usage:
-                self._last_usage = {
-                    "input_tokens": response.usage.prompt_tokens,
-                    "output_tokens": response.usage.completion_tokens,
-                    "model": model,
-                }
-                self._total_usage["input_tokens"] += response.usage.prompt_tokens
-                self._total_usage["output_tokens"] += response.usage.completion_tokens
+                with self._usage_lock:
+                    self._last_usage = {
+                        "input_tokens": response.usage.prompt_tokens,
+                        "output_tokens": response.usage.completion_tokens,
+                        "model": model,
+                    }
+                    self._total_usage["input_tokens"] += response.usage.prompt_tokens
+                    self._total_usage["output_tokens"] += response.usage.completion_tokens
 
             logger.debug(
                 f"OpenAI [{model}]: {self._last_usage.get('input_tokens', 0)} in, "
                 f"{self._last_usage.get('output_tokens', 0)} out"
             )
 
-            return response.choices[0].message.content or ""
+            text = response.choices[0].message.content or ""
+            self._cache.put(cache_key, text)
+            return text
 
         except Exception as e:
             logger.error(f"OpenAI API error ({model}): {e}")
@@ -235,11 +301,19 @@ class OpenAIClient(BaseAIClient):
         return self._last_usage.copy()
 
     def get_total_usage(self) -> Dict[str, int]:
-        return self._total_usage.copy()
+        with self._usage_lock:
+            usage = self._total_usage.copy()
+        usage.update(self._cache.stats())
+        return usage
 
     def reset_usage(self) -> None:
-        self._last_usage = {}
-        self._total_usage = {"input_tokens": 0, "output_tokens": 0}
+        with self._usage_lock:
+            self._last_usage = {}
+            self._total_usage = {"input_tokens": 0, "output_tokens": 0}
+        self._cache.reset_stats()
+
+    def clear_response_cache(self) -> None:
+        self._cache.clear()
 
     def list_available_models(self) -> Dict[str, str]:
         return self.AVAILABLE_MODELS.copy()
@@ -274,6 +348,9 @@ class AnthropicClient(BaseAIClient):
         self._last_usage: Dict[str, int] = {}
         self._total_usage: Dict[str, int] = {"input_tokens": 0, "output_tokens": 0}
         self._last_model_used: str = ""
+        # The narrator issues requests from several threads at once
+        self._usage_lock = threading.Lock()
+        self._cache = _ResponseCache(ttl=config.narrative_cache_ttl)
 
         logger.info(f"Anthropic client initialized with default model: {self.default_model}")
 
@@ -318,6 +395,14 @@ class AnthropicClient(BaseAIClient):
 
         self._last_model_used = model
 
+        cache_key = (model, system_prompt, user_prompt, max_tokens, temperature)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Anthropic [{model}]: served from response cache")
+            with self._usage_lock:
+                self._last_usage = {"input_tokens": 0, "output_tokens": 0, "model": model}
+            return cached
+
         try:
             response = self.client.messages.create(
                 model=model,
@@ -330,20 +415,23 @@ class AnthropicClient(BaseAIClient):
             )
 
             # Track usage
-            self._last_usage = {
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-                "model": model,
-            }
-            self._total_usage["input_tokens"] += response.usage.input_tokens
-            self._total_usage["output_tokens"] += response.usage.output_tokens
+            with self._usage_lock:
+                self._last_usage = {
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
+                    "model": model,
+                }
+                self._total_usage["input_tokens"] += response.usage.input_tokens
+                self._total_usage["output_tokens"] += response.usage.output_tokens
 
             logger.debug(
                 f"Anthropic [{model}]: {self._last_usage['input_tokens']} in, "
                 f"{self._last_usage['output_tokens']} out"
             )
 
-            return response.content[0].text
+            text = response.content[0].text
+            self._cache.put(cache_key, text)
+            return text
 
         except Exception as e:
             logger.error(f"Anthropic API error ({model}): {e}")
@@ -353,11 +441,19 @@ class AnthropicClient(BaseAIClient):
         return self._last_usage.copy()
 
     def get_total_usage(self) -> Dict[str, int]:
-        return self._total_usage.copy()
+        with self._usage_lock:
+            usage = self._total_usage.copy()
+        usage.update(self._cache.stats())
+        return usage
 
     def reset_usage(self) -> None:
-        self._last_usage = {}
-        self._total_usage = {"input_tokens": 0, "output_tokens": 0}
+        with self._usage_lock:
+            self._last_usage = {}
+            self._total_usage = {"input_tokens": 0, "output_tokens": 0}
+        self._cache.reset_stats()
+
+    def clear_response_cache(self) -> None:
+        self._cache.clear()
 
     def list_available_models(self) -> Dict[str, str]:
         return self.AVAILABLE_MODELS.copy()
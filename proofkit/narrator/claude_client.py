@@ -49,6 +49,10 @@ class ClaudeClient:
             max_tokens=max_tokens or 1500,
         )
 
+    def get_model_key(self) -> str:
+        """Identify the provider and model that answer generate(), e.g. 'OpenAIClient:gpt-4o-mini'."""
+        return f"{type(self._client).__name__}:{self._client.default_model}"
+
     def get_last_usage(self) -> Dict[str, int]:
         """Get token usage from last request."""
         return self._client.get_last_usage()
@@ -64,6 +68,11 @@ class ClaudeClient:
         if hasattr(self._client, 'reset_usage'):
             self._client.reset_usage()
 
+    def clear_response_cache(self) -> None:
+        """Forget completions remembered for identical requests."""
+        if hasattr(self._client, 'clear_response_cache'):
+            self._client.clear_response_cache()
+
     def estimate_tokens(self, text: str) -> int:
         """
         Rough estimate of token count.
@@ -35,6 +35,7 @@ class AuditConfig(BaseModel):
     generate_concept: bool = False
     competitor_urls: List[str] = []
     auto_detect_business: bool = False
+    narrative_cache: bool = Field(True, description="Reuse a cached narrative for identical findings")
     max_pages: int = Field(5, description="Max pages for fast mode")
     timeout: int = Field(60000, description="Playwright timeout in ms")
 
@@ -1,6 +1,6 @@
 """Finding and evidence models for audit results."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict
 from enum import Enum
 
@@ -57,4 +57,10 @@ class Finding(BaseModel):
     tags: List[str] = []
     confidence: float = Field(1.0, ge=0, le=1, description="Detection confidence 0-1")
 
+    @field_validator("category", "severity", mode="before")
+    @classmethod
+    def _plain_value(cls, value):
+        """Store enum members as their string value, so consumers can use them directly."""
+        return value.value if isinstance(value, Enum) else value
+
     model_config = {"use_enum_values": True}
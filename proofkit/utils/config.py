@@ -18,9 +18,15 @@ class ProofKitSettings(BaseSettings):
 
     # Collector settings
     playwright_timeout: int = Field(default=60000, alias="PROOFKIT_PLAYWRIGHT_TIMEOUT")
+    playwright_concurrency: int = Field(default=4, alias="PROOFKIT_PLAYWRIGHT_CONCURRENCY")
+    playwright_wait_until: str = Field(default="domcontentloaded", alias="PROOFKIT_PLAYWRIGHT_WAIT_UNTIL")
+    screenshot_format: str = Field(default="jpeg", alias="PROOFKIT_SCREENSHOT_FORMAT")
+    playwright_state_ttl: int = Field(default=3600, alias="PROOFKIT_PLAYWRIGHT_STATE_TTL")
     lighthouse_throttling: str = Field(default="mobile", alias="PROOFKIT_LIGHTHOUSE_THROTTLING")
     max_pages_fast: int = Field(default=5, alias="PROOFKIT_MAX_PAGES_FAST")
     max_pages_full: int = Field(default=50, alias="PROOFKIT_MAX_PAGES_FULL")
+    lighthouse_cache_ttl: int = Field(default=3600, alias="PROOFKIT_LIGHTHOUSE_CACHE_TTL")
+    stack_categories: str = Field(default="", alias="PROOFKIT_STACK_CATEGORIES")
 
     # Analyzer settings
     score_weights: Dict[str, float] = Field(default={
@@ -35,6 +41,7 @@ class ProofKitSettings(BaseSettings):
     # Narrator settings
     ai_model: str = Field(default="claude-sonnet-4-20250514", alias="PROOFKIT_AI_MODEL")
     ai_max_tokens: int = Field(default=2000, alias="PROOFKIT_AI_MAX_TOKENS")
+    narrative_cache_ttl: int = Field(default=86400, alias="PROOFKIT_NARRATIVE_CACHE_TTL")
 
     # Logging
     log_level: str = Field(default="INFO", alias="PROOFKIT_LOG_LEVEL")
@@ -0,0 +1,118 @@
+"""JSON helpers that use orjson and pysimdjson when they are installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    simdjson = None
+    SIMDJSON_AVAILABLE = False
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Parse a JSON document.
+
+    orjson parses bytes directly without an intermediate str decode.
+    Decode errors from either backend are json.JSONDecodeError subclasses.
+
+    Args:
+        data: JSON document as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    orjson writes bytes directly from its C core; the stdlib fallback
+    produces the same layout. Values JSON can't represent are passed
+    through str().
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        obj,
+        default=str,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def loads_lazy(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """
+    Parse a JSON document, building Python objects only for values accessed.
+
+    With pysimdjson the result is a read-only proxy supporting get(),
+    keys(), [] and at_pointer(); untouched subtrees are never converted to
+    Python objects. Without it this falls back to loads(), so callers
+    should stick to get(), keys() and [] access.
+
+    Args:
+        data: JSON document as UTF-8 bytes
+
+    Returns:
+        Parsed document
+    """
+    if SIMDJSON_AVAILABLE:
+        try:
+            # A fresh parser per call: reusing one invalidates earlier documents
+            return simdjson.Parser().parse(bytes(data))
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    return loads(data)
+
+
+def get_pointer(doc: Any, pointer: str, default: Any = None) -> Any:
+    """
+    Look up a single value by JSON Pointer (RFC 6901), e.g. "/audits/dom-size/score".
+
+    On a loads_lazy() document backed by pysimdjson this walks the parsed
+    tape and converts only the value found. Plain dicts and lists are
+    walked in Python.
+
+    Args:
+        doc: Document returned by loads() or loads_lazy()
+        pointer: JSON Pointer to the value
+        default: Returned when any part of the path is missing
+
+    Returns:
+        The value at pointer, or default
+    """
+    if hasattr(doc, "at_pointer"):
+        try:
+            return doc.at_pointer(pointer)
+        except (LookupError, TypeError):
+            return default
+
+    value = doc
+    for token in pointer.split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            value = value[int(token) if isinstance(value, list) else token]
+        except (LookupError, TypeError, ValueError):
+            return default
+    return value
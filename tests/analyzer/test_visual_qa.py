@@ -52,6 +52,17 @@ class TestVisualQARules:
             rules = VisualQARules(sample_raw_data)
             assert rules._vision_available is False
 
+    def test_screenshot_media_type_follows_extension(self, sample_raw_data, tmp_path):
+        """Test JPEG screenshots are sent to the vision API as image/jpeg."""
+        screenshot = tmp_path / "home_desktop.jpg"
+        screenshot.write_bytes(b"\xff\xd8\xff")
+        rules = VisualQARules(sample_raw_data)
+
+        with patch.object(rules, "_call_vision_api", return_value="[]") as call:
+            rules._analyze_screenshot(str(screenshot), "https://example.com")
+
+        assert call.call_args.args[1:] == (False, "image/jpeg")
+
     def test_parse_visual_findings_empty(self, sample_raw_data):
         """Test parsing empty visual findings."""
         rules = VisualQARules(sample_raw_data)
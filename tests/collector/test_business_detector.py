@@ -29,7 +29,7 @@ class TestKeywordScoring:
         or villa for sale. View floor plans and schedule a virtual tour.
         Properties starting from $200,000. Contact our real estate agents today.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.REAL_ESTATE in scores
         assert scores[BusinessType.REAL_ESTATE] > 0
@@ -44,7 +44,7 @@ class TestKeywordScoring:
         Free shipping on orders over $50. Browse our product catalog.
         In stock and ready to ship. Best deals and discounts.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.ECOMMERCE in scores
         best_type = max(scores, key=scores.get)
@@ -58,7 +58,7 @@ class TestKeywordScoring:
         Features include API integrations, team collaboration,
         and workflow automation. Sign up for the business plan.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.SAAS in scores
         best_type = max(scores, key=scores.get)
@@ -71,7 +71,7 @@ class TestKeywordScoring:
         Book a table for dinner. Our cuisine features fresh
         local ingredients. Daily lunch specials available.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.RESTAURANT in scores
         best_type = max(scores, key=scores.get)
@@ -84,7 +84,7 @@ class TestKeywordScoring:
         Check-in is at 3pm. Amenities include spa, pool, and restaurant.
         View availability and rates per night. Guest services available.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.HOSPITALITY in scores
         best_type = max(scores, key=scores.get)
@@ -97,7 +97,7 @@ class TestKeywordScoring:
         available for medical records. Clinic services include
         primary care and specialist consultations. Insurance accepted.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.HEALTHCARE in scores
         best_type = max(scores, key=scores.get)
@@ -110,7 +110,7 @@ class TestKeywordScoring:
         offers design, development, and marketing services.
         Meet our team and see client testimonials.
         """
-        scores = detector._calculate_scores(text.lower())
+        scores = detector._calculate_scores(detector._to_lower_bytes(text))
 
         assert BusinessType.AGENCY in scores
         best_type = max(scores, key=scores.get)
@@ -259,33 +259,47 @@ class TestKeywordMatches:
     def test_get_keyword_matches(self):
         detector = BusinessDetector()
         text = "property bedroom villa for sale apartment sqft"
-        matches = detector._get_keyword_matches(text, BusinessType.REAL_ESTATE)
+        matches = detector._get_keyword_matches(detector._to_lower_bytes(text), BusinessType.REAL_ESTATE)
 
         assert "property" in matches
         assert "bedroom" in matches
         assert "villa" in matches
         assert len(matches) > 0
 
+    def test_get_keyword_matches_mixed_case(self):
+        detector = BusinessDetector()
+        text = "Luxury PROPERTY with 3 Bedrooms"
+        matches = detector._get_keyword_matches(detector._to_lower_bytes(text), BusinessType.REAL_ESTATE)
+
+        assert "property" in matches
+        assert "bedrooms" in matches
+
+    def test_helpers_reject_unnormalized_text(self):
+        detector = BusinessDetector()
+
+        with pytest.raises(AssertionError):
+            detector._get_keyword_matches(b"Luxury PROPERTY", BusinessType.REAL_ESTATE)
+
 
 class TestIndustrySignals:
     def test_get_industry_signals_b2b(self):
         detector = BusinessDetector()
         text = "enterprise solutions for businesses and organizations"
-        signals = detector._get_industry_signals(text)
+        signals = detector._get_industry_signals(detector._to_lower_bytes(text))
 
         assert "b2b" in signals
 
     def test_get_industry_signals_local(self):
         detector = BusinessDetector()
         text = "visit our local store near me today"
-        signals = detector._get_industry_signals(text)
+        signals = detector._get_industry_signals(detector._to_lower_bytes(text))
 
         assert "local" in signals
 
     def test_get_industry_signals_premium(self):
         detector = BusinessDetector()
         text = "luxury exclusive high-end products"
-        signals = detector._get_industry_signals(text)
+        signals = detector._get_industry_signals(detector._to_lower_bytes(text))
 
         assert "premium" in signals
 
@@ -0,0 +1,68 @@
+"""Tests for the collector orchestrator."""
+
+import asyncio
+import threading
+
+from proofkit.collector import Collector
+from proofkit.collector.models import HttpProbeData, LighthouseData, SnapshotData
+
+
+class TestCollect:
+    def test_collectors_run_concurrently(self, monkeypatch, temp_output_dir):
+        collector = Collector()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def snapshot(url, pages, output_dir):
+            barrier.wait()
+            return SnapshotData(url=url)
+
+        def lighthouse(url, output_dir):
+            barrier.wait()
+            return LighthouseData(url=url)
+
+        def http_probe(url):
+            barrier.wait()
+            raise RuntimeError("refused")
+
+        monkeypatch.setattr(collector, "_get_pages_to_audit", lambda url, mode: [url])
+        monkeypatch.setattr(collector.playwright, "collect", snapshot)
+        monkeypatch.setattr(collector.lighthouse, "collect", lighthouse)
+        monkeypatch.setattr(collector.http_probe, "collect", http_probe)
+
+        raw = collector.collect("https://example.com", "fast", temp_output_dir)
+
+        assert raw.snapshot.url == "https://example.com"
+        assert raw.http_probe.final_url == "https://example.com"
+        assert raw.collection_errors == ["HTTP probe failed: refused"]
+
+    def test_collect_async_gathers_on_one_loop(self, monkeypatch, temp_output_dir):
+        collector = Collector()
+        started = []
+
+        async def pages(url, max_pages=5):
+            return [url, url + "/about"]
+
+        async def snapshot(url, pages, output_dir):
+            started.append("snapshot")
+            await asyncio.sleep(0)
+            assert "lighthouse" in started
+            return SnapshotData(url=url)
+
+        async def lighthouse(url, output_dir):
+            started.append("lighthouse")
+            raise RuntimeError("no chrome")
+
+        monkeypatch.setattr(collector.playwright, "discover_key_pages_async", pages)
+        monkeypatch.setattr(collector.playwright, "collect_async", snapshot)
+        monkeypatch.setattr(collector.lighthouse, "collect_async", lighthouse)
+        monkeypatch.setattr(collector.http_probe, "collect", lambda url: HttpProbeData(url=url, final_url=url))
+
+        progress = []
+        raw = asyncio.run(
+            collector.collect_async("https://example.com", "fast", temp_output_dir, progress.append)
+        )
+
+        assert raw.pages_audited == ["https://example.com", "https://example.com/about"]
+        assert raw.collection_errors == ["Lighthouse failed: no chrome"]
+        assert (temp_output_dir / "raw_data.json").exists()
+        assert progress == [0.25, 0.5, 0.75, 1.0]
@@ -0,0 +1,618 @@
+"""Tests for Lighthouse collector."""
+
+import asyncio
+import json
+import os
+import pickle
+from concurrent.futures import Future
+
+import pytest
+
+from proofkit.collector import lighthouse
+from proofkit.collector.lighthouse import LighthouseCollector
+from proofkit.collector.models import LighthouseData
+from proofkit.utils.config import reset_config
+
+
+@pytest.fixture(autouse=True)
+def no_report_cache(monkeypatch):
+    """Keep collectors from reusing reports cached by other tests."""
+    monkeypatch.setenv("PROOFKIT_LIGHTHOUSE_CACHE_TTL", "0")
+    reset_config()
+    yield
+    reset_config()
+
+
+@pytest.fixture
+def sample_lighthouse_result():
+    """Minimal Lighthouse JSON report."""
+    return {
+        "categories": {
+            "performance": {"score": 0.456},
+            "accessibility": {"score": 0.9},
+            "best-practices": {"score": 1.0},
+            "seo": {"score": None},
+        },
+        "audits": {
+            "largest-contentful-paint": {"numericValue": 2534.567},
+            "cumulative-layout-shift": {"numericValue": 0.123456},
+            "total-blocking-time": {"numericValue": 310.0},
+            "render-blocking-resources": {
+                "score": 0.5,
+                "title": "Eliminate render-blocking resources",
+                "details": {"overallSavingsMs": 820.4},
+            },
+            "unused-javascript": {
+                "score": 0.2,
+                "title": "Reduce unused JavaScript",
+                "details": {"overallSavingsMs": 1200, "overallSavingsBytes": 204800.7},
+            },
+            "uses-text-compression": {
+                "score": 1,
+                "title": "Enable text compression",
+                "details": {"overallSavingsMs": 0},
+            },
+            "final-screenshot": {"score": None},
+        },
+    }
+
+
+class TestLighthouseCollect:
+    def test_unavailable_returns_empty(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "is_available", lambda: False)
+
+        result = collector.collect("https://example.com", temp_output_dir)
+
+        assert isinstance(result, LighthouseData)
+        assert result.mobile_scores.performance is None
+
+    def test_runs_both_form_factors_concurrently(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "is_available", lambda: True)
+        started = []
+        modes = []
+
+        async def fake_run(url, output_dir, mode):
+            started.append(mode)
+            await asyncio.sleep(0.01)
+            # The other audit must have started while this one was in flight
+            assert len(started) == 2
+            modes.append(mode)
+            return sample_lighthouse_result
+
+        monkeypatch.setattr(collector, "_run_lighthouse", fake_run)
+
+        result = collector.collect("https://example.com", temp_output_dir)
+
+        assert sorted(modes) == ["desktop", "mobile"]
+        assert result.mobile_scores.performance == 45.6
+        assert result.desktop_scores.performance == 45.6
+        # Raw reports are referenced by path rather than kept in memory
+        assert result.mobile_report_path == str(temp_output_dir / "lighthouse_mobile.json")
+        assert result.desktop_report_path == str(temp_output_dir / "lighthouse_desktop.json")
+
+    def test_failed_audit_has_no_report_path(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "is_available", lambda: True)
+
+        async def fake_run(url, output_dir, mode):
+            return {}
+
+        monkeypatch.setattr(collector, "_run_lighthouse", fake_run)
+
+        result = collector.collect("https://example.com", temp_output_dir)
+
+        assert result.mobile_report_path is None
+        assert result.desktop_report_path is None
+
+    def test_collector_closes_chrome_after_audit(self, monkeypatch, temp_output_dir):
+        from proofkit.collector import Collector
+
+        collector = Collector()
+        closed = []
+        monkeypatch.setattr(
+            collector.lighthouse, "collect", lambda url, output_dir: LighthouseData(url=url)
+        )
+        monkeypatch.setattr(collector.lighthouse, "close", lambda: closed.append(True))
+
+        collector.collect_single("https://example.com", temp_output_dir, collectors=["lighthouse"])
+
+        assert closed == [True]
+
+    def test_close_terminates_launched_chrome(self, tmp_path):
+        class FakeChrome:
+            terminated = False
+
+            def terminate(self):
+                self.terminated = True
+
+            def wait(self, timeout=None):
+                return 0
+
+        collector = LighthouseCollector()
+        chrome = FakeChrome()
+        user_data_dir = tmp_path / "profile"
+        user_data_dir.mkdir()
+        collector._chrome_instances["mobile"] = (chrome, 9333, str(user_data_dir))
+
+        with collector:
+            pass
+
+        assert chrome.terminated
+        assert not user_data_dir.exists()
+        assert collector._chrome_instances == {}
+
+    def test_one_failing_audit_keeps_the_other(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "is_available", lambda: True)
+
+        async def fake_run(url, output_dir, mode):
+            if mode == "desktop":
+                raise RuntimeError("boom")
+            return sample_lighthouse_result
+
+        monkeypatch.setattr(collector, "_run_lighthouse", fake_run)
+
+        result = collector.collect("https://example.com", temp_output_dir)
+
+        assert result.mobile_scores.performance == 45.6
+        assert result.desktop_scores.performance is None
+        assert result.desktop_report_path is None
+
+
+class InlineExecutor:
+    """ProcessPoolExecutor stand-in running tasks in-process, pickling results as a pool would."""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        initializer(*initargs)
+        InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(pickle.loads(pickle.dumps(fn(*args))))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class TestCollectMany:
+    def test_audits_every_url_on_spawned_workers(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        async def fake_run(self, url, output_dir, mode):
+            if url.endswith("/broken"):
+                return {}
+            if url.endswith("/crash") and mode == "desktop":
+                raise RuntimeError("worker died")
+            return sample_lighthouse_result
+
+        monkeypatch.setattr(LighthouseCollector, "is_available", lambda self: True)
+        monkeypatch.setattr(LighthouseCollector, "_run_lighthouse", fake_run)
+        monkeypatch.setattr(lighthouse, "ProcessPoolExecutor", InlineExecutor)
+        monkeypatch.setattr(lighthouse, "_worker_collector", None)
+        monkeypatch.setattr(InlineExecutor, "instances", [])
+        urls = ["https://example.com/", "https://example.com/broken", "https://example.com/crash"]
+
+        results = LighthouseCollector().collect_many(urls, temp_output_dir, max_parallel=2)
+
+        executor = InlineExecutor.instances[0]
+        assert executor.max_workers == 2
+        assert executor.mp_context.get_start_method() == "spawn"
+        assert [r.url for r in results] == urls
+        assert results[0].mobile_scores.performance == 45.6
+        assert results[0].desktop_cwv.lcp == 2534.57
+        assert [o.id for o in results[0].opportunities] == ["unused-javascript", "render-blocking-resources"]
+        assert results[1].mobile_scores.performance is None
+        assert results[1].mobile_report_path is None
+        # A failed task only empties its own form factor
+        assert results[2].mobile_scores.performance == 45.6
+        assert results[2].desktop_scores.performance is None
+        # Each URL archives its reports in its own directory
+        mobile_dir = os.path.dirname(results[0].mobile_report_path)
+        assert mobile_dir == str(LighthouseCollector._url_output_dir(temp_output_dir, urls[0]))
+
+    def test_parallelism_budgets_two_chromes_per_worker(self, monkeypatch):
+        pages = {"SC_PHYS_PAGES": 3 * 1024, "SC_PAGE_SIZE": 1024 * 1024}
+        monkeypatch.setattr(lighthouse.os, "sysconf", pages.__getitem__)
+        monkeypatch.setattr(lighthouse.os, "cpu_count", lambda: 32)
+
+        # 3 GB fits three 1 GB workers (two 500 MB Chromes each)
+        assert LighthouseCollector()._default_parallelism() == 3
+
+    def test_url_output_dirs_are_unique(self, temp_output_dir):
+        first = LighthouseCollector._url_output_dir(temp_output_dir, "https://example.com/a?x=1")
+        second = LighthouseCollector._url_output_dir(temp_output_dir, "https://example.com/a?x=2")
+
+        assert first != second
+        assert first.name.startswith("example.com_a-")
+
+    def test_default_parallelism_is_positive(self):
+        assert LighthouseCollector()._default_parallelism() >= 1
+
+
+class FakeProcess:
+    """Stand-in for asyncio.subprocess.Process."""
+
+    def __init__(self, stdout=b"", stderr=b"", returncode=0, hang=False):
+        self._stdout = stdout
+        self._stderr = stderr
+        self.returncode = returncode
+        self.hang = hang
+        self.killed = False
+
+    async def communicate(self):
+        if self.hang:
+            await asyncio.sleep(3600)
+        return self._stdout, self._stderr
+
+    def kill(self):
+        self.killed = True
+
+    async def wait(self):
+        return self.returncode
+
+
+def patch_exec(monkeypatch, proc, captured=None):
+    async def fake_exec(*cmd, **kwargs):
+        if captured is not None:
+            captured["cmd"] = list(cmd)
+        return proc
+
+    monkeypatch.setattr(
+        "proofkit.collector.lighthouse.asyncio.create_subprocess_exec", fake_exec
+    )
+
+
+def run_lighthouse(collector, output_dir, mode="mobile"):
+    return asyncio.run(collector._run_lighthouse("https://example.com", output_dir, mode))
+
+
+class TestLighthouseCommand:
+    def _capture_cmd(self, monkeypatch, collector, temp_output_dir, mode):
+        captured = {}
+        patch_exec(monkeypatch, FakeProcess(), captured)
+        run_lighthouse(collector, temp_output_dir, mode)
+        return captured["cmd"]
+
+    def test_attaches_to_persistent_chrome(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+
+        cmd = self._capture_cmd(monkeypatch, collector, temp_output_dir, "desktop")
+
+        assert "--port=9333" in cmd
+        assert "--preset=desktop" in cmd
+        assert "--skip-audits=full-page-screenshot,screenshot-thumbnails,final-screenshot,script-treemap-data" in cmd
+        assert "--max-wait-for-load=45000" in cmd
+        assert not any(arg.startswith("--chrome-flags") for arg in cmd)
+
+    def test_storage_reset_skipped_only_on_fresh_profile(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        collector._fresh_profiles.add("mobile")
+
+        first = self._capture_cmd(monkeypatch, collector, temp_output_dir, "mobile")
+        second = self._capture_cmd(monkeypatch, collector, temp_output_dir, "mobile")
+
+        assert "--disable-storage-reset" in first
+        assert "--disable-storage-reset" not in second
+
+    def test_falls_back_to_cli_launch(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: None)
+        monkeypatch.setattr(collector, "_find_chrome", lambda: None)
+
+        cmd = self._capture_cmd(monkeypatch, collector, temp_output_dir, "mobile")
+
+        assert any(arg.startswith("--chrome-flags") for arg in cmd)
+        assert not any(arg.startswith("--port") for arg in cmd)
+
+
+class TestRunLighthouse:
+    def _patch_run(self, monkeypatch, stdout):
+        patch_exec(monkeypatch, FakeProcess(stdout=stdout))
+
+    def test_parses_stdout_and_archives_report(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        self._patch_run(monkeypatch, json.dumps(sample_lighthouse_result).encode())
+
+        data = run_lighthouse(collector, temp_output_dir)
+
+        assert data["categories"]["performance"]["score"] == 0.456
+        archived = temp_output_dir / "lighthouse_mobile.json"
+        assert json.loads(archived.read_text()) == sample_lighthouse_result
+
+    def test_skips_archive_when_disabled(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector(save_reports=False)
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        self._patch_run(monkeypatch, json.dumps(sample_lighthouse_result).encode())
+
+        data = run_lighthouse(collector, temp_output_dir)
+
+        assert data
+        assert not (temp_output_dir / "lighthouse_mobile.json").exists()
+
+    def test_archived_report_loads_back(
+        self, monkeypatch, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        self._patch_run(monkeypatch, json.dumps(sample_lighthouse_result).encode())
+        run_lighthouse(collector, temp_output_dir)
+
+        report = LighthouseCollector.load_report(temp_output_dir / "lighthouse_mobile.json")
+
+        assert collector._extract_scores(report).performance == 45.6
+
+    def test_archive_failure_keeps_parsed_report(
+        self, monkeypatch, tmp_path, sample_lighthouse_result
+    ):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        self._patch_run(monkeypatch, json.dumps(sample_lighthouse_result).encode())
+
+        data = run_lighthouse(collector, tmp_path / "missing")
+
+        assert data["categories"]["performance"]["score"] == 0.456
+
+    def test_invalid_output_returns_empty(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        self._patch_run(monkeypatch, b"not json")
+
+        assert run_lighthouse(collector, temp_output_dir) == {}
+        assert not (temp_output_dir / "lighthouse_mobile.json").exists()
+
+    def test_timeout_kills_cli_and_chrome(self, monkeypatch, temp_output_dir):
+        collector = LighthouseCollector()
+        collector.AUDIT_TIMEOUT = 0.01
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        discarded = []
+        monkeypatch.setattr(collector, "_discard_chrome", discarded.append)
+        proc = FakeProcess(hang=True)
+        patch_exec(monkeypatch, proc)
+
+        assert run_lighthouse(collector, temp_output_dir) == {}
+        assert proc.killed
+        assert discarded == ["mobile"]
+
+
+class TestReportCache:
+    def _collector(self, monkeypatch, tmp_path, ttl=3600):
+        collector = LighthouseCollector(cache_ttl=ttl)
+        collector.cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(collector, "_get_chrome_port", lambda mode: 9333)
+        monkeypatch.setattr(lighthouse, "_lighthouse_version", lambda: "12.0.0")
+        return collector
+
+    def test_second_audit_served_from_cache(
+        self, monkeypatch, tmp_path, temp_output_dir, sample_lighthouse_result
+    ):
+        collector = self._collector(monkeypatch, tmp_path)
+        patch_exec(monkeypatch, FakeProcess(stdout=json.dumps(sample_lighthouse_result).encode()))
+        run_lighthouse(collector, temp_output_dir)
+
+        # Any further CLI run would produce an unparseable report
+        patch_exec(monkeypatch, FakeProcess(stdout=b"not json"))
+        data = run_lighthouse(collector, temp_output_dir)
+
+        assert data["categories"]["performance"]["score"] == 0.456
+        assert (temp_output_dir / "lighthouse_mobile.json").exists()
+        assert [p.suffix for p in collector.cache_dir.iterdir()] == [".json"]
+
+    def test_cache_hit_survives_archive_failure(
+        self, monkeypatch, tmp_path, sample_lighthouse_result
+    ):
+        collector = self._collector(monkeypatch, tmp_path)
+        collector._write_cache(
+            "https://example.com", "mobile", json.dumps(sample_lighthouse_result).encode()
+        )
+
+        # Archiving into a missing directory fails with OSError
+        data = run_lighthouse(collector, tmp_path / "missing")
+
+        assert data["categories"]["performance"]["score"] == 0.456
+
+    def test_version_lookup_runs_off_event_loop(self, monkeypatch, tmp_path):
+        collector = self._collector(monkeypatch, tmp_path)
+        loop_threads = []
+
+        def fake_version():
+            try:
+                asyncio.get_running_loop()
+                loop_threads.append(True)
+            except RuntimeError:
+                pass
+            return "12.0.0"
+
+        monkeypatch.setattr(lighthouse, "_lighthouse_version", fake_version)
+        patch_exec(monkeypatch, FakeProcess())
+        run_lighthouse(collector, tmp_path)
+
+        assert loop_threads == []
+
+    def test_cache_keyed_by_form_factor(self, monkeypatch, tmp_path):
+        collector = self._collector(monkeypatch, tmp_path)
+
+        assert collector._cache_path("https://example.com", "mobile") != collector._cache_path(
+            "https://example.com", "desktop"
+        )
+
+    def test_expired_entry_ignored(self, monkeypatch, tmp_path):
+        collector = self._collector(monkeypatch, tmp_path, ttl=60)
+        collector._write_cache("https://example.com", "mobile", b"{}")
+        cache_path = collector._cache_path("https://example.com", "mobile")
+        os.utime(cache_path, (0, 0))
+
+        assert collector._read_cache("https://example.com", "mobile") is None
+
+    def test_zero_ttl_disables_cache(self, monkeypatch, tmp_path):
+        collector = self._collector(monkeypatch, tmp_path, ttl=0)
+        collector._write_cache("https://example.com", "mobile", b"{}")
+
+        assert not collector.cache_dir.exists()
+        assert collector._read_cache("https://example.com", "mobile") is None
+
+
+class TestCollectSimple:
+    def test_extracts_key_metrics(self, monkeypatch, sample_lighthouse_result):
+        collector = LighthouseCollector()
+        monkeypatch.setattr(collector, "is_available", lambda: True)
+
+        class FakeResult:
+            returncode = 0
+            stderr = b""
+            stdout = json.dumps(sample_lighthouse_result).encode()
+
+        monkeypatch.setattr(
+            "proofkit.collector.lighthouse.subprocess.run", lambda cmd, **kwargs: FakeResult()
+        )
+
+        result = collector.collect_simple("https://example.com")
+
+        assert result["performance_score"] == 45.6
+        assert result["cwv"]["lcp"] == 2534.57
+        assert result["cwv"]["fid"] is None
+
+
+class TestExtractMetrics:
+    def test_scores_rounded_to_one_decimal(self, sample_lighthouse_result):
+        scores = LighthouseCollector()._extract_scores(sample_lighthouse_result)
+
+        assert scores.performance == 45.6
+        assert scores.accessibility == 90.0
+        assert scores.best_practices == 100.0
+        assert scores.seo is None
+
+    def test_cwv_rounded_to_two_decimals(self, sample_lighthouse_result):
+        cwv = LighthouseCollector()._extract_cwv(sample_lighthouse_result)
+
+        assert cwv.lcp == 2534.57
+        assert cwv.cls == 0.12
+        assert cwv.tbt == 310.0
+        assert cwv.inp is None
+
+    def test_rounding_helpers_match_round_off_halves(self):
+        for value in (0.0, 0.456, 1.0, 2534.567, 98765.4321):
+            assert lighthouse._round1(value) == round(value, 1)
+            assert lighthouse._round2(value) == round(value, 2)
+
+    def test_rounding_helpers_round_halves_up(self):
+        # round() would give 0.12 and 0.2 (round half to even)
+        assert lighthouse._round2(0.125) == 0.13
+        assert lighthouse._round1(0.25) == 0.3
+        assert lighthouse._round1(0.35) == 0.4
+
+    def test_savings_ms_round_halves_up(self):
+        result = {"audits": {"redirects": {"score": 0.5, "details": {"overallSavingsMs": 820.5}}}}
+
+        top = LighthouseCollector()._extract_opportunities(result)[0]
+
+        assert top.savings_ms == 821.0
+
+
+class TestExtractOpportunities:
+    def test_only_failing_opportunity_audits(self, sample_lighthouse_result):
+        collector = LighthouseCollector()
+        opportunities = collector._extract_opportunities(sample_lighthouse_result)
+
+        ids = [o.id for o in opportunities]
+        # Passing audits and non-opportunity audits are skipped
+        assert "uses-text-compression" not in ids
+        assert "final-screenshot" not in ids
+        # Sorted by savings, largest first
+        assert ids == ["unused-javascript", "render-blocking-resources"]
+
+    def test_values_are_normalized(self, sample_lighthouse_result):
+        collector = LighthouseCollector()
+        top = collector._extract_opportunities(sample_lighthouse_result)[0]
+
+        assert top.score == 20.0
+        assert top.savings_ms == 1200
+        assert top.savings_bytes == 204800
+
+    def test_empty_report(self):
+        assert LighthouseCollector()._extract_opportunities({}) == []
+
+    def test_equal_savings_keep_report_order(self):
+        audits = {
+            audit_id: {"score": 0.5, "details": {"overallSavingsMs": 100}}
+            for audit_id in ("dom-size", "redirects", "font-display")
+        }
+        audits["unused-css-rules"] = {"score": 0.1, "details": {}}
+
+        opportunities = LighthouseCollector()._extract_opportunities({"audits": audits})
+
+        assert [o.id for o in opportunities] == ["dom-size", "redirects", "font-display", "unused-css-rules"]
+
+
+class TestIsAvailable:
+    def test_cli_lookup_runs_once_per_process(self, monkeypatch):
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return "/usr/bin/lighthouse"
+
+        lighthouse._lighthouse_cli_path.cache_clear()
+        monkeypatch.setattr(lighthouse.shutil, "which", fake_which)
+        try:
+            assert LighthouseCollector().is_available() is True
+            assert LighthouseCollector().is_available() is True
+            assert calls == ["lighthouse"]
+        finally:
+            lighthouse._lighthouse_cli_path.cache_clear()
+
+
+class TestFindChrome:
+    def test_search_runs_once_per_process(self, monkeypatch, tmp_path):
+        chrome = tmp_path / "chrome"
+        chrome.write_text("")
+        calls = []
+
+        def fake_candidates():
+            calls.append(1)
+            yield None
+            yield str(chrome)
+
+        monkeypatch.setattr(LighthouseCollector, "_chrome_path_cache", lighthouse._UNSET)
+        monkeypatch.setattr(LighthouseCollector, "_chrome_candidates", staticmethod(fake_candidates))
+
+        assert LighthouseCollector()._find_chrome() == str(chrome)
+        assert LighthouseCollector()._find_chrome() == str(chrome)
+        assert len(calls) == 1
+
+    def test_not_found_is_cached(self, monkeypatch):
+        calls = []
+
+        def fake_candidates():
+            calls.append(1)
+            yield "/nonexistent/chrome"
+
+        monkeypatch.setattr(LighthouseCollector, "_chrome_path_cache", lighthouse._UNSET)
+        monkeypatch.setattr(LighthouseCollector, "_chrome_candidates", staticmethod(fake_candidates))
+
+        assert LighthouseCollector()._find_chrome() is None
+        assert LighthouseCollector()._find_chrome() is None
+        assert len(calls) == 1
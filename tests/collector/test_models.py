@@ -1,6 +1,7 @@
 """Tests for collector data models."""
 
 import pytest
+from pydantic import ValidationError
 
 from proofkit.collector.models import (
     CTAInfo,
@@ -294,3 +295,31 @@ class TestRawData:
         assert len(data.pages_audited) == 2
         assert data.detected_stack.cms == "wordpress"
         assert len(data.collection_errors) == 1
+
+    def test_defaults_not_shared_between_instances(self):
+        first = RawData(url="https://example.com", mode="fast")
+        second = RawData(url="https://example.com", mode="fast")
+
+        first.collection_errors.append("boom")
+        first.snapshot.pages.append(PageSnapshot(url="https://example.com"))
+
+        assert second.collection_errors == []
+        assert second.snapshot.pages == []
+        assert first.lighthouse is not second.lighthouse
+
+
+class TestFrozenModels:
+    @pytest.mark.parametrize("model", [
+        CoreWebVitals(lcp=1.0),
+        LighthouseScores(performance=90.0),
+        LighthouseOpportunity(id="dom-size", title="Avoid an excessive DOM size"),
+        SecurityHeaders(),
+        SSLInfo(valid=True),
+    ])
+    def test_extractor_outputs_are_immutable(self, model):
+        field = next(iter(type(model).model_fields))
+        with pytest.raises(ValidationError):
+            setattr(model, field, None)
+
+    def test_scores_hashable(self):
+        assert hash(LighthouseScores(performance=90.0)) == hash(LighthouseScores(performance=90.0))
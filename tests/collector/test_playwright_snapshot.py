@@ -0,0 +1,872 @@
+"""Tests for Playwright collector."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from proofkit.collector.models import CTAInfo, FormInfo, PageSnapshot
+from proofkit.utils import json_utils
+from proofkit.utils.config import reset_config
+from proofkit.collector.playwright_snapshot import (
+    CONTACT_JS,
+    HAMBURGER_SELECTORS,
+    CTA_KEYWORDS,
+    CTA_RE,
+    EMAIL_RE,
+    PHONE_RE,
+    SAME_HOST_LINKS_JS,
+    SCROLL_JS,
+    VISIBLE_SELECTORS_JS,
+    WHATSAPP_RE,
+    PlaywrightCollector,
+    _canon,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_output_dir(monkeypatch, tmp_path):
+    """Keep saved browser state out of the working tree and between tests."""
+    monkeypatch.setenv("PROOFKIT_OUTPUT_DIR", str(tmp_path))
+    reset_config()
+    yield tmp_path
+    reset_config()
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, viewport, storage_state=None):
+        self.viewport = viewport
+        self.storage_state = storage_state
+        self.pages = []
+        self.route_handler = None
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+        self.launches = 0
+        self.contexts = []
+        self.reject_state = False
+
+    async def new_context(self, **kwargs):
+        if self.reject_state and kwargs.get("storage_state") is not None:
+            raise ValueError("invalid storage state")
+        context = FakeContext(kwargs.get("viewport"), kwargs.get("storage_state"))
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    """Stand-in for the object returned by async_playwright()."""
+
+    def __init__(self, browser):
+        self.chromium = self
+        self.browser = browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        return None
+
+    async def launch(self, **kwargs):
+        self.browser.launches += 1
+        self.browser.closed = False
+        return self.browser
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    browser = FakeBrowser()
+    monkeypatch.setattr(
+        "playwright.async_api.async_playwright", lambda: FakePlaywright(browser)
+    )
+    return browser
+
+
+class TestCollect:
+    def test_snapshots_pages_concurrently_within_limit(
+        self, monkeypatch, fake_browser, temp_output_dir
+    ):
+        collector = PlaywrightCollector()
+        monkeypatch.setattr(collector.config, "playwright_concurrency", 2)
+        in_flight = []
+        peak = []
+
+        async def fake_snapshot(desktop_page, mobile_page, url, output_dir):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(url)
+            return PageSnapshot(url=url, screenshots=[f"{url}.png"])
+
+        monkeypatch.setattr(collector, "_snapshot_page", fake_snapshot)
+        pages = [f"https://example.com/{i}" for i in range(5)]
+
+        result = collector.collect("https://example.com", pages, temp_output_dir)
+
+        assert max(peak) == 2
+        assert [p.url for p in result.pages] == pages
+        assert result.screenshots == [f"{url}.png" for url in pages]
+        assert fake_browser.closed
+
+    def test_failed_page_gets_minimal_snapshot(
+        self, monkeypatch, fake_browser, temp_output_dir
+    ):
+        collector = PlaywrightCollector()
+
+        async def fake_snapshot(desktop_page, mobile_page, url, output_dir):
+            if url.endswith("/broken"):
+                raise RuntimeError("boom")
+            return PageSnapshot(url=url)
+
+        monkeypatch.setattr(collector, "_snapshot_page", fake_snapshot)
+
+        result = collector.collect(
+            "https://example.com",
+            ["https://example.com/", "https://example.com/broken"],
+            temp_output_dir,
+        )
+
+        assert result.pages[1].console_errors == ["boom"]
+        assert result.pages[0].console_errors == []
+
+    def test_pages_are_reused_from_pool(
+        self, monkeypatch, fake_browser, temp_output_dir
+    ):
+        collector = PlaywrightCollector()
+        monkeypatch.setattr(collector.config, "playwright_concurrency", 2)
+        used = set()
+
+        async def fake_snapshot(desktop_page, mobile_page, url, output_dir):
+            used.add((id(desktop_page), id(mobile_page)))
+            await asyncio.sleep(0)
+            return PageSnapshot(url=url)
+
+        monkeypatch.setattr(collector, "_snapshot_page", fake_snapshot)
+        pages = [f"https://example.com/{i}" for i in range(6)]
+
+        collector.collect("https://example.com", pages, temp_output_dir)
+
+        crawl_ctx, desktop_ctx, mobile_ctx = fake_browser.contexts
+        assert desktop_ctx.viewport == {"width": 1440, "height": 900}
+        assert mobile_ctx.viewport == {"width": 390, "height": 844}
+        assert len(desktop_ctx.pages) == 2
+        assert len(used) == 2
+        assert all(page.closed for page in desktop_ctx.pages + mobile_ctx.pages)
+        assert crawl_ctx.pages == []
+
+
+class TestSession:
+    STATE = {"cookies": [{"name": "consent", "value": "yes"}], "origins": []}
+
+    def snapshot_contexts(self, collector, url="https://example.com/about"):
+        async def run():
+            async with collector:
+                return await collector._snapshot_contexts(url)
+
+        return asyncio.run(run())
+
+    def save_state(self, collector, origin="https://example.com", content=None):
+        path = collector._state_path(origin)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content if content is not None else json_utils.dumps(self.STATE))
+        return path
+
+    def test_snapshot_contexts_reuse_saved_state(self, fake_browser):
+        collector = PlaywrightCollector()
+        self.save_state(collector)
+
+        desktop_ctx, mobile_ctx = self.snapshot_contexts(collector)
+
+        crawl_ctx = fake_browser.contexts[0]
+        assert desktop_ctx.storage_state == self.STATE
+        assert mobile_ctx.storage_state == self.STATE
+        assert crawl_ctx.storage_state is None
+
+    def test_no_saved_state_starts_fresh(self, fake_browser):
+        self.snapshot_contexts(PlaywrightCollector())
+
+        assert all(ctx.storage_state is None for ctx in fake_browser.contexts)
+
+    def test_state_is_kept_per_origin(self, fake_browser):
+        collector = PlaywrightCollector()
+        self.save_state(collector, origin="https://other.example")
+
+        desktop_ctx, _ = self.snapshot_contexts(collector)
+
+        assert desktop_ctx.storage_state is None
+
+    def test_expired_state_ignored(self, fake_browser):
+        collector = PlaywrightCollector()
+        path = self.save_state(collector)
+        stale = time.time() - collector.config.playwright_state_ttl - 1
+        os.utime(path, (stale, stale))
+
+        desktop_ctx, _ = self.snapshot_contexts(collector)
+
+        assert desktop_ctx.storage_state is None
+
+    def test_unreadable_state_falls_back_to_cold_context(self, fake_browser):
+        collector = PlaywrightCollector()
+        self.save_state(collector, content=b'{"cookies": [')
+
+        desktop_ctx, mobile_ctx = self.snapshot_contexts(collector)
+
+        assert desktop_ctx.storage_state is None and mobile_ctx.storage_state is None
+
+    def test_rejected_state_falls_back_to_cold_context(self, fake_browser):
+        collector = PlaywrightCollector()
+        self.save_state(collector)
+        fake_browser.reject_state = True
+
+        desktop_ctx, mobile_ctx = self.snapshot_contexts(collector)
+
+        assert desktop_ctx.storage_state is None and mobile_ctx.storage_state is None
+
+    def test_new_origin_replaces_snapshot_contexts(self, fake_browser):
+        collector = PlaywrightCollector()
+        self.save_state(collector, origin="https://other.example")
+
+        async def run():
+            async with collector:
+                first = await collector._snapshot_contexts("https://example.com/")
+                same = await collector._snapshot_contexts("https://EXAMPLE.com/about")
+                other = await collector._snapshot_contexts("https://other.example/")
+                return first, same, other
+
+        first, same, other = asyncio.run(run())
+
+        assert same == first
+        assert all(ctx.closed for ctx in first)
+        assert other[0].storage_state == self.STATE
+
+    def test_calls_share_one_browser_inside_context(
+        self, monkeypatch, fake_browser, temp_output_dir
+    ):
+        collector = PlaywrightCollector()
+
+        async def fake_snapshot(desktop_page, mobile_page, url, output_dir):
+            return PageSnapshot(url=url)
+
+        monkeypatch.setattr(collector, "_snapshot_page", fake_snapshot)
+
+        async def run():
+            async with collector:
+                await collector.collect_async("https://example.com", ["https://example.com/"], temp_output_dir)
+                await collector.collect_async("https://example.com", ["https://example.com/a"], temp_output_dir)
+                assert not fake_browser.closed
+
+        asyncio.run(run())
+
+        assert fake_browser.launches == 1
+        assert fake_browser.closed
+
+
+class EvaluatePage:
+    """Page double that answers the fused DOM extraction."""
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    async def evaluate(self, script, arg=None):
+        self.calls += 1
+        return self.data
+
+
+def anchor(text, href="", visible=True, above_fold=True):
+    return {
+        "text": text,
+        "href": href,
+        "visible": visible,
+        "above_fold": above_fold,
+        "selector": "a.btn",
+    }
+
+
+class TestContactInfo:
+    def test_scan_runs_in_page_with_shared_patterns(self):
+        collector = PlaywrightCollector()
+        page = EvaluatePage({"phones": ["04 555 1234"], "emails": ["a@b.co"], "has_tel_link": True, "has_mailto_link": True})
+        seen = []
+
+        async def evaluate(script, arg=None):
+            seen.append((script, arg))
+            return page.data
+
+        page.evaluate = evaluate
+
+        contact = asyncio.run(collector._get_contact_info(page))
+
+        assert seen == [(CONTACT_JS, [PHONE_RE.pattern, EMAIL_RE.pattern])]
+        assert contact["emails"] == ["a@b.co"]
+        assert contact["has_mailto_link"]
+
+    def test_failed_scan_returns_defaults(self):
+        class BrokenPage:
+            async def evaluate(self, script, arg=None):
+                raise RuntimeError("detached")
+
+        contact = asyncio.run(PlaywrightCollector()._get_contact_info(BrokenPage()))
+
+        assert contact == {"phones": [], "emails": [], "has_tel_link": False, "has_mailto_link": False}
+
+
+class TestExtraction:
+    DATA = {
+        "title": "Home",
+        "headings": {"h1": ["Welcome"], "h2": [], "h3": []},
+        "meta": {"description": "A site"},
+        "cta_links": [anchor("Contact Us", "/contact")],
+        "cta_buttons": [anchor("")],
+        "whatsapp": [anchor("Chat", "https://wa.me/123", above_fold=False)],
+        "forms": [{
+            "action": "/send",
+            "method": "post",
+            "field_count": 3,
+            "required_count": 2,
+            "has_email": True,
+            "has_phone": False,
+            "submit_text": "  Send message ",
+        }],
+        "nav": [{"text": "About", "href": "/about"}],
+        "has_hamburger": True,
+    }
+
+    def test_single_evaluate_round_trip(self):
+        collector = PlaywrightCollector()
+        page = EvaluatePage(self.DATA)
+
+        data = asyncio.run(collector._extract_page(page))
+
+        assert page.calls == 1
+        assert data["title"] == "Home"
+
+    def test_classification_patterns_passed_to_page(self):
+        collector = PlaywrightCollector()
+        args = []
+
+        class RecordingPage:
+            async def evaluate(self, script, arg=None):
+                args.append(arg)
+                return {}
+
+        asyncio.run(collector._extract_page(RecordingPage()))
+
+        assert args[0]["ctaPattern"] == CTA_RE.pattern
+        assert args[0]["whatsappPattern"] == WHATSAPP_RE.pattern
+
+    def test_failed_evaluate_returns_empty(self):
+        collector = PlaywrightCollector()
+
+        class BrokenPage:
+            async def evaluate(self, script, arg=None):
+                raise RuntimeError("detached")
+
+        data = asyncio.run(collector._extract_page(BrokenPage()))
+
+        assert data == {}
+        assert collector._parse_ctas(data) == []
+        assert collector._parse_navigation(data).links == []
+
+    def test_ctas_built_from_matched_records(self):
+        ctas = PlaywrightCollector()._parse_ctas(self.DATA)
+
+        assert [(c.text, c.type) for c in ctas] == [
+            ("contact us", "link"),
+            ("[button]", "button"),
+        ]
+        assert ctas[0].href == "/contact"
+        assert ctas[0].selector == "a.btn"
+
+    def test_built_ctas_match_validated_models(self):
+        ctas = PlaywrightCollector()._parse_ctas(self.DATA)
+
+        assert [CTAInfo.model_validate(c.model_dump()) for c in ctas] == ctas
+        assert ctas[1].href is None
+
+    def test_ctas_capped_before_building(self):
+        data = {"cta_links": [anchor(f"Book {i}", f"/b{i}") for i in range(40)], "cta_buttons": [anchor("")]}
+
+        ctas = PlaywrightCollector()._parse_ctas(data)
+
+        assert len(ctas) == 30
+        assert all(c.type == "link" for c in ctas)
+
+    def test_whatsapp_links(self):
+        links = PlaywrightCollector()._parse_whatsapp_links(self.DATA)
+
+        assert links == [{
+            "text": "Chat",
+            "href": "https://wa.me/123",
+            "is_visible": True,
+            "is_above_fold": False,
+        }]
+
+    def test_forms_and_navigation(self):
+        collector = PlaywrightCollector()
+
+        form = collector._parse_forms(self.DATA)[0]
+        nav = collector._parse_navigation(self.DATA)
+
+        assert form == FormInfo.model_validate(form.model_dump())
+        assert form.method == "POST"
+        assert form.submit_button_text == "Send message"
+        assert nav.has_hamburger
+        assert nav.links == [{"text": "About", "href": "/about"}]
+
+
+class ViewportPage:
+    """Page double covering the calls made while snapshotting one viewport."""
+
+    def __init__(self, name, log, fail=False):
+        self.name = name
+        self.log = log
+        self.fail = fail
+        self.listeners = []
+        self.screenshots = []
+        self.scripts = []
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    async def goto(self, url, **kwargs):
+        self.log.append(f"{self.name} start")
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("crashed")
+        self.log.append(f"{self.name} loaded")
+
+    async def wait_for_load_state(self, state, **kwargs):
+        return None
+
+    async def wait_for_timeout(self, ms):
+        return None
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if script == VISIBLE_SELECTORS_JS:
+            return []
+        if script == CONTACT_JS:
+            return {"phones": ["+971 4 123 4567"], "emails": [], "has_tel_link": True, "has_mailto_link": False}
+        return TestExtraction.DATA
+
+    async def screenshot(self, **kwargs):
+        self.screenshots.append(kwargs)
+
+    def locator(self, selector):
+        raise AssertionError("no visible hamburger to click")
+
+
+class TestSnapshotPage:
+    def test_screenshots_default_to_jpeg(self, temp_output_dir):
+        log = []
+        desktop = ViewportPage("desktop", log)
+        mobile = ViewportPage("mobile", log)
+
+        snapshot = asyncio.run(PlaywrightCollector()._snapshot_page(
+            desktop, mobile, "https://example.com/", temp_output_dir
+        ))
+
+        assert snapshot.screenshots == [
+            str(temp_output_dir / "example_com__desktop.jpg"),
+            str(temp_output_dir / "example_com__mobile.jpg"),
+        ]
+        assert desktop.screenshots[0]["type"] == "jpeg"
+        assert desktop.screenshots[0]["quality"] == 75
+        assert desktop.screenshots[0]["full_page"]
+
+    def test_png_screenshots_are_opt_in(self, monkeypatch, temp_output_dir):
+        collector = PlaywrightCollector()
+        monkeypatch.setattr(collector.config, "screenshot_format", "png")
+        desktop = ViewportPage("desktop", [])
+        mobile = ViewportPage("mobile", [])
+
+        snapshot = asyncio.run(collector._snapshot_page(
+            desktop, mobile, "https://example.com/", temp_output_dir
+        ))
+
+        assert snapshot.screenshots[0].endswith("_desktop.png")
+        assert desktop.screenshots[0]["type"] == "png"
+        assert "quality" not in desktop.screenshots[0]
+
+    def test_viewports_load_concurrently(self, temp_output_dir):
+        log = []
+        desktop = ViewportPage("desktop", log)
+        mobile = ViewportPage("mobile", log)
+
+        snapshot = asyncio.run(PlaywrightCollector()._snapshot_page(
+            desktop, mobile, "https://example.com/", temp_output_dir
+        ))
+
+        assert log[:2] == ["desktop start", "mobile start"]
+        assert snapshot.title == "Home"
+        assert snapshot.contact_info["phones"] == ["+971 4 123 4567"]
+        assert [c.text for c in snapshot.mobile_ctas] == ["contact us", "[button]"]
+        assert len(snapshot.screenshots) == 2
+        assert desktop.listeners == []
+        assert desktop.scripts.count(SCROLL_JS) == 1
+        assert mobile.scripts.count(SCROLL_JS) == 1
+
+    def test_mobile_failure_keeps_desktop_data(self, temp_output_dir):
+        log = []
+        desktop = ViewportPage("desktop", log)
+        mobile = ViewportPage("mobile", log, fail=True)
+
+        snapshot = asyncio.run(PlaywrightCollector()._snapshot_page(
+            desktop, mobile, "https://example.com/", temp_output_dir
+        ))
+
+        assert snapshot.title == "Home"
+        assert snapshot.mobile_ctas == []
+        assert snapshot.hamburger_menu_works is None
+        assert mobile.screenshots == []
+        assert snapshot.screenshots == [str(temp_output_dir / "example_com__desktop.jpg")]
+
+
+class TestPatterns:
+    @pytest.mark.parametrize("text", ["book now", "contacts", "get a quote today", "startup"])
+    def test_cta_regex_matches_keyword_substrings(self, text):
+        assert bool(CTA_RE.search(text)) == any(kw in text for kw in CTA_KEYWORDS)
+
+    def test_cta_regex_rejects_plain_text(self):
+        assert CTA_RE.search("our team") is None
+
+    @pytest.mark.parametrize("href", [
+        "https://wa.me/971500000000",
+        "https://API.WhatsApp.com/send?phone=1",
+        "whatsapp://send?text=hi",
+    ])
+    def test_whatsapp_regex(self, href):
+        assert WHATSAPP_RE.search(href)
+
+    def test_phone_regex_trims_surrounding_whitespace(self):
+        html = "<p>Call   +971 4 123 4567   today</p>"
+
+        assert PHONE_RE.findall(html) == ["+971 4 123 4567"]
+
+    def test_phone_regex_ignores_whitespace_runs_and_long_ids(self):
+        html = " " * 200 + 'data-id="12345678901234567890123"' + "-" * 50
+
+        assert PHONE_RE.findall(html) == []
+
+
+class CrawlPage:
+    """Page double serving a small in-memory site for crawl tests."""
+
+    def __init__(self, site):
+        self.site = site
+        self.url = None
+        self.link_queries = 0
+
+    async def goto(self, url, **kwargs):
+        await asyncio.sleep(0.001)
+        if url not in self.site:
+            raise RuntimeError(f"404 {url}")
+        self.url = url
+
+    async def wait_for_load_state(self, state, **kwargs):
+        raise TimeoutError("load never fired")
+
+    async def eval_on_selector_all(self, selector, script, arg=None):
+        assert (selector, script, arg) == ("a[href]", SAME_HOST_LINKS_JS, "example.com")
+        self.link_queries += 1
+        return self.site[self.url]
+
+    async def close(self):
+        return None
+
+
+class CrawlContext:
+    def __init__(self, site):
+        self.site = site
+        self.pages = []
+
+    async def storage_state(self):
+        return {"cookies": [], "origins": []}
+
+    async def new_page(self):
+        page = CrawlPage(self.site)
+        self.pages.append(page)
+        return page
+
+
+@pytest.fixture
+def crawl_collector(monkeypatch):
+    """Collector with an open session whose desktop context serves TestCrawl.SITE."""
+    collector = PlaywrightCollector()
+    monkeypatch.setattr(collector, "_browser", object())
+    monkeypatch.setattr(collector, "_crawl_ctx", CrawlContext(TestCrawl.SITE))
+    return collector
+
+
+class TestCrawl:
+    # Links as SAME_HOST_LINKS_JS returns them: resolved, same-host, no query
+    SITE = {
+        "https://example.com": ["https://example.com/about", "https://example.com/contact"],
+        "https://example.com/about": ["https://example.com/", "https://EXAMPLE.com/team/"],
+        "https://example.com/contact": ["https://example.com/about"],
+        "https://example.com/": [],
+        "https://EXAMPLE.com/team/": [],
+    }
+    # "https://example.com/" is the start URL under another spelling
+    CRAWLED = set(SITE) - {"https://example.com/"}
+
+    def test_crawl_reads_links_in_one_call_per_page(self, crawl_collector):
+        pages = asyncio.run(crawl_collector.crawl_site_async("https://example.com", max_pages=10))
+
+        assert set(pages) == self.CRAWLED
+        link_queries = sum(p.link_queries for p in crawl_collector._crawl_ctx.pages)
+        assert link_queries == len(pages)
+
+    def test_crawl_spreads_frontier_over_worker_pages(self, monkeypatch, crawl_collector):
+        monkeypatch.setattr(crawl_collector.config, "playwright_concurrency", 3)
+
+        pages = asyncio.run(crawl_collector.crawl_site_async("https://example.com", max_pages=10))
+
+        workers = crawl_collector._crawl_ctx.pages
+        assert pages[0] == "https://example.com"
+        assert len(pages) == len(set(pages)) == len(self.CRAWLED)
+        assert len(workers) == 3
+        assert sum(1 for p in workers if p.link_queries) > 1
+
+    def test_crawl_saves_browser_state(self, crawl_collector):
+        asyncio.run(crawl_collector.crawl_site_async("https://example.com", max_pages=2))
+
+        state_dir = crawl_collector.state_dir
+        assert json_utils.loads(crawl_collector._state_path("https://example.com").read_bytes()) == {
+            "cookies": [],
+            "origins": [],
+        }
+        assert list(state_dir.glob("*.tmp")) == []
+
+    def test_zero_ttl_skips_saving_state(self, monkeypatch, crawl_collector):
+        monkeypatch.setattr(crawl_collector.config, "playwright_state_ttl", 0)
+
+        asyncio.run(crawl_collector.crawl_site_async("https://example.com", max_pages=2))
+
+        assert not crawl_collector.state_dir.exists()
+
+    def test_crawl_stops_at_max_pages(self, monkeypatch, crawl_collector):
+        monkeypatch.setattr(crawl_collector.config, "playwright_concurrency", 4)
+
+        pages = asyncio.run(crawl_collector.crawl_site_async("https://example.com", max_pages=2))
+
+        assert len(pages) == 2
+        assert pages[0] == "https://example.com"
+        assert len(crawl_collector._crawl_ctx.pages) == 2
+
+
+class NavigationPage:
+    def __init__(self):
+        self.calls = []
+
+    async def goto(self, url, **kwargs):
+        self.calls.append(("goto", kwargs["wait_until"]))
+
+    async def wait_for_load_state(self, state, **kwargs):
+        self.calls.append(("wait", state))
+        raise TimeoutError("still loading")
+
+
+class TestGoto:
+    def test_defaults_to_domcontentloaded_with_grace_wait(self):
+        page = NavigationPage()
+
+        asyncio.run(PlaywrightCollector()._goto(page, "https://example.com"))
+
+        assert page.calls == [("goto", "domcontentloaded"), ("wait", "load")]
+
+    def test_networkidle_is_opt_in(self, monkeypatch):
+        collector = PlaywrightCollector()
+        monkeypatch.setattr(collector.config, "playwright_wait_until", "networkidle")
+        page = NavigationPage()
+
+        asyncio.run(collector._goto(page, "https://example.com"))
+
+        assert page.calls == [("goto", "networkidle")]
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+def route_outcome(handler, url, resource_type):
+    route = FakeRoute(url, resource_type)
+    asyncio.run(handler(route))
+    return route.outcome
+
+
+class TestRouting:
+    @pytest.mark.parametrize("resource_type,outcome", [
+        ("document", "continue"),
+        ("script", "continue"),
+        ("image", "abort"),
+        ("font", "abort"),
+        ("stylesheet", "abort"),
+        ("media", "abort"),
+    ])
+    def test_crawl_fetches_only_documents_and_scripts(self, resource_type, outcome):
+        handler = PlaywrightCollector._route_crawl
+
+        assert route_outcome(handler, "https://example.com/x", resource_type) == outcome
+
+    @pytest.mark.parametrize("url,resource_type,outcome", [
+        ("https://example.com/hero.jpg", "image", "continue"),
+        ("https://example.com/site.css", "stylesheet", "continue"),
+        ("https://example.com/intro.mp4", "media", "abort"),
+        ("https://www.google-analytics.com/g/collect", "xhr", "abort"),
+        ("https://static.hotjar.com/c/hotjar.js", "script", "abort"),
+        ("https://www.googletagmanager.com/gtm.js", "script", "continue"),
+    ])
+    def test_snapshot_keeps_rendering_assets(self, url, resource_type, outcome):
+        handler = PlaywrightCollector._route_snapshot
+
+        assert route_outcome(handler, url, resource_type) == outcome
+
+    def test_session_installs_routes(self, fake_browser):
+        collector = PlaywrightCollector()
+
+        async def run():
+            async with collector:
+                await collector._snapshot_contexts("https://example.com/")
+                return [ctx.route_handler for ctx in fake_browser.contexts]
+
+        handlers = asyncio.run(run())
+
+        assert handlers == [
+            PlaywrightCollector._route_crawl,
+            PlaywrightCollector._route_snapshot,
+            PlaywrightCollector._route_snapshot,
+        ]
+
+
+class TestUrlToFilename:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com/", "example_com_"),
+        ("http://a.b/c?d=e&f#g", "a_b_c_d_e_f_g"),
+        ("https://ex.com/my-page_2", "ex_com_my-page_2"),
+        ("https://ex.com/café", "ex_com_caf_"),
+    ])
+    def test_replaces_unsafe_characters(self, url, expected):
+        assert PlaywrightCollector()._url_to_filename(url) == expected
+
+    def test_truncates_to_fifty_characters(self):
+        name = PlaywrightCollector()._url_to_filename("https://example.com/" + "a" * 100)
+
+        assert len(name) == 50
+
+
+class HamburgerPage:
+    """Page double where some hamburger selectors are visible and clickable."""
+
+    def __init__(self, visible, nav_opens=True, broken=()):
+        self.visible = visible
+        self.nav_opens = nav_opens
+        self.broken = broken
+        self.clicked = []
+        self.evaluations = 0
+
+    async def evaluate(self, script, arg=None):
+        assert script == VISIBLE_SELECTORS_JS
+        self.evaluations += 1
+        if arg == HAMBURGER_SELECTORS:
+            return [sel for sel in arg if sel in self.visible]
+        return arg if self.clicked and self.nav_opens else []
+
+    def locator(self, selector):
+        page = self
+
+        class Locator:
+            @property
+            def first(self):
+                return self
+
+            async def click(self):
+                if selector in page.broken:
+                    raise RuntimeError("element detached")
+                page.clicked.append(selector)
+
+        return Locator()
+
+    async def wait_for_timeout(self, ms):
+        return None
+
+
+class TestHamburgerMenu:
+    def test_no_visible_hamburger(self):
+        page = HamburgerPage(visible=[])
+
+        assert asyncio.run(PlaywrightCollector()._test_hamburger_menu(page)) is None
+        assert page.evaluations == 1
+
+    def test_click_opens_nav(self):
+        page = HamburgerPage(visible=[".navbar-toggler"])
+
+        assert asyncio.run(PlaywrightCollector()._test_hamburger_menu(page)) is True
+        assert page.clicked == [".navbar-toggler"]
+        assert page.evaluations == 2
+
+    def test_nav_stays_hidden(self):
+        page = HamburgerPage(visible=[".navbar-toggler"], nav_opens=False)
+
+        assert asyncio.run(PlaywrightCollector()._test_hamburger_menu(page)) is False
+
+    def test_failed_click_tries_next_candidate(self):
+        page = HamburgerPage(
+            visible=["[class*='hamburger']", ".navbar-toggler"],
+            broken=["[class*='hamburger']"],
+        )
+
+        assert asyncio.run(PlaywrightCollector()._test_hamburger_menu(page)) is True
+        assert page.clicked == [".navbar-toggler"]
+
+
+class TestCanon:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com/", "https://example.com"),
+        ("HTTPS://Example.COM/About/", "https://example.com/About"),
+        ("https://example.com/a?utm_source=x#top", "https://example.com/a"),
+        ("https://example.com/%7euser", "https://example.com/%7Euser"),
+    ])
+    def test_canonical_keys(self, url, expected):
+        assert _canon(url) == expected
+
+    def test_equivalent_urls_share_a_key(self):
+        assert _canon("https://example.com/about") == _canon("https://EXAMPLE.com/about/?ref=nav")
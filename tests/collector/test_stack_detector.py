@@ -1,9 +1,18 @@
 """Tests for stack detector."""
 
+import re
+
 import pytest
 
 from proofkit.collector.stack_detector import StackDetector
-from proofkit.collector.models import SnapshotData, PageSnapshot
+from proofkit.collector.models import SnapshotData, PageSnapshot, StackInfo
+
+
+@pytest.fixture(autouse=True)
+def clear_detection_cache():
+    StackDetector.clear_cache()
+    yield
+    StackDetector.clear_cache()
 
 
 class TestStackDetector:
@@ -163,6 +172,22 @@ class TestCDNDetection:
         result = detector._detect_cdn("", headers)
         assert result == "cloudflare"
 
+    def test_header_hints(self):
+        detector = StackDetector()
+
+        assert detector._detect_cdn("", {"X-Served-By": "cache-lhr7332-LHR"}) == "fastly"
+        assert detector._detect_cdn("", {"X-Served-By": "web-1"}) is None
+        assert detector._detect_cdn("", {"Via": "1.1 abc.cloudfront.net (CloudFront)"}) == "cloudfront"
+        assert detector._detect_cdn("", {"Server": "AkamaiGHost"}) == "akamai"
+        assert detector._detect_cdn("", {"Server": "nginx", "x-amz-cf-id": "x"}) == "cloudfront"
+
+    def test_headers_take_precedence_over_html(self):
+        detector = StackDetector()
+        html = '<script src="https://cdn.jsdelivr.net/npm/x.js"></script>'
+
+        assert detector._detect_cdn(html, {"cf-ray": "abc"}) == "cloudflare"
+        assert detector._detect_cdn(html, {"server": "nginx"}) == "jsdelivr"
+
     def test_no_cdn_detected(self):
         detector = StackDetector()
         html = "<html><body></body></html>"
@@ -237,3 +262,243 @@ class TestFullDetection:
         assert result.cms == "wordpress"
         assert result.framework == "react"
         assert "google_analytics" in result.analytics
+
+
+    def test_detection_window_skips_page_middle(self):
+        detector = StackDetector()
+        filler = "x" * (StackDetector.DETECTION_WINDOW_HEAD + StackDetector.DETECTION_WINDOW_TAIL)
+        html = "<script>fbq('init')</script>" + filler + '<script src="//cdn.shopify.com/s.js"></script>' + filler + "Magento_Theme"
+        snapshot = SnapshotData(url="https://example.com", pages=[PageSnapshot(url="https://example.com", html_content=html)])
+
+        for result in (detector.detect(snapshot), detector.detect_from_html(html)):
+            # Shopify sorts before Magento, so it would win if the middle were scanned
+            assert result.cms == "magento"
+            assert result.analytics == ["facebook_pixel"]
+
+
+
+class TestDetectionCache:
+    HTML = '<link href="/wp-content/a.css"><script>fbq("init")</script>'
+
+    def test_repeat_detection_served_from_cache(self, monkeypatch):
+        detector = StackDetector()
+        first = detector.detect_from_html(self.HTML)
+        monkeypatch.setattr(StackDetector, "_scan", lambda self, html: pytest.fail("scanned twice"))
+
+        second = StackDetector().detect_from_html(self.HTML)
+
+        assert second == first
+        second.analytics.append("mutated")
+        assert StackDetector().detect_from_html(self.HTML).analytics == ["facebook_pixel"]
+
+    def test_headers_are_part_of_the_key(self):
+        detector = StackDetector()
+
+        assert detector.detect_from_html(self.HTML).cdn is None
+        assert detector.detect_from_html(self.HTML, {"CF-Ray": "abc"}).cdn == "cloudflare"
+
+    def test_empty_html_skips_scan(self, monkeypatch):
+        monkeypatch.setattr(StackDetector, "_scan", lambda self, html: pytest.fail("scanned"))
+        detector = StackDetector()
+
+        assert detector.detect(SnapshotData(url="https://example.com")) == StackInfo()
+        assert detector.detect_from_html("", {"cf-ray": "abc"}) == StackInfo(cdn="cloudflare")
+        assert len(StackDetector._cache) == 0
+
+    def test_clear_cache_and_eviction(self, monkeypatch):
+        monkeypatch.setattr(StackDetector, "CACHE_SIZE", 2)
+        detector = StackDetector()
+        for html in ("wordpress", "shopify-buy", "drupal.js"):
+            detector.detect_from_html(html)
+
+        assert len(StackDetector._cache) == 2
+        StackDetector.clear_cache()
+        assert len(StackDetector._cache) == 0
+
+
+def reference_first(patterns, html, order=None):
+    """Plain re.search over a pattern table, first technology wins."""
+    for tech in order or patterns:
+        if any(re.search(p, html, re.IGNORECASE) for p in patterns.get(tech, [])):
+            return tech
+    return None
+
+
+def reference_all(patterns, html):
+    """Plain re.search over a pattern table, every matching technology."""
+    return [tech for tech, pats in patterns.items() if any(re.search(p, html, re.IGNORECASE) for p in pats)]
+
+
+CORPUS = [
+    "",
+    "<html><body><h1>Plain</h1></body></html>",
+    '<link href="/wp-content/themes/x/style.css"><div class="woocommerce"></div>',
+    '<script src="https://www.googletagmanager.com/gtm.js?id=GTM-ABC123"></script>',
+    '<script src="https://www.google-analytics.com/analytics.js"></script><script>fbq("init")</script>',
+    '<script id="__NEXT_DATA__">{}</script><div data-reactroot class="flex mt-4"></div>',
+    '<meta name="generator" content="Drupal 10"><script src="/static/version1/mage/cookies.js"></script>Magento_Theme',
+    '<script src="https://cdn.jsdelivr.net/npm/vue.min.js"></script><div data-v-1a2b></div>',
+    '<link href="https://fonts.googleapis.com/css?family=Inter"><script src="https://widget.intercom.io/x"></script>'
+    '<script src="https://www.google.com/recaptcha/api.js"></script>',
+    '<script src="//cdn.shopify.com/s/shopify-buy.js"></script><img src="https://d1.cloudfront.net/a.png">',
+]
+
+
+class TestMatchesReference:
+    """Detection must agree with a plain per-pattern re.search scan."""
+
+    FRAMEWORK_ORDER = ["nextjs", "nuxt", "gatsby", "react", "vue", "angular", "svelte", "jquery", "bootstrap", "tailwind"]
+
+    @pytest.mark.parametrize("html", CORPUS)
+    def test_single_value_categories(self, html):
+        detector = StackDetector()
+
+        assert detector._detect_cms(html) == reference_first(StackDetector.CMS_PATTERNS, html)
+        assert detector._detect_framework(html) == reference_first(
+            StackDetector.FRAMEWORK_PATTERNS, html, self.FRAMEWORK_ORDER
+        )
+        assert detector._detect_cdn(html, {}) == reference_first(StackDetector.CDN_PATTERNS, html)
+        assert detector._detect_ecommerce(html) == reference_first(StackDetector.ECOMMERCE_PATTERNS, html)
+
+    @pytest.mark.parametrize("html", CORPUS)
+    def test_list_categories(self, html):
+        detector = StackDetector()
+
+        assert detector._detect_analytics(html) == reference_all(StackDetector.ANALYTICS_PATTERNS, html)
+        assert detector._detect_tag_managers(html) == reference_all(StackDetector.TAG_MANAGER_PATTERNS, html)
+
+    def test_fused_group_keeps_overlapping_and_grouped_patterns(self):
+        from proofkit.collector.stack_detector import _FusedGroup, _StackScanner
+
+        scanner = _StackScanner({
+            "single": _FusedGroup({"long": [r"abc(def|xyz)"], "short": [r"b.d"]}, single=True),
+            "list": _FusedGroup({"long": [r"abc(def|xyz)"], "short": [r"b.d"]}),
+        })
+
+        assert scanner.scan("xabcdefx") == {"single": "long", "list": ["long", "short"]}
+        assert scanner.scan("xbcdx") == {"single": "short", "list": ["short"]}
+
+    def test_shared_needle_reported_for_every_category(self):
+        from proofkit.collector.stack_detector import _FusedGroup, _StackScanner
+
+        scanner = _StackScanner({
+            "a": _FusedGroup({"x": [r"magento"]}, single=True),
+            "b": _FusedGroup({"y": [r"other"], "z": [r"magento"]}),
+        })
+
+        assert scanner.scan("magento") == {"a": "x", "b": ["z"]}
+
+    @pytest.mark.parametrize("html", CORPUS)
+    def test_other_matches_reference(self, html):
+        assert StackDetector()._detect_other(html) == reference_all(StackDetector.OTHER_PATTERNS, html)
+
+    @pytest.mark.parametrize("html", CORPUS)
+    @pytest.mark.parametrize("ahocorasick_available, re2_available", [(False, False), (True, False), (False, True)])
+    def test_backend_fallbacks(self, html, monkeypatch, ahocorasick_available, re2_available):
+        from proofkit.collector import stack_detector
+
+        if (ahocorasick_available and not stack_detector.AHOCORASICK_AVAILABLE) or (
+            re2_available and not stack_detector.RE2_AVAILABLE
+        ):
+            pytest.skip("optional matcher not installed")
+        monkeypatch.setattr(stack_detector, "AHOCORASICK_AVAILABLE", ahocorasick_available)
+        monkeypatch.setattr(stack_detector, "RE2_AVAILABLE", re2_available)
+        scanner = stack_detector._StackScanner({
+            "cms": stack_detector._FusedGroup(StackDetector.CMS_PATTERNS, single=True),
+            "analytics": stack_detector._FusedGroup(StackDetector.ANALYTICS_PATTERNS),
+        })
+
+        assert (scanner.automaton is not None) == ahocorasick_available
+        assert (scanner.regex_set is not None) == re2_available
+        assert scanner.scan(html.lower()) == {
+            "cms": reference_first(StackDetector.CMS_PATTERNS, html),
+            "analytics": reference_all(StackDetector.ANALYTICS_PATTERNS, html),
+        }
+
+    def test_re2_incompatible_pattern_falls_back_to_re(self):
+        from proofkit.collector.stack_detector import _FusedGroup, _StackScanner
+
+        scanner = _StackScanner({"a": _FusedGroup({"x": [r"foo(?=bar)"], "y": [r"b[a-z]z"]})})
+
+        assert scanner.regex_set is None
+        assert scanner.scan("foobar baz") == {"a": ["x", "y"]}
+
+    def test_literal_classification(self):
+        from proofkit.collector.stack_detector import _literal
+
+        assert _literal(r"cdn\.shopify\.com") == "cdn.shopify.com"
+        assert _literal(r"gtag\(") == "gtag("
+        assert _literal(r'<meta name="generator" content="WordPress') == '<meta name="generator" content="wordpress'
+        assert _literal(r"jquery-\d") is None
+        assert _literal(r"G-[A-Z0-9]+") is None
+
+    def test_lower_pattern_keeps_escapes(self):
+        from proofkit.collector.stack_detector import _lower_pattern
+
+        assert _lower_pattern(r"G-[A-Z0-9]+\D\W") == r"g-[a-z0-9]+\D\W"
+
+    def test_detect_scans_html_once(self):
+        detector = StackDetector()
+        html = '<script src="https://CDN.Shopify.com/x.js"></script>'
+        detector.detect_from_html(html)
+
+        assert detector._scanned[0] is html
+        assert detector._detect_cms(html) == "shopify"
+
+
+class TestConfigure:
+    HTML = (
+        '<link href="/wp-content/a.css"><script id="__NEXT_DATA__">{}</script>'
+        '<script src="https://cdn.jsdelivr.net/npm/x.js"></script><script>fbq("init")</script>'
+    )
+
+    def test_only_configured_categories_detected(self):
+        detector = StackDetector().configure({"cms", "analytics"})
+
+        result = detector.detect_from_html(self.HTML, {"cf-ray": "abc"})
+
+        assert result == StackInfo(cms="wordpress", analytics=["facebook_pixel"])
+
+    def test_scanners_shared_per_category_set(self):
+        first = StackDetector().configure(["cms", "framework"])
+        second = StackDetector().configure({"framework", "cms"})
+
+        assert first._scanner is second._scanner
+        assert set(first._scanner.groups) == {"cms", "framework"}
+        assert StackDetector()._scanner is StackDetector._SCANNER
+
+    def test_results_cached_per_configuration(self):
+        full = StackDetector().detect_from_html(self.HTML)
+        partial = StackDetector().configure({"cms"}).detect_from_html(self.HTML)
+        restored = StackDetector().configure({"cms"}).configure(None).detect_from_html(self.HTML)
+
+        assert full.framework == "nextjs" and full.cdn == "jsdelivr"
+        assert partial == StackInfo(cms="wordpress")
+        assert restored == full
+
+    def test_restoring_all_categories_rescans_same_html(self):
+        StackDetector.clear_cache()
+        detector = StackDetector().configure({"cms"})
+        assert detector.detect_from_html(self.HTML) == StackInfo(cms="wordpress")
+
+        StackDetector.clear_cache()
+        restored = detector.configure(None).detect_from_html(self.HTML)
+
+        assert restored.framework == "nextjs"
+        assert restored == StackDetector().detect_from_html(self.HTML)
+
+    def test_unknown_category_rejected(self):
+        with pytest.raises(ValueError, match="servers"):
+            StackDetector().configure({"cms", "servers"})
+
+    def test_collector_reads_setting(self, monkeypatch):
+        from proofkit.collector import Collector
+        from proofkit.utils.config import reset_config
+
+        monkeypatch.setenv("PROOFKIT_STACK_CATEGORIES", "cms, cdn")
+        reset_config()
+        try:
+            assert Collector().stack_detector.categories == {"cms", "cdn"}
+        finally:
+            monkeypatch.delenv("PROOFKIT_STACK_CATEGORIES")
+            reset_config()
@@ -0,0 +1,164 @@
+"""Tests for the pipeline."""
+
+import pickle
+import threading
+
+from proofkit.core.pipeline import LazyPayload, Pipeline, PipelineStage, memoize_stage
+
+
+class TestParallelGroup:
+    def test_handlers_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def handler(name):
+            def run(data):
+                barrier.wait()
+                return f"{name}:{data}"
+            return run
+
+        pipeline = (
+            Pipeline()
+            .add_parallel_group(PipelineStage.COLLECT, {"a": handler("a"), "b": handler("b")})
+            .add_stage(PipelineStage.ANALYZE, lambda data: sorted(data.values()))
+        )
+
+        results = pipeline.run("url")
+
+        assert pipeline.success
+        assert results[0].data == {"a": "a:url", "b": "b:url"}
+        assert results[1].data == ["a:url", "b:url"]
+
+    def test_failing_handler_fails_stage(self):
+        def boom(data):
+            raise RuntimeError("boom")
+
+        pipeline = Pipeline().add_parallel_group(PipelineStage.COLLECT, {"ok": lambda d: d, "bad": boom})
+        pipeline.add_stage(PipelineStage.ANALYZE, lambda d: d)
+
+        results = pipeline.run(1)
+
+        assert not pipeline.success
+        assert len(results) == 1
+        assert pipeline.last_error == "boom"
+
+
+class TestMemoization:
+    def test_marked_stage_reused_for_same_input(self, tmp_path):
+        calls = []
+
+        @memoize_stage
+        def analyze(data):
+            calls.append(data)
+            return {"score": data["n"] * 2}
+
+        def build(cache_dir):
+            return Pipeline(cache_dir=cache_dir).add_stage(PipelineStage.ANALYZE, analyze)
+
+        assert build(tmp_path).run({"n": 2})[0].data == {"score": 4}
+        assert build(tmp_path).run({"n": 2})[0].data == {"score": 4}
+        assert build(tmp_path).run({"n": 3})[0].data == {"score": 6}
+        assert calls == [{"n": 2}, {"n": 3}]
+
+    def test_unmarked_or_uncached_stages_always_run(self, tmp_path):
+        calls = []
+
+        def narrate(data):
+            calls.append(data)
+            return data
+
+        Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.NARRATE, narrate).run(1)
+        Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.NARRATE, narrate).run(1)
+        Pipeline().add_stage(PipelineStage.NARRATE, memoize_stage(lambda d: calls.append(d))).run(1)
+
+        assert calls == [1, 1, 1]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_cache_entry_is_recomputed(self, tmp_path):
+        stage = memoize_stage(lambda data: data + 1)
+        Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.ANALYZE, stage).run(1)
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"not a pickle")
+
+        assert Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.ANALYZE, stage).run(1)[0].data == 2
+
+
+    def test_concurrent_memoization_writes_unique_temp_files(self, tmp_path, monkeypatch):
+        import tempfile
+
+        temp_names = []
+        real = tempfile.NamedTemporaryFile
+
+        def recording(*args, **kwargs):
+            f = real(*args, **kwargs)
+            temp_names.append(f.name)
+            return f
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", recording)
+        stage = memoize_stage(lambda data: data * 2)
+        threads = [
+            threading.Thread(target=Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.ANALYZE, stage).run, args=(21,))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(temp_names)) == len(temp_names) > 0
+        assert [p.suffix for p in tmp_path.iterdir()] == [".pkl"]
+        assert Pipeline(cache_dir=tmp_path).add_stage(PipelineStage.ANALYZE, stage).run(21)[0].data == 42
+
+class TestDiskHandoff:
+    def test_stage_outputs_handed_off_as_lazy_payloads(self, tmp_path):
+        seen = []
+
+        def collect(url):
+            return {"url": url, "pages": ["a", "b"]}
+
+        def analyze(raw):
+            seen.append(type(raw).__name__)
+            return {"pages": len(raw["pages"]), "has_url": "url" in raw, "keys": sorted(raw)}
+
+        pipeline = (
+            Pipeline(use_disk_handoff=True, scratch_dir=tmp_path)
+            .add_stage(PipelineStage.COLLECT, collect)
+            .add_stage(PipelineStage.ANALYZE, analyze)
+        )
+
+        results = pipeline.run("https://example.com")
+
+        assert seen == ["LazyPayload"]
+        assert isinstance(results[0].data, LazyPayload)
+        assert results[1].data.load() == {"pages": 2, "has_url": True, "keys": ["pages", "url"]}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["00-collect.pkl", "01-analyze.pkl"]
+
+    def test_payload_pickles_as_path(self, tmp_path):
+        payload = LazyPayload.dump(list(range(1000)), tmp_path, "big")
+        payload.load()
+
+        restored = pickle.loads(pickle.dumps(payload))
+
+        assert len(pickle.dumps(payload)) < 500
+        assert restored.load() == list(range(1000))
+
+    def test_generated_scratch_dir_owned_per_run(self):
+        pipeline = Pipeline(use_disk_handoff=True).add_stage(PipelineStage.COLLECT, lambda url: {"url": url})
+
+        with pipeline:
+            first = pipeline.run("https://a.example")[0].data
+            second = pipeline.run("https://b.example")[0].data
+
+            assert pipeline.scratch_dir is None
+            assert first.path.parent != second.path.parent
+            assert first.load() == {"url": "https://a.example"}
+
+        assert not first.path.parent.exists()
+        assert not second.path.parent.exists()
+
+    def test_cleanup_keeps_given_scratch_dir(self, tmp_path):
+        pipeline = Pipeline(use_disk_handoff=True, scratch_dir=tmp_path)
+        pipeline.add_stage(PipelineStage.COLLECT, lambda url: url).run("https://example.com")
+
+        pipeline.cleanup()
+
+        assert (tmp_path / "00-collect.pkl").exists()
@@ -0,0 +1,299 @@
+"""Tests for the audit runner."""
+
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from proofkit import __version__
+from proofkit.core.runner import AuditRunner
+from proofkit.schemas.audit import AuditConfig, AuditStatus
+from proofkit.schemas.finding import Evidence, Finding
+from proofkit.schemas.report import Report, ReportMeta, ReportNarrative
+
+
+def make_finding(id="UX-CTA-001", category="UX", severity="P1", **kwargs):
+    return Finding(
+        id=id,
+        category=category,
+        severity=severity,
+        title="Missing CTA",
+        summary="No primary call to action above the fold",
+        impact="Fewer conversions",
+        recommendation="Add a primary CTA",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def runner(tmp_path):
+    return AuditRunner(AuditConfig(url="https://example.com", output_dir=tmp_path))
+
+
+@pytest.fixture
+def report(runner):
+    meta = ReportMeta(
+        audit_id=runner.run_id,
+        url="https://example.com",
+        generated_at=datetime(2024, 1, 1),
+        proofkit_version=__version__,
+        mode="fast",
+    )
+    findings = [
+        make_finding(evidence=[Evidence(url="https://example.com", note="café")]),
+        make_finding(id="SEO-META-001", category="SEO", severity="P2"),
+    ]
+    return Report(
+        meta=meta,
+        overall_score=80,
+        findings=findings,
+        narrative=ReportNarrative(executive_summary="Summary", quick_wins=["Add a CTA"]),
+    )
+
+
+class TestSaveOutputs:
+    def test_findings_json(self, runner, report):
+        runner._save_outputs(report)
+
+        data = json.loads((runner.output_dir / "out" / "findings.json").read_bytes())
+        assert data == [f.model_dump(mode="json") for f in report.findings]
+        assert data[0]["evidence"][0]["note"] == "café"
+
+    def test_findings_json_empty(self, runner, report):
+        runner._save_outputs(report.model_copy(update={"findings": []}))
+
+        assert json.loads((runner.output_dir / "out" / "findings.json").read_bytes()) == []
+
+    def test_report_json_round_trips(self, runner, report):
+        runner._save_outputs(report)
+
+        saved = Report.model_validate_json((runner.output_dir / "out" / "report.json").read_bytes())
+        assert saved == report
+
+    def test_export_failure_does_not_block_report(self, runner, report, monkeypatch):
+        def boom(report, output_dir):
+            raise RuntimeError("export failed")
+
+        monkeypatch.setattr("proofkit.report_builder.pencil_export.generate_pencil_report", boom)
+        runner._save_outputs(report)
+
+        out_dir = runner.output_dir / "out"
+        assert (out_dir / "report.json").exists()
+        assert (out_dir / "narrative.md").exists()
+        assert (runner.output_dir / "figma").exists()
+
+    def test_report_write_failure_raises(self, runner, report, monkeypatch):
+        def boom(report, out_dir):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(runner, "_save_report_files", boom)
+        with pytest.raises(OSError):
+            runner._save_outputs(report)
+
+
+class TestScorecard:
+    def test_deductions_per_category_and_severity(self, runner):
+        findings = [
+            make_finding(),
+            make_finding(id="UX-2"),
+            make_finding(id="SEO-1", category="SEO", severity="P0"),
+            make_finding(id="CONTENT-1", category="CONTENT", severity="P0"),
+        ]
+
+        scorecard = runner._calculate_scorecard(findings)
+
+        assert scorecard["UX"] == 70
+        assert scorecard["SEO"] == 75
+        assert scorecard["PERFORMANCE"] == 100
+        assert "CONTENT" not in scorecard
+
+    def test_scores_floor_at_zero(self, runner):
+        findings = [make_finding(id=f"UX-{i}", severity="P0") for i in range(5)]
+
+        assert runner._calculate_scorecard(findings)["UX"] == 0
+
+    def test_enum_members_stored_as_strings(self, runner):
+        from proofkit.schemas.finding import Category, Severity
+
+        finding = make_finding(category=Category.SECURITY, severity=Severity.P3)
+
+        assert type(finding.category) is str and type(finding.severity) is str
+        assert runner._calculate_scorecard([finding])["SECURITY"] == 97
+
+
+class TestOverallScore:
+    def test_weighted_average(self, runner):
+        scorecard = {"PERFORMANCE": 80, "SEO": 60, "CONVERSION": 100, "UX": 100, "SECURITY": 100, "MAINTENANCE": 100}
+
+        assert runner._calculate_overall_score(scorecard) == 87
+
+    def test_unweighted_categories_ignored(self, runner):
+        assert runner._calculate_overall_score({"SEO": 50, "ACCESSIBILITY": 0}) == 50
+
+    def test_no_weighted_categories(self, runner):
+        assert runner._calculate_overall_score({"ACCESSIBILITY": 10}) == 100
+
+
+class TestRunAsync:
+    def test_phases_run_and_progress_reported(self, runner, monkeypatch):
+        async def collect(progress_callback):
+            progress_callback(0.5)
+            progress_callback(1.0)
+            return SimpleNamespace(pages_audited=["https://example.com"])
+
+        monkeypatch.setattr(runner, "_run_collectors", collect)
+        monkeypatch.setattr(runner, "_run_analyzer", lambda raw_data: [make_finding()])
+        monkeypatch.setattr(runner, "_run_narrator", lambda findings: ReportNarrative())
+        progress = []
+
+        result = asyncio.run(runner.run_async(progress.append))
+
+        assert result.status == AuditStatus.COMPLETE
+        assert result.finding_count == 1
+        assert progress == [5, 22, 40, 40, 70, 90, 100]
+        assert (runner.output_dir / "out" / "report.json").exists()
+        assert set(runner.phase_durations) == {"collect", "analyze", "narrate", "report"}
+
+    def test_progress_callback_optional(self, runner, monkeypatch):
+        async def collect(progress_callback):
+            progress_callback(1.0)
+            return SimpleNamespace(pages_audited=[])
+
+        monkeypatch.setattr(runner, "_run_collectors", collect)
+        monkeypatch.setattr(runner, "_run_analyzer", lambda raw_data: [])
+        monkeypatch.setattr(runner, "_run_narrator", lambda findings: ReportNarrative())
+
+        assert asyncio.run(runner.run_async()).status == AuditStatus.COMPLETE
+
+    def test_sync_run_wraps_run_async(self, runner, monkeypatch):
+        async def collect(progress_callback):
+            raise RuntimeError("collection exploded")
+
+        monkeypatch.setattr(runner, "_run_collectors", collect)
+
+        with pytest.raises(RuntimeError, match="collection exploded"):
+            runner.run()
+
+
+class FakeNarrator:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        FakeNarrator.instances.append(self)
+
+    def generate(self, findings, **kwargs):
+        return ReportNarrative(executive_summary=f"Summary of {len(findings)}")
+
+
+class TestRunNarrator:
+    @pytest.fixture(autouse=True)
+    def narrator(self, monkeypatch):
+        FakeNarrator.instances = []
+        monkeypatch.setattr("proofkit.narrator.Narrator", FakeNarrator)
+
+    def test_section_cache_under_run_output_base(self, runner):
+        narrative = runner._run_narrator([make_finding()])
+
+        assert narrative.executive_summary == "Summary of 1"
+        assert FakeNarrator.instances[0].kwargs == {
+            "cache_ttl": None,
+            "cache_dir": runner.config.output_dir / ".cache" / "narrator",
+        }
+
+    def test_cache_disabled_by_audit_config(self, tmp_path):
+        runner = AuditRunner(AuditConfig(url="https://example.com", output_dir=tmp_path, narrative_cache=False))
+
+        runner._run_narrator([make_finding()])
+
+        assert FakeNarrator.instances[0].kwargs["cache_ttl"] == 0
+
+    def test_failure_returns_empty_narrative(self, runner, monkeypatch):
+        def broken(self, findings, **kwargs):
+            raise RuntimeError("no API key")
+
+        monkeypatch.setattr(FakeNarrator, "generate", broken)
+
+        assert runner._run_narrator([make_finding()]) == ReportNarrative()
+
+
+class TestBuildReport:
+    def test_analyzer_overall_score_used_as_is(self, runner, monkeypatch):
+        runner._analyzer_scores = {"SEO": 50, "UX": 90, "OVERALL": 77}
+        monkeypatch.setattr(runner, "_calculate_overall_score", pytest.fail)
+
+        report = runner._build_report(SimpleNamespace(pages_audited=[]), [], ReportNarrative())
+
+        assert report.overall_score == 77
+        assert report.scorecard == {"SEO": 50, "UX": 90}
+        assert runner._analyzer_scores["OVERALL"] == 77
+
+    def test_overall_score_derived_when_analyzer_omits_it(self, runner):
+        runner._analyzer_scores = {"SEO": 50}
+
+        report = runner._build_report(SimpleNamespace(pages_audited=[]), [], ReportNarrative())
+
+        assert report.overall_score == 50
+
+
+class TestNarrative:
+    def test_markdown_layout(self, runner, report):
+        report.narrative = ReportNarrative(
+            executive_summary="Summary",
+            quick_wins=["Add a CTA", "Compress images"],
+            strategic_priorities=["Rebuild checkout"],
+            lovable_concept="Hero with one CTA",
+        )
+
+        runner._save_outputs(report)
+
+        assert (runner.output_dir / "out" / "narrative.md").read_text(encoding="utf-8") == (
+            "# Audit Report: https://example.com\n\n"
+            "## Executive Summary\n\nSummary\n\n"
+            "## Quick Wins\n\n- Add a CTA\n- Compress images\n\n"
+            "## Strategic Priorities\n\n- Rebuild checkout\n\n"
+            "## Lovable Redesign Concept\n\n```\nHero with one CTA\n```\n"
+        )
+
+    def test_no_summary_no_file(self, runner, report):
+        report.narrative = ReportNarrative()
+
+        runner._save_outputs(report)
+
+        assert not (runner.output_dir / "out" / "narrative.md").exists()
+
+
+class TestRunId:
+    def test_run_id_derived_from_aware_start_time(self, runner):
+        assert runner.started_at.tzinfo is not None
+        assert runner.run_id == f"run_{runner.started_at.strftime('%Y%m%d_%H%M%S')}"
+        assert runner.output_dir.name == runner.run_id
+
+
+class TestTiming:
+    def test_now_is_derived_from_start_time(self, runner):
+        now = runner._now()
+
+        assert now.tzinfo is not None
+        assert now >= runner.started_at
+
+    def test_end_phase_records_duration(self, runner):
+        next_start = runner._end_phase("collect", runner._t0)
+
+        assert runner.phase_durations["collect"] >= 0
+        assert next_start >= runner._t0
+
+
+def test_import_does_not_load_pipeline_stages():
+    code = (
+        "import sys, proofkit.core.runner; "
+        "print([m for m in ('proofkit.collector', 'proofkit.narrator', 'proofkit.analyzer.engine', "
+        "'proofkit.report_builder.pencil_export', 'playwright') if m in sys.modules])"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.strip() == "[]"
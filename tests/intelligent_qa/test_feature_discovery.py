@@ -0,0 +1,387 @@
+"""Tests for feature discovery."""
+
+import asyncio
+
+import pytest
+
+from proofkit.intelligent_qa import feature_discovery
+from proofkit.intelligent_qa.feature_discovery import (
+    SELECTOLAX_AVAILABLE,
+    DiscoveredFeature,
+    FeatureDiscovery,
+    FeatureType,
+)
+from proofkit.utils.config import reset_config
+
+
+class FakeElement:
+    def __init__(self, tag, text="", id="", cls="", href=None, location="main", y=10):
+        self.tag = tag
+        self.text = text
+        self.id = id
+        self.cls = cls
+        self.href = href
+        self.location = location
+        self.y = y
+
+    def describe(self):
+        """What DISCOVER_JS reports for this element."""
+        return {
+            "tag": self.tag,
+            "class": self.cls,
+            "id": self.id,
+            "href": self.href or "",
+            "text": self.text.strip()[:100],
+            "in_header": self.location == "header",
+            "in_footer": self.location == "footer",
+            "in_nav": self.location == "nav",
+            "in_sidebar": self.location == "aside",
+            "y": self.y,
+        }
+
+
+class FakePage:
+    """Answers DISCOVER_JS from a selector -> elements table."""
+
+    url = "https://example.com"
+
+    def __init__(self, elements_by_selector, fail=False):
+        self.elements_by_selector = elements_by_selector
+        self.fail = fail
+        self.evaluate_calls = 0
+        self.navigation = []
+
+    async def goto(self, url, wait_until=None):
+        self.navigation.append(("goto", wait_until))
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.navigation.append(("wait_for_load_state", state))
+        raise TimeoutError("page never finished loading")
+
+    def _match(self, query):
+        # Like the selector union, each element is reported once per query
+        union, selectors = query
+        matched = {}
+        for selector in selectors:
+            if selector != "broken[":
+                for el in self.elements_by_selector.get(selector, []):
+                    matched.setdefault(id(el), el)
+        return [el.describe() for el in matched.values()]
+
+    async def evaluate(self, js, arg):
+        self.evaluate_calls += 1
+        if self.fail:
+            raise RuntimeError("page crashed")
+        return {
+            "viewport_height": 800,
+            "patterns": [[t, self._match(query)] for t, query in arg["patterns"]],
+            "buttons": self._match(arg["buttons"]),
+            "links": self._match(["a[href]", ["a[href]"]]),
+        }
+
+
+def discover(page):
+    return asyncio.run(FeatureDiscovery(page).discover_all())
+
+
+class TestDiscoverAll:
+    def test_features_in_pattern_then_button_then_link_order(self):
+        whatsapp = FakeElement("a", "Chat", href="https://wa.me/1", location="header")
+        form = FakeElement("form", id="contact", location="footer")
+        page = FakePage({
+            "a[href*='wa.me']": [whatsapp],
+            "form": [form],
+            "button": [FakeElement("button", " Buy now ", cls="btn primary")],
+            "a[href]": [whatsapp, FakeElement("a", "Home", href="/"), FakeElement("a", "Top", href="#top")],
+        })
+
+        features = discover(page)
+
+        assert [(f.id, f.type, f.element) for f in features] == [
+            ("feat_0001", FeatureType.WHATSAPP, "a"),
+            ("feat_0002", FeatureType.FORM, "form#contact"),
+            ("feat_0003", FeatureType.BUTTON, "button.btn"),
+            ("feat_0004", FeatureType.LINK, "a"),
+            ("feat_0005", FeatureType.LINK, "a"),
+        ]
+        assert [f.location for f in features[:3]] == ["Header", "Footer", "Above the fold"]
+        assert features[2].text == "Buy now"
+        assert features[2].expected_behavior == "Should perform action: Buy now"
+
+    def test_buttons_and_links_skip_ids_already_found(self):
+        form_button = FakeElement("button", "Send", id="send")
+        page = FakePage({
+            "form": [FakeElement("form", id="send")],
+            "button": [form_button],
+            "a[href]": [FakeElement("a", "Send", id="send", href="/send")],
+        })
+
+        features = discover(page)
+
+        assert [f.type for f in features] == [FeatureType.FORM]
+
+    def test_pattern_types_sharing_an_id_are_all_kept(self):
+        widget = FakeElement("div", id="wa-chat", cls="whatsapp chat")
+        page = FakePage({"[class*='whatsapp']": [widget], "[class*='chat']": [widget]})
+
+        assert [f.type for f in discover(page)] == [FeatureType.WHATSAPP, FeatureType.CHAT]
+
+    def test_failing_selector_is_skipped(self, monkeypatch):
+        monkeypatch.setattr(
+            FeatureDiscovery, "_PATTERN_QUERIES", [["form", ["broken[, form", ["broken[", "form"]]]]
+        )
+        page = FakePage({"form": [FakeElement("form")]})
+
+        assert [f.type for f in discover(page)] == [FeatureType.FORM]
+
+    def test_element_matching_several_selectors_found_once(self):
+        nav = FakeElement("nav", location="nav")
+        page = FakePage({"nav": [nav], "header nav": [nav], "[role='navigation']": [nav]})
+
+        assert [f.type for f in discover(page)] == [FeatureType.NAVIGATION]
+
+    def test_queries_are_prebuilt_selector_unions(self):
+        queries = dict(FeatureDiscovery._PATTERN_QUERIES)
+
+        assert queries["form"] == ["form, [role='form']", ["form", "[role='form']"]]
+        assert FeatureDiscovery._BUTTON_QUERY[0].startswith("button, [role='button']")
+
+    def test_single_browser_call(self):
+        page = FakePage({
+            "nav": [FakeElement("nav", location="nav")],
+            ".navbar": [FakeElement("div", cls="navbar", location="nav", y=None)],
+            "a[href]": [FakeElement("a", href="/a", y=900), FakeElement("a", href="/b", location="aside")],
+        })
+
+        features = discover(page)
+
+        assert page.evaluate_calls == 1
+        assert [f.location for f in features] == ["Navigation", "Navigation", "Below the fold", "Sidebar"]
+
+    def test_hidden_element_is_main_content(self):
+        page = FakePage({"form": [FakeElement("form", y=None)]})
+
+        assert discover(page)[0].location == "Main content"
+
+    def test_failed_discovery_returns_no_features(self):
+        page = FakePage({"form": [FakeElement("form")]}, fail=True)
+
+        assert discover(page) == []
+
+    def test_requires_page(self):
+        with pytest.raises(ValueError):
+            asyncio.run(FeatureDiscovery().discover_all())
+
+
+def make_feature(type, text=""):
+    return DiscoveredFeature(
+        id="feat_0001", type=type, element="div", location="Main content", text=text, expected_behavior=""
+    )
+
+
+class TestNavigation:
+    def test_default_waits_for_dom_then_briefly_for_load(self, monkeypatch):
+        monkeypatch.delenv("PROOFKIT_PLAYWRIGHT_WAIT_UNTIL", raising=False)
+        reset_config()
+        page = FakePage({"form": [FakeElement("form")]})
+
+        features = asyncio.run(FeatureDiscovery(page).discover_all("https://example.com"))
+
+        assert page.navigation == [("goto", "domcontentloaded"), ("wait_for_load_state", "load")]
+        assert [f.type for f in features] == [FeatureType.FORM]
+
+    def test_networkidle_is_opt_in(self):
+        page = FakePage({})
+
+        asyncio.run(FeatureDiscovery(page, wait_until="networkidle").discover_all("https://example.com"))
+
+        assert page.navigation == [("goto", "networkidle")]
+
+
+STATIC_HTML = """<html><body>
+<header><a href="https://wa.me/1">Chat</a></header>
+<nav class="navbar"><a href="/">Home</a><a href="#top">Top</a></nav>
+<form id="contact"><button id="contact">Send</button></form>
+<footer><a href="/terms">Terms</a></footer>
+</body></html>"""
+
+
+@pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+class TestDiscoverStatic:
+    def test_same_features_as_browser_discovery(self):
+        features = FeatureDiscovery().discover_static(STATIC_HTML)
+
+        assert [(f.type, f.element, f.location) for f in features] == [
+            (FeatureType.WHATSAPP, "a", "Header"),
+            (FeatureType.FORM, "form#contact", "Main content"),
+            (FeatureType.NAVIGATION, "nav.navbar", "Navigation"),
+            (FeatureType.LINK, "a", "Header"),
+            (FeatureType.LINK, "a", "Navigation"),
+            (FeatureType.LINK, "a", "Footer"),
+        ]
+        assert features[0].text == "Chat"
+        assert features[0].test_cases
+
+    def test_invalid_selector_is_skipped(self, monkeypatch):
+        monkeypatch.setattr(
+            FeatureDiscovery, "_PATTERN_QUERIES", [["form", ["broken[, form", ["broken[", "form"]]]]
+        )
+
+        features = FeatureDiscovery().discover_static(STATIC_HTML)
+
+        assert [f.type for f in features][:1] == [FeatureType.FORM]
+
+    @pytest.mark.parametrize(
+        "html, expected",
+        [
+            (STATIC_HTML, False),
+            ('<html><body><div id="root"></div><script src="/app.js"></script></body></html>', True),
+            ("<html><body>  </body></html>", True),
+        ],
+    )
+    def test_needs_browser(self, html, expected):
+        assert FeatureDiscovery.needs_browser(html) is expected
+
+    def test_discover_features_skips_browser_for_static_pages(self, monkeypatch):
+        async def fetch(url):
+            return STATIC_HTML
+
+        def no_browser():
+            raise AssertionError("browser launched")
+
+        monkeypatch.setattr(feature_discovery, "_fetch_html", fetch)
+        monkeypatch.setattr(feature_discovery, "async_playwright", no_browser)
+
+        features = asyncio.run(feature_discovery.discover_features("https://example.com"))
+
+        assert len(features) == 6
+
+
+class TestBehaviorsAndTestCases:
+    def test_button_behavior_uses_text(self):
+        discovery = FeatureDiscovery()
+
+        assert discovery._infer_behavior(make_feature(FeatureType.BUTTON, "Buy")) == "Should perform action: Buy"
+        assert discovery._infer_behavior(make_feature(FeatureType.BUTTON)) == "Should perform action: click action"
+        assert discovery._infer_behavior(make_feature(FeatureType.MAP)) == "Should display interactive map"
+
+    def test_unlisted_type_gets_default_cases(self):
+        cases = FeatureDiscovery()._generate_test_cases(make_feature(FeatureType.MAP))
+
+        assert [c["name"] for c in cases] == ["Element visible", "Interaction works"]
+
+    def test_cases_are_independent_copies(self):
+        discovery = FeatureDiscovery()
+        first = discovery._generate_test_cases(make_feature(FeatureType.FORM))
+        first[0]["expected"] = "changed"
+        first.append({})
+
+        second = discovery._generate_test_cases(make_feature(FeatureType.FORM))
+        assert len(second) == 3
+        assert second[0]["expected"] == "Shows validation error"
+
+
+class TestSummary:
+    def test_counts_by_type_location_and_test_cases(self):
+        page = FakePage({
+            "form": [FakeElement("form", location="footer")],
+            "button": [FakeElement("button", "Go"), FakeElement("button", "Stop", location="header")],
+        })
+        discovery = FeatureDiscovery(page)
+        asyncio.run(discovery.discover_all())
+
+        assert discovery.get_summary() == {
+            "total_features": 3,
+            "by_type": {"form": 1, "button": 2},
+            "by_location": {"Footer": 1, "Above the fold": 1, "Header": 1},
+            "test_cases_generated": 9,
+        }
+
+    def test_empty(self):
+        assert FeatureDiscovery().get_summary() == {
+            "total_features": 0,
+            "by_type": {},
+            "by_location": {},
+            "test_cases_generated": 0,
+        }
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def new_page(self):
+        return FakePage({"form": [FakeElement("form")]})
+
+    async def close(self):
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.open_contexts = 0
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self):
+        self.open_contexts += 1
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+    async def stop(self):
+        self.stopped = True
+
+
+class TestBrowserPool:
+    @pytest.fixture
+    def playwright(self, monkeypatch):
+        fake = FakePlaywright()
+        monkeypatch.setattr(feature_discovery, "SELECTOLAX_AVAILABLE", False)
+        monkeypatch.setattr(feature_discovery, "async_playwright", lambda: fake)
+        return fake
+
+    def test_browser_shared_across_calls_and_closed_on_shutdown(self, playwright):
+        async def run():
+            first = await feature_discovery.discover_features("https://example.com/a")
+            second, third = await asyncio.gather(
+                feature_discovery.discover_features("https://example.com/b"),
+                feature_discovery.discover_features("https://example.com/c"),
+            )
+            await feature_discovery.shutdown_browser_pool()
+            return first, second, third
+
+        results = asyncio.run(run())
+
+        assert [[f.type for f in r] for r in results] == [[FeatureType.FORM]] * 3
+        assert len(playwright.browsers) == 1
+        assert playwright.browsers[0].open_contexts == 0
+        assert playwright.browsers[0].closed and playwright.stopped
+
+    def test_disconnected_browser_is_relaunched(self, playwright):
+        async def run():
+            await feature_discovery.discover_features("https://example.com/a")
+            playwright.browsers[0].closed = True
+            await feature_discovery.discover_features("https://example.com/b")
+            await feature_discovery.shutdown_browser_pool()
+
+        asyncio.run(run())
+
+        assert len(playwright.browsers) == 2
@@ -0,0 +1 @@
+"""Tests for the MCP server."""
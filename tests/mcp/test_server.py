@@ -0,0 +1,92 @@
+"""Tests for the MCP tool handlers."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from proofkit import __version__
+from proofkit.collector.models import RawData
+from proofkit.mcp.server import MCP_AVAILABLE, _tools, analyze_data, generate_report
+from proofkit.schemas.finding import Finding
+from proofkit.schemas.report import Report, ReportMeta
+
+
+def write_report(run_dir):
+    report = Report(
+        meta=ReportMeta(
+            audit_id="run_1",
+            url="https://example.com",
+            generated_at=datetime(2024, 1, 1),
+            proofkit_version=__version__,
+            mode="fast",
+        ),
+        overall_score=80,
+        scorecard={"SEO": 75},
+        findings=[
+            Finding(
+                id="SEO-META-001",
+                category="SEO",
+                severity="P1",
+                title="Missing meta description – café",
+                summary="No description",
+                impact="Lower CTR",
+                recommendation="Add one",
+            )
+        ],
+    )
+    out_dir = run_dir / "out"
+    out_dir.mkdir(parents=True)
+    (out_dir / "report.json").write_text(report.model_dump_json(), encoding="utf-8")
+    return report
+
+
+class TestGenerateReport:
+    def test_json_format_returns_saved_report(self, tmp_path):
+        report = write_report(tmp_path)
+
+        result = asyncio.run(generate_report({"run_dir": str(tmp_path), "format": "json"}))
+
+        assert result == report.model_dump(mode="json")
+
+    def test_markdown_format(self, tmp_path):
+        write_report(tmp_path)
+
+        result = asyncio.run(generate_report({"run_dir": str(tmp_path)}))
+
+        assert result["format"] == "markdown"
+        assert "### [P1] Missing meta description – café" in result["content"]
+
+    def test_missing_report(self, tmp_path):
+        result = asyncio.run(generate_report({"run_dir": str(tmp_path)}))
+
+        assert result["error"].startswith("Report not found")
+
+
+class TestAnalyzeData:
+    def test_analyzes_saved_raw_data(self, tmp_path):
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        raw_data = RawData(url="https://example.com", mode="fast")
+        (raw_dir / "raw_data.json").write_text(raw_data.model_dump_json(indent=2))
+
+        result = asyncio.run(analyze_data({"run_dir": str(tmp_path)}))
+
+        assert result["finding_count"] >= len(result["findings"])
+        assert "SEO" in result["scores"]
+
+    def test_missing_raw_data(self, tmp_path):
+        result = asyncio.run(analyze_data({"run_dir": str(tmp_path)}))
+
+        assert result["error"].startswith("Raw data not found")
+
+
+@pytest.mark.skipif(not MCP_AVAILABLE, reason="mcp not installed")
+def test_tool_list_built_once():
+    assert _tools() is _tools()
+    assert [t.name for t in _tools()] == [
+        "proofkit_audit",
+        "proofkit_discover_features",
+        "proofkit_analyze",
+        "proofkit_generate_report",
+    ]
@@ -5,6 +5,16 @@ from unittest.mock import MagicMock, patch
 
 from proofkit.schemas.finding import Finding, Severity, Category, Effort
 from proofkit.schemas.business import BusinessType
+from proofkit.utils.config import reset_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_narrative_cache(tmp_path, monkeypatch):
+    """Keep cached narrative sections out of ./runs and away from other tests."""
+    monkeypatch.setenv("PROOFKIT_OUTPUT_DIR", str(tmp_path))
+    reset_config()
+    yield
+    reset_config()
 
 
 @pytest.fixture
@@ -0,0 +1,136 @@
+"""Tests for the AI client response cache."""
+
+import sys
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from proofkit.narrator.ai_client import AnthropicClient, _ResponseCache
+from proofkit.utils.config import reset_config
+from proofkit.utils.exceptions import AIApiError
+
+
+def make_anthropic_client(monkeypatch):
+    """Anthropic client whose SDK returns a canned completion."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+    reset_config()
+    sdk = MagicMock()
+    response = MagicMock()
+    response.content = [MagicMock(text="Mock AI response")]
+    response.usage.input_tokens = 100
+    response.usage.output_tokens = 50
+    sdk.Anthropic.return_value.messages.create.return_value = response
+
+    with patch.dict(sys.modules, {"anthropic": sdk}):
+        client = AnthropicClient(default_model="claude-3-haiku-20240307")
+    return client, sdk.Anthropic.return_value.messages.create
+
+
+@pytest.fixture
+def anthropic_client(monkeypatch):
+    return make_anthropic_client(monkeypatch)
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used(self):
+        cache = _ResponseCache(ttl=60, maxsize=2)
+        cache.put(("a",), "A")
+        cache.put(("b",), "B")
+        cache.get(("a",))
+        cache.put(("c",), "C")
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == "A"
+        assert cache.stats() == {"cache_hits": 2, "cache_misses": 1}
+
+    def test_entries_expire_after_ttl(self):
+        cache = _ResponseCache(ttl=60)
+        cache.put(("a",), "A")
+
+        with patch("proofkit.narrator.ai_client.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get(("a",)) is None
+
+    def test_zero_ttl_disables(self):
+        cache = _ResponseCache(ttl=0)
+        cache.put(("a",), "A")
+
+        assert cache.get(("a",)) is None
+
+
+class TestClientCaching:
+    def test_identical_request_served_from_cache(self, anthropic_client):
+        client, create = anthropic_client
+
+        first = client.generate("system", "user", max_tokens=100)
+        second = client.generate("system", "user", max_tokens=100)
+
+        assert first == second == "Mock AI response"
+        create.assert_called_once()
+        usage = client.get_total_usage()
+        assert usage["input_tokens"] == 100
+        assert usage["cache_hits"] == 1
+        assert usage["cache_misses"] == 1
+
+    def test_different_request_not_cached(self, anthropic_client):
+        client, create = anthropic_client
+
+        client.generate("system", "user", max_tokens=100)
+        client.generate("system", "user", max_tokens=200)
+        client.generate("system", "other", max_tokens=100)
+
+        assert create.call_count == 3
+
+    def test_failed_request_not_cached(self, anthropic_client):
+        client, create = anthropic_client
+        create.side_effect = [RuntimeError("overloaded"), create.return_value]
+
+        with pytest.raises(AIApiError):
+            client.generate("system", "user")
+
+        assert client.generate("system", "user") == "Mock AI response"
+        assert create.call_count == 2
+
+    def test_zero_ttl_setting_regenerates(self, monkeypatch):
+        monkeypatch.setenv("PROOFKIT_NARRATIVE_CACHE_TTL", "0")
+        client, create = make_anthropic_client(monkeypatch)
+
+        client.generate("system", "user")
+        client.generate("system", "user")
+
+        assert create.call_count == 2
+
+    def test_reset_usage_clears_counters(self, anthropic_client):
+        client, _ = anthropic_client
+        client.generate("system", "user")
+        client.reset_usage()
+
+        assert client.get_total_usage() == {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+        }
+
+
+def test_model_key_names_provider_and_model(anthropic_client):
+    from proofkit.narrator.claude_client import ClaudeClient
+
+    client, _ = anthropic_client
+    with patch("proofkit.narrator.claude_client.get_ai_client", return_value=client):
+        wrapper = ClaudeClient()
+
+    assert wrapper.get_model_key() == "AnthropicClient:claude-3-haiku-20240307"
+
+
+def test_narrator_zero_ttl_regenerates_every_section(anthropic_client, sample_findings):
+    from proofkit.narrator import Narrator
+
+    client, create = anthropic_client
+    with patch("proofkit.narrator.claude_client.get_ai_client", return_value=client):
+        Narrator(cache_ttl=0).generate(sample_findings)
+        first_run = create.call_count
+        Narrator(cache_ttl=0).generate(sample_findings)
+
+    assert first_run > 0
+    assert create.call_count == 2 * first_run
@@ -1,12 +1,14 @@
 """Integration tests for the narrator module."""
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
 from proofkit.narrator import Narrator
 from proofkit.schemas.report import ReportNarrative
 from proofkit.schemas.business import BusinessType
-from proofkit.utils.exceptions import TokenLimitError
+from proofkit.utils.exceptions import AIApiError, TokenLimitError
 
 
 class TestNarrator:
@@ -21,6 +23,7 @@ class TestNarrator:
             # Configure mock client
             mock_client = MagicMock()
             mock_client.get_total_usage.return_value = {"input_tokens": 500, "output_tokens": 300}
+            mock_client.get_model_key.return_value = "AnthropicClient:claude-sonnet-4-20250514"
             MockClient.return_value = mock_client
 
             # Configure mock builder
@@ -157,6 +160,77 @@ class TestNarrator:
         assert "output_tokens" in report
         assert "estimated_cost" in report
 
+    def test_cache_sections_reused_for_same_inputs(self, mock_narrator_deps, sample_findings, tmp_path):
+        first = Narrator().generate(sample_findings, business_type=BusinessType.ECOMMERCE)
+        second = Narrator().generate(sample_findings, business_type=BusinessType.ECOMMERCE)
+
+        assert second == first
+        assert mock_narrator_deps["builder"].generate_executive_summary.call_count == 1
+        assert mock_narrator_deps["builder"].generate_quick_wins.call_count == 1
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_cache_changed_inputs_regenerate(self, mock_narrator_deps, sample_findings):
+        Narrator().generate(sample_findings, business_type=BusinessType.ECOMMERCE)
+        Narrator().generate(sample_findings, business_type=BusinessType.REAL_ESTATE)
+
+        builder = mock_narrator_deps["builder"]
+        assert builder.generate_executive_summary.call_count == 2
+        # Quick wins only depend on the findings summary
+        assert builder.generate_quick_wins.call_count == 1
+
+    def test_cache_keyed_by_client_model(self, mock_narrator_deps, sample_findings):
+        Narrator().generate(sample_findings)
+        mock_narrator_deps["client"].get_model_key.return_value = "OpenAIClient:gpt-4o-mini"
+        Narrator().generate(sample_findings)
+
+        assert mock_narrator_deps["builder"].generate_quick_wins.call_count == 2
+
+    def test_cache_disabled_with_zero_ttl(self, mock_narrator_deps, sample_findings, tmp_path):
+        Narrator(cache_ttl=0).generate(sample_findings)
+        Narrator(cache_ttl=0).generate(sample_findings)
+
+        assert mock_narrator_deps["builder"].generate_quick_wins.call_count == 2
+        assert not (tmp_path / ".cache").exists()
+
+    def test_zero_ttl_regenerates_through_shared_client(self, mock_narrator_deps, sample_findings):
+        client = mock_narrator_deps["client"]
+        Narrator(cache_ttl=0).generate(sample_findings)
+        Narrator(cache_ttl=0).generate(sample_findings)
+
+        # Each run drops the shared client's remembered completions first
+        assert client.clear_response_cache.call_count == 2
+        assert mock_narrator_deps["builder"].generate_quick_wins.call_count == 2
+
+    def test_cache_failed_section_not_cached(self, mock_narrator_deps, sample_findings):
+        builder = mock_narrator_deps["builder"]
+        builder.generate_quick_wins.side_effect = [AIApiError("overloaded"), ["Fix 1"]]
+
+        with pytest.raises(AIApiError):
+            Narrator().generate(sample_findings)
+
+        assert Narrator().generate(sample_findings).quick_wins == ["Fix 1"]
+
+
+    def test_generate_runs_sections_concurrently(self, mock_narrator_deps, sample_findings):
+        # Each section blocks until all three are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+        def after_barrier(result):
+            def generate(*args):
+                barrier.wait()
+                return result
+            return generate
+
+        builder = mock_narrator_deps["builder"]
+        builder.generate_executive_summary.side_effect = after_barrier("Summary")
+        builder.generate_quick_wins.side_effect = after_barrier(["Fix 1"])
+        builder.generate_strategic_priorities.side_effect = after_barrier(["Plan 1"])
+
+        narrative = Narrator(cache_ttl=0).generate(sample_findings)
+
+        assert narrative.executive_summary == "Summary"
+        assert narrative.quick_wins == ["Fix 1"]
+        assert narrative.strategic_priorities == ["Plan 1"]
+
 
 class TestPrepareFindings:
     """Tests for findings preparation - these don't need full mocking."""
@@ -215,6 +289,27 @@ class TestPrepareFindings:
         if p0_pos != -1 and p1_pos != -1:
             assert p0_pos < p1_pos
 
+    def test_prepare_findings_keeps_stable_severity_order(self, sample_findings):
+        """Top findings match a stable sort by severity, ties in input order."""
+        with patch("proofkit.narrator.ClaudeClient"), \
+             patch("proofkit.narrator.NarrativeBuilder"), \
+             patch("proofkit.narrator.ConceptGenerator"), \
+             patch("proofkit.narrator.TokenManager"):
+            narrator = Narrator()
+
+        many_findings = [
+            f.model_copy(update={"title": f"{f.title} #{i}"})
+            for i in range(8)
+            for f in reversed(sample_findings)
+        ]
+        rank = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+        expected = sorted(many_findings, key=lambda f: rank[f.severity])[:15]
+
+        summary = narrator._prepare_findings_summary(many_findings)
+
+        titles = [block.split(": ", 1)[1].split("\n")[0] for block in summary.split("\n\n")]
+        assert titles == [f.title for f in expected]
+
 
 class TestCategoryInsights:
     """Tests for category insights generation."""
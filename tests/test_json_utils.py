@@ -0,0 +1,73 @@
+"""Tests for JSON helpers."""
+
+import json
+
+import pytest
+
+from proofkit.utils import json_utils
+
+
+class TestLoads:
+    def test_loads_bytes(self):
+        assert json_utils.loads(b'{"score": 0.5, "items": [1, 2]}') == {"score": 0.5, "items": [1, 2]}
+
+    def test_loads_str(self):
+        assert json_utils.loads('{"name": "caf\\u00e9"}') == {"name": "café"}
+
+    def test_invalid_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads(b"not json")
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json_utils.loads(b'{"a": 1}') == {"a": 1}
+
+
+class TestDumps:
+    DOC = {"name": "café", "items": [1, {"x": None}], "empty": []}
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_matches_stdlib_layout(self, monkeypatch, orjson_available):
+        if orjson_available and not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", orjson_available)
+
+        assert json_utils.dumps(self.DOC) == json.dumps(self.DOC, ensure_ascii=False, separators=(",", ":")).encode()
+        assert json_utils.dumps(self.DOC, indent=True) == json.dumps(self.DOC, ensure_ascii=False, indent=2).encode()
+
+    def test_unknown_types_use_str(self):
+        from pathlib import Path
+
+        assert json_utils.loads(json_utils.dumps({"path": Path("a/b")})) == {"path": "a/b"}
+
+
+class TestLoadsLazy:
+    def test_field_access(self):
+        doc = json_utils.loads_lazy(b'{"categories": {"performance": {"score": 0.9}}}')
+        assert doc.get("categories", {}).get("performance", {}).get("score") == 0.9
+        assert doc.get("audits", {}).get("missing") is None
+
+    def test_invalid_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads_lazy(b"{not json")
+
+    def test_fallback_without_simdjson(self, monkeypatch):
+        monkeypatch.setattr(json_utils, "SIMDJSON_AVAILABLE", False)
+        assert json_utils.loads_lazy(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+class TestGetPointer:
+    DOC = b'{"audits": {"a/b": {"numericValue": 12.5}, "list": [1, {"x": null}]}}'
+
+    @pytest.mark.parametrize("simdjson_available", [True, False])
+    def test_lookup(self, monkeypatch, simdjson_available):
+        if simdjson_available and not json_utils.SIMDJSON_AVAILABLE:
+            pytest.skip("pysimdjson not installed")
+        monkeypatch.setattr(json_utils, "SIMDJSON_AVAILABLE", simdjson_available)
+        doc = json_utils.loads_lazy(self.DOC)
+
+        assert json_utils.get_pointer(doc, "/audits/a~1b/numericValue") == 12.5
+        assert json_utils.get_pointer(doc, "/audits/list/1/x", "missing") is None
+        assert json_utils.get_pointer(doc, "/audits/list/5") is None
+        assert json_utils.get_pointer(doc, "/audits/nope/numericValue", 0) == 0
+        assert json_utils.get_pointer(doc, "/audits/list/x") is None